@@ -35,8 +35,8 @@ def main():
     scene.add(camera)
     camera.position[2] = 5.0
 
-    # Create an animation loop
-    animation_loop = AnimationLoop(renderer)
+    # Create an animation loop - it re-renders only the changed objects, and blitting redraws only their artists on screen
+    animation_loop = AnimationLoop(renderer, blitting=True)
 
     # =============================================================================
     # animation callback with .add_callback()
@@ -6,6 +6,7 @@ from typing import Protocol
 import time
 import matplotlib.animation
 import matplotlib.artist
+import matplotlib.backend_bases
 import matplotlib.pyplot
 
 # local imports
@@ -15,13 +16,18 @@ from mpl_graph.objects import Scene
 from mpl_graph.core.event import Event
 from mpl_graph.cameras.camera import Camera
 from mpl_graph.renderers.renderer import Renderer
+from mpl_graph.renderers.renderer_blitter import RendererBlitter
 
 # do a callback type for the animation loop
-AnimationLoopCallbackType = Callable[[float], Sequence[Object3D]]
+AnimationLoopCallbackType = Callable[[float], Sequence[Object3D] | None]
 """A simple animation loop manager for matplotlib rendering.
 
 Arguments:
     delta_time (float): Time elapsed since the last frame in milliseconds.
+
+Returns:
+    Sequence[Object3D] | None: optional, the objects it changed. They are rendered again even if it edited their arrays
+        in place, which the renderer can not detect - see `Renderer.render(changed_objects=...)`.
 """
 
 
@@ -30,30 +36,62 @@ class VideoSavedCalledback(Protocol):
 
 
 class AnimationLoop:
-    __slots__ = ("_callbacks", "_renderer", "_fps", "_video_duration", "_video_path", "_time_last_update", "_scene", "_camera", "video_saved", "_funcAnimation")
-
-    def __init__(self, renderer: Renderer, fps: int = 30, video_duration: float = 10.0, video_path: str | None = None) -> None:
+    __slots__ = (
+        "_callbacks",
+        "_renderer",
+        "_fps",
+        "_video_duration",
+        "_video_path",
+        "_blitting",
+        "_only_changed",
+        "_time_last_update",
+        "_scene",
+        "_camera",
+        "video_saved",
+        "_funcAnimation",
+        "_blitter",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        renderer: Renderer,
+        fps: int = 30,
+        video_duration: float = 10.0,
+        video_path: str | None = None,
+        blitting: bool = False,
+        only_changed: bool = True,
+    ) -> None:
         """
         A simple animation loop manager for matplotlib rendering.
         - it is able to save a video if needed
         - it calls registered callbacks to update the scene
-        - it re-renders only the changed objects
+        - it re-renders only the changed objects, detected automatically - see `Renderer.render(only_changed=True)`
+        - it can redraw only their artists, with blitting - see `RendererBlitter`
 
         Arguments:
             renderer (Renderer): The renderer to use for rendering the scene.
             fps (int): The target frames per second for the animation loop.
             video_duration (float): The duration of the video to save in seconds.
             video_path (str | None): The path to save the video. If None, no video is saved.
+            blitting (bool): Whether to redraw only the changed artists on screen, instead of the whole figure. Not used to save the video.
+            only_changed (bool): Whether to re-render only the objects whose transform, geometry, material or texture version changed,
+                plus the ones returned by the callbacks. The callbacks editing arrays in place must return the objects, or call `.mark_dirty()`.
+                False re-renders the whole scene at each frame.
         """
         self._callbacks: list[AnimationLoopCallbackType] = []
         self._renderer = renderer
         self._fps = fps
         self._video_duration = video_duration
         self._video_path = video_path
+        self._blitting = blitting
+        self._only_changed = only_changed
         self._time_last_update = None
-        self._scene: Object3D | None = None
+        self._scene: Scene | None = None
         self._camera: Camera | None = None
         self._funcAnimation: matplotlib.animation.FuncAnimation | None = None
+        self._blitter: RendererBlitter | None = None
+        self._timer: matplotlib.backend_bases.TimerBase | None = None
 
         self.video_saved = Event[VideoSavedCalledback]()
         """Event triggered when the video is saved."""
@@ -76,6 +114,15 @@ class AnimationLoop:
         if ExamplesUtils.postamble():
             return
 
+        # blit the changed artists from a timer - FuncAnimation would redraw the whole figure after each frame
+        if self._blitting and self._video_path is None:
+            self._blitter = RendererBlitter(self._renderer)
+            self._timer = self._renderer.get_figure().canvas.new_timer(interval=int(1000 / self._fps))
+            self._timer.add_callback(self._blit_update_scene)
+            self._timer.start()
+            matplotlib.pyplot.show(block=True)
+            return
+
         self._funcAnimation = matplotlib.animation.FuncAnimation(
             self._renderer.get_figure(), self._mpl_update_scene, frames=int(self._video_duration * self._fps), interval=1000 / self._fps
         )
@@ -96,6 +143,14 @@ class AnimationLoop:
             self._funcAnimation.event_source.stop()
             self._funcAnimation = None
 
+        # stop the blitting timer, and make the artists drawable by a full draw again
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._blitter is not None:
+            self._blitter.close()
+            self._blitter = None
+
     # =============================================================================
     # .add_callback/.remove_callback/.decorator
     # =============================================================================
@@ -114,7 +169,7 @@ class AnimationLoop:
         Usage:
             ```python
                 @animation_loop.decorator
-                def my_callback(delta_time: float) -> Sequence[Object3D]:
+                def my_callback(delta_time: float) -> None:
                     ...
 
                 # later, if needed
@@ -124,7 +179,7 @@ class AnimationLoop:
 
         self.add_callback(func)
 
-        def wrapper(delta_time: float) -> Sequence[Object3D]:
+        def wrapper(delta_time: float) -> Sequence[Object3D] | None:
             # print("Before the function runs")
             result = func(delta_time)
             # print("After the function runs")
@@ -147,17 +202,18 @@ class AnimationLoop:
         changed_objects: list[Object3D] = []
         for callback in self._callbacks:
             _changed_objects = callback(delta_time)
-            changed_objects.extend(_changed_objects)
-
-        # update world matrices
-        self._scene.update_world_matrix()
+            if _changed_objects is not None:
+                changed_objects.extend(_changed_objects)
 
-        # render only the changed objects
-        changed_artists: list[matplotlib.artist.Artist] = []
-        for object in changed_objects:
-            # needed to update the attributes of the object3D, like position, rotation, scale, etc.
-            _changed_artists = self._renderer.render_object(object, self._camera)
-            changed_artists.extend(_changed_artists)
+        # render the scene - if only_changed, the renderer detects the changed objects from their versions, plus the returned ones
+        changed_artists = self._renderer.render(self._scene, self._camera, only_changed=self._only_changed, changed_objects=changed_objects)
 
         # print(f"  Number of changed artists: {len(changed_artists)}")
         return changed_artists
+
+    def _blit_update_scene(self) -> None:
+        # the timer may fire once more after .stop()
+        if self._blitter is None or self._scene is None:
+            return
+        changed_artists = self._mpl_update_scene(None)
+        self._blitter.update(changed_artists)
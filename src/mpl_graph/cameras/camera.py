@@ -1,14 +1,65 @@
 from abc import ABC, abstractmethod
+from pyrr import matrix44
 import numpy as np
 
 from ..core.object_3d import Object3D
 
 
 class Camera(Object3D, ABC):
+    """
+    Base class of the cameras.
+
+    The view, projection and view-projection matrices are cached: the view matrix until the camera world matrix changes,
+    the projection matrix until the projection parameters (e.g. fovy, near, far) change. So the renderers can ask for them
+    for every object, they are computed once per frame at most. The returned matrices are read-only.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._view_matrix: np.ndarray | None = None
+        self._view_matrix_version: int = -1
+        """World matrix version used to compute `_view_matrix`."""
+        self._projection_matrix: np.ndarray | None = None
+        self._projection_parameters: tuple | None = None
+        """Projection parameters used to compute `_projection_matrix`."""
+        self._view_projection_matrix: np.ndarray | None = None
+        self._view_projection_key: tuple | None = None
+        """(view matrix, projection matrix) used to compute `_view_projection_matrix`."""
+
     @abstractmethod
-    def get_projection_matrix(self) -> np.ndarray:
+    def _get_projection_parameters(self) -> tuple:
+        """Return the parameters the projection matrix depends on. The cached projection matrix is recomputed when they change."""
         pass
 
     @abstractmethod
-    def get_view_matrix(self) -> np.ndarray:
+    def _compute_projection_matrix(self) -> np.ndarray:
         pass
+
+    def get_projection_matrix(self) -> np.ndarray:
+        projection_parameters = self._get_projection_parameters()
+        if self._projection_matrix is None or self._projection_parameters != projection_parameters:
+            self._projection_matrix = self._compute_projection_matrix()
+            self._projection_matrix.flags.writeable = False
+            self._projection_parameters = projection_parameters
+        return self._projection_matrix
+
+    def get_view_matrix(self) -> np.ndarray:
+        """View = inverse(world)"""
+        world_matrix_version = self.get_world_matrix_version()
+        if self._view_matrix is None or self._view_matrix_version != world_matrix_version:
+            self._view_matrix = matrix44.inverse(self.get_world_matrix())
+            self._view_matrix.flags.writeable = False
+            self._view_matrix_version = world_matrix_version
+        return self._view_matrix
+
+    def get_view_projection_matrix(self) -> np.ndarray:
+        """Return view @ projection, so the MVP matrix of an object is a single multiply: `world_matrix @ view_projection_matrix`."""
+        view_matrix = self.get_view_matrix()
+        projection_matrix = self.get_projection_matrix()
+        key = self._view_projection_key
+        if self._view_projection_matrix is None or key is None or key[0] is not view_matrix or key[1] is not projection_matrix:
+            self._view_projection_matrix = view_matrix @ projection_matrix
+            self._view_projection_matrix.flags.writeable = False
+            self._view_projection_key = (view_matrix, projection_matrix)
+        return self._view_projection_matrix
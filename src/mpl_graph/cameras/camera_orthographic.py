@@ -1,5 +1,6 @@
 # pip imports
 from pyrr import matrix44
+import numpy as np
 
 # local imports
 from .camera import Camera
@@ -16,7 +17,10 @@ class CameraOrthographic(Camera):
         self.near = 0.1
         self.far = 10.0
 
-    def get_projection_matrix(self):
+    def _get_projection_parameters(self) -> tuple:
+        return (self.left, self.right, self.bottom, self.top, self.near, self.far)
+
+    def _compute_projection_matrix(self) -> np.ndarray:
         projection_matrix = matrix44.create_orthogonal_projection(
             self.left,
             self.right,
@@ -26,9 +30,3 @@ class CameraOrthographic(Camera):
             self.far,
         )
         return projection_matrix
-
-    def get_view_matrix(self):
-        """View = inverse(world)"""
-        world = self.get_world_matrix()
-        view_matrix = matrix44.inverse(world)
-        return view_matrix
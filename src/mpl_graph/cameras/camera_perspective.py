@@ -15,7 +15,10 @@ class CameraPerspective(Camera):
         self.near = near  # near clipping plane
         self.far = far  # far clipping plane
 
-    def get_projection_matrix(self):
+    def _get_projection_parameters(self) -> tuple:
+        return (self.fovy, self.aspect, self.near, self.far)
+
+    def _compute_projection_matrix(self) -> np.ndarray:
         projection_matrix = matrix44.create_perspective_projection(
             self.fovy,
             self.aspect,
@@ -24,9 +27,3 @@ class CameraPerspective(Camera):
             dtype=np.float32,
         )
         return projection_matrix
-
-    def get_view_matrix(self):
-        """View = inverse(world)"""
-        world_matrix = self.get_world_matrix()
-        view_matrix = matrix44.inverse(world_matrix)
-        return view_matrix
@@ -1,5 +1,7 @@
 from .constants import Constants
 from .event import Event
 from .object_3d import Object3D
+from .object_group import ObjectGroup
 from .random import Random
 from .texture import Texture
+from .transform_pool import TransformPool
@@ -1,3 +1,6 @@
+# stdlib imports
+import time
+import weakref
 from typing import Callable, Generic, TypeVar, Any
 
 # A type variable to represent the callable signature of the event.
@@ -14,21 +17,52 @@ class Event(Generic[Callback]):
 
     The generic type `Callback` allows the event to be type-hinted with the
     specific signature of the functions it will dispatch to, ensuring type safety.
+
+    An event is falsy when it has no subscribers, so a caller can skip building costly arguments:
+    ```python
+    if event:
+        event.dispatch(expensive_arguments())
+    ```
+    """
+
+    timing_enabled: bool = False
+    """
+    If True, the time spent in each callback is recorded in `.handler_timings` and `Event.global_handler_timings`.
+    Set it on the class to time all the events, or on an instance to time only this one.
     """
+    global_handler_timings: dict[str, list[float]] = {}
+    """Cumulative [total_time_in_seconds, call_count] per callback name, over all the timed events."""
 
     def __init__(self):
-        # A list to store the subscribed callback functions.
-        self._callbacks: list[Callback] = []
+        # A list to store the subscribed callbacks, as (callback, None) or (None, weak reference on the callback).
+        self._subscribers: list[tuple[Callback | None, weakref.ref | None]] = []
+        self.handler_timings: dict[str, list[float]] = {}
+        """Cumulative [total_time_in_seconds, call_count] per callback name, for this event. Filled when timing is enabled."""
 
-    def subscribe(self, callback: Callback) -> None:
+    def __len__(self) -> int:
+        """Return the number of subscribers. Weakly referenced callbacks which got garbage collected are dropped, not counted."""
+        self._drop_dead_weakrefs()
+        return len(self._subscribers)
+
+    def has_subscribers(self) -> bool:
+        """Return True if at least one callback is subscribed and alive - same as `bool(event)`."""
+        return len(self) > 0
+
+    def subscribe(self, callback: Callback, weak: bool = False) -> None:
         """
         Subscribes a callback to the event.
 
         Args:
             callback: The function to be called when the event is dispatched.
                       Its signature should match the event's generic type.
+            weak: If True, the event keeps only a weak reference on the callback, and drops it once the callback
+                  (or the object of a bound method) is garbage collected. Useful for controllers subscribing their methods.
         """
-        self._callbacks.append(callback)
+        if weak:
+            callback_weakref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else weakref.ref(callback)
+            self._subscribers.append((None, callback_weakref))  # type: ignore
+        else:
+            self._subscribers.append((callback, None))
 
     def unsubscribe(self, callback: Callback) -> None:
         """
@@ -37,7 +71,13 @@ class Event(Generic[Callback]):
         Args:
             callback: The function to be removed from the event's subscribers.
         """
-        self._callbacks.remove(callback)
+        for index, (subscribed_callback, callback_weakref) in enumerate(self._subscribers):
+            if subscribed_callback is None and callback_weakref is not None:
+                subscribed_callback = callback_weakref()
+            if subscribed_callback == callback:
+                del self._subscribers[index]
+                return
+        raise ValueError("Event.unsubscribe(callback): callback not subscribed")
 
     def dispatch(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -47,8 +87,28 @@ class Event(Generic[Callback]):
             *args: Variable positional arguments to pass to the callbacks.
             **kwargs: Variable keyword arguments to pass to the callbacks.
         """
-        for callback in self._callbacks:
-            callback(*args, **kwargs)
+        if len(self._subscribers) == 0:
+            return
+
+        # iterate on a copy, so callbacks can unsubscribe during the dispatch
+        has_dead_weakrefs = False
+        for callback, callback_weakref in tuple(self._subscribers):
+            if callback is None and callback_weakref is not None:
+                callback = callback_weakref()
+                if callback is None:
+                    has_dead_weakrefs = True
+                    continue
+
+            if self.timing_enabled:
+                time_start = time.perf_counter()
+                callback(*args, **kwargs)
+                self._record_timing(callback, time.perf_counter() - time_start)
+            else:
+                callback(*args, **kwargs)
+
+        # drop the callbacks which got garbage collected
+        if has_dead_weakrefs:
+            self._drop_dead_weakrefs()
 
     def event_listener(self, callback: Callback) -> Callback:
         """
@@ -64,6 +124,29 @@ class Event(Generic[Callback]):
         self.subscribe(callback)
         return callback
 
+    def _drop_dead_weakrefs(self) -> None:
+        """Drop the weakly referenced callbacks which got garbage collected."""
+        if any(callback_weakref is not None and callback_weakref() is None for _, callback_weakref in self._subscribers):
+            self._subscribers = [subscriber for subscriber in self._subscribers if subscriber[1] is None or subscriber[1]() is not None]
+
+    # =============================================================================
+    # Timing
+    # =============================================================================
+
+    @staticmethod
+    def reset_global_handler_timings() -> None:
+        Event.global_handler_timings.clear()
+
+    def _record_timing(self, callback: Callable[..., Any], elapsed_time: float) -> None:
+        callback_name = f"{getattr(callback, '__module__', '')}.{getattr(callback, '__qualname__', repr(callback))}"
+        for handler_timings in (self.handler_timings, Event.global_handler_timings):
+            timing = handler_timings.get(callback_name)
+            if timing is None:
+                handler_timings[callback_name] = [elapsed_time, 1]
+            else:
+                timing[0] += elapsed_time
+                timing[1] += 1
+
 
 # =============================================================================
 # Entry point + example usage
@@ -1,12 +1,18 @@
 # pip imports
-from pyrr import vector3, matrix44, quaternion
+from pyrr import matrix44, quaternion
+import math
 import numpy as np
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Literal
 from typing import Protocol
+import typing
 
 # local imports
 from .random import Random
 from .event import Event
+from ..geometry.bounds_utils import BoundsUtils
+
+if typing.TYPE_CHECKING:
+    from .transform_pool import TransformPool
 
 
 # We can define the expected function signature using a Protocol for clarity.
@@ -26,41 +32,127 @@ class Object3D:
     __slots__ = (
         "uuid",
         "name",
-        "position",
-        "rotation",
-        "scale",
         "parent",
         "_children",
+        "_trs",
+        "_trs_snapshot",
         "_local_matrix",
         "_world_matrix",
-        "pre_rendering",
-        "post_transform",
-        "post_rendering",
+        "_world_matrix_version",
+        "_parent_world_matrix_version",
+        "_transform_pool",
+        "_transform_pool_index",
+        "_world_bounding_box",
+        "_world_bounding_box_key",
+        "_subtree_bounding_box",
+        "_subtree_bounding_box_stamp",
+        "_subtree_bounding_box_own",
+        "_world_decomposition",
+        "_world_decomposition_version",
+        "_pre_rendering",
+        "_post_transform",
+        "_post_rendering",
     )
 
+    _trs_binding_version: int = 0
+    """
+    Incremented each time the `_trs` of objects get rebound to another array, by a TransformPool or an ObjectGroup.
+    So they can cache where the transforms of the objects live, and revalidate it in O(1).
+    """
+
+    _subtree_bounding_box_clock: int = 0
+    """Incremented each time a subtree bounding box is computed, to stamp it - see `update_subtree_bounding_boxes()`."""
+
     def __init__(self) -> None:
-        self.uuid = Random.random_uuid()
+        # packed local transform: position (x, y, z), rotation quaternion (x, y, z, w), scale (sx, sy, sz)
+        # - `.position`, `.rotation` and `.scale` are views into it, so in-place edits land here too
+        self._init_object3d(
+            uuid=Random.random_uuid(),
+            trs=np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0], dtype=np.float32),
+            trs_snapshot=np.full((10,), np.nan, dtype=np.float32),
+            local_matrix=np.identity(4, dtype=np.float32),
+            world_matrix=np.identity(4, dtype=np.float32),
+        )
+
+    def _init_object3d(self, uuid: str, trs: np.ndarray, trs_snapshot: np.ndarray, local_matrix: np.ndarray, world_matrix: np.ndarray) -> None:
+        """Initialize the attributes, with the given arrays. Shared by `__init__()` and `create_many()`."""
+        self.uuid = uuid
         self.name = f"a {Object3D.__name__}"
 
-        self.position = vector3.create(0.0, 0.0, 0.0)
-        """Position vector (x, y, z) in local space."""
-        self.rotation = quaternion.create(dtype=np.float32)  # Identity quaternion (x, y, z, w)
-        """Rotation as a quaternion (x, y, z, w) in local space."""
-        self.scale = vector3.create(1.0, 1.0, 1.0)
-        """Scale vector (sx, sy, sz) in local space."""
+        self._trs = trs
+        self._trs_snapshot = trs_snapshot
+        """Copy of `_trs` used to build the current local matrix. NaN means the local matrix is dirty."""
 
         self.parent: Object3D | None = None
         """Parent Object3D instance or None."""
-        self._children: list[Object3D] = []
-        """List of child Object3D instances."""
+        self._children: dict[Object3D, None] = {}
+        """Child Object3D instances, in insertion order. A dict rather than a list so removing a child is O(1)."""
+
+        self._local_matrix = local_matrix
+        self._world_matrix = world_matrix
+        self._world_matrix_version = 0
+        """Incremented each time the world matrix is recomputed."""
+        self._parent_world_matrix_version = -1
+        """Version of the parent world matrix used for the current world matrix. -1 means the world matrix is dirty."""
+
+        self._transform_pool: "TransformPool | None" = None
+        """TransformPool holding the transform of this object, or None if it owns its own arrays."""
+        self._transform_pool_index: int = -1
+        """Row of this object in its TransformPool."""
+
+        self._world_bounding_box: np.ndarray | None = None
+        self._world_bounding_box_key: tuple[int, np.ndarray | None] | None = None
+        """(world matrix version, local bounding box) used to compute `_world_bounding_box`."""
+        self._subtree_bounding_box: np.ndarray | None = None
+        """World bounding box of this object and its descendants, as computed by the last `update_subtree_bounding_boxes()`."""
+        self._subtree_bounding_box_stamp: int = -1
+        """Value of `_subtree_bounding_box_clock` when `_subtree_bounding_box` got computed. -1 means it is dirty."""
+        self._subtree_bounding_box_own: np.ndarray | None = None
+        """World bounding box of this object alone merged in `_subtree_bounding_box`."""
+
+        self._world_decomposition: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        """Cached (position, rotation quaternion, scale) of the world matrix."""
+        self._world_decomposition_version: int = -1
+        """World matrix version used to compute `_world_decomposition`."""
+
+        # events are allocated on first access - most objects never get a subscriber
+        self._pre_rendering: Event[PreRenderingCallback] | None = None
+        self._post_transform: Event[PostTransformCallback] | None = None
+        self._post_rendering: Event[PostRenderingCallback] | None = None
+
+    @staticmethod
+    def create_many(count: int) -> list["Object3D"]:
+        """
+        Create `count` plain Object3D (e.g. groups or pivots) at once - much faster than calling `Object3D()` in a loop.
 
-        self._local_matrix = matrix44.create_identity(dtype=np.float32)
-        self._world_matrix = matrix44.create_identity(dtype=np.float32)
+        The uuids are generated in a single call, and the transforms of all objects are views into shared arrays.
+        Add them to a parent with `.add_children()`.
+        """
+        uuids = Random.random_uuids(count)
+        trs = np.tile(np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0], dtype=np.float32), (count, 1))
+        trs_snapshots = np.full((count, 10), np.nan, dtype=np.float32)
+        local_matrices = np.tile(np.identity(4, dtype=np.float32), (count, 1, 1))
+        world_matrices = local_matrices.copy()
+
+        objects: list[Object3D] = []
+        for index in range(count):
+            object3d = Object3D.__new__(Object3D)
+            object3d._init_object3d(uuids[index], trs[index], trs_snapshots[index], local_matrices[index], world_matrices[index])
+            objects.append(object3d)
+        return objects
 
-        self.pre_rendering = Event[PreRenderingCallback]()
+    # =============================================================================
+    # events
+    # =============================================================================
+    @property
+    def pre_rendering(self) -> Event[PreRenderingCallback]:
         """Event triggered before rendering the visual."""
+        if self._pre_rendering is None:
+            self._pre_rendering = Event[PreRenderingCallback]()
+        return self._pre_rendering
 
-        self.post_transform = Event[PostTransformCallback]()
+    @property
+    def post_transform(self) -> Event[PostTransformCallback]:
         """
         Event triggered after applying 3d transformations to the visual.
 
@@ -69,31 +161,165 @@ class Object3D:
         - camera: The camera used for rendering.
         - transformed_positions: The numpy array of transformed positions (shape: n x 3).
         """
+        if self._post_transform is None:
+            self._post_transform = Event[PostTransformCallback]()
+        return self._post_transform
 
-        self.post_rendering = Event[PostRenderingCallback]()
+    @property
+    def post_rendering(self) -> Event[PostRenderingCallback]:
         """Event triggered after rendering the visual."""
+        if self._post_rendering is None:
+            self._post_rendering = Event[PostRenderingCallback]()
+        return self._post_rendering
+
+    def has_pre_rendering_subscribers(self) -> bool:
+        """Return True if `.pre_rendering` has subscribers - without allocating the event."""
+        return self._pre_rendering is not None and self._pre_rendering.has_subscribers()
+
+    def has_post_transform_subscribers(self) -> bool:
+        """Return True if `.post_transform` has subscribers - without allocating the event."""
+        return self._post_transform is not None and self._post_transform.has_subscribers()
+
+    def has_post_rendering_subscribers(self) -> bool:
+        """Return True if `.post_rendering` has subscribers - without allocating the event."""
+        return self._post_rendering is not None and self._post_rendering.has_subscribers()
+
+    # =============================================================================
+    # position/rotation/scale
+    # =============================================================================
+    # - they are float32 views into the packed transform `_trs`, like the local and world matrices. So coordinates
+    #   beyond ~1e7 lose their unit digits, e.g. 16777217.0 is stored as 16777216.0
+    # - assigning copies the values into the packed transform: the assigned array is not kept, so editing it
+    #   later does not move the object. Edit `object3d.position` itself, e.g. `object3d.position[0] = 1.0`
+    # - a reference returned by the getter moves the object when edited, until a TransformPool or an ObjectGroup
+    #   moves the packed transform to another array. Get the property again after attaching the object to one
+    # - breaking change: they used to be plain arrays kept by reference, float64 for position and scale
+    @property
+    def position(self) -> np.ndarray:
+        """Position vector (x, y, z) in local space, float32. Assigning copies the values."""
+        return self._trs[0:3]
+
+    @position.setter
+    def position(self, value: np.ndarray) -> None:
+        self._trs[0:3] = value
+
+    @property
+    def rotation(self) -> np.ndarray:
+        """Rotation as a quaternion (x, y, z, w) in local space, float32. Assigning copies the values."""
+        return self._trs[3:7]
+
+    @rotation.setter
+    def rotation(self, value: np.ndarray) -> None:
+        self._trs[3:7] = value
+
+    @property
+    def scale(self) -> np.ndarray:
+        """Scale vector (sx, sy, sz) in local space, float32. Assigning copies the values."""
+        return self._trs[7:10]
+
+    @scale.setter
+    def scale(self, value: np.ndarray) -> None:
+        self._trs[7:10] = value
 
     # =============================================================================
     # add/remove child
     # =============================================================================
     def add(self, child: "Object3D") -> None:
         """Add a child Object3D to this object."""
-        child.parent = self
-        self._children.append(child)
+        self.add_children((child,))
+
+    def add_children(self, children: Iterable["Object3D"]) -> None:
+        """Add several children at once. Same as calling `.add()` for each of them, with the scene graph root looked up once."""
+        root = self.root()
+        for child in children:
+            assert child._transform_pool is None or child.parent is not None, "The root of a TransformPool can not be added to another object"
+            child.parent = self
+            child._parent_world_matrix_version = -1
+            self._children[child] = None
+            self._subtree_bounding_box_stamp = -1
+
+            # keep the transform pool in sync
+            if self._transform_pool is not None:
+                self._transform_pool.attach_subtree(child)
+
+            # notify the root, e.g. for the Scene to index the new objects
+            root._on_subtree_added(child)
 
     def remove(self, child: "Object3D") -> None:
         """Remove a child Object3D from this object."""
         assert child in self._children, "Child not found"
-        self._children.remove(child)
+
+        # notify the root, e.g. for the Scene to unindex the removed objects
+        self.root()._on_subtree_removed(child)
+
+        del self._children[child]
         child.parent = None
+        child._parent_world_matrix_version = -1
+        self._subtree_bounding_box_stamp = -1
+
+        # keep the transform pool in sync
+        if child._transform_pool is not None:
+            child._transform_pool.detach_subtree(child)
+
+    def _on_subtree_added(self, subtree_root: "Object3D") -> None:
+        """Called on the root of the scene graph when `subtree_root` has been added to it. Do nothing by default."""
+        pass
+
+    def _on_subtree_removed(self, subtree_root: "Object3D") -> None:
+        """Called on the root of the scene graph when `subtree_root` is about to be removed from it. Do nothing by default."""
+        pass
 
     def traverse(self) -> list["Object3D"]:
         """Return a list of this object and all its descendants (children, grandchildren, etc.)."""
-        objects: list[Object3D] = [self]
-        for child in self._children:
-            child_objects = child.traverse()
-            objects.extend(child_objects)
-        return objects
+        return list(self.iter_traverse())
+
+    def iter_traverse(
+        self,
+        order: Literal["pre", "post"] = "pre",
+        object_types: type | tuple[type, ...] | None = None,
+        predicate: Callable[["Object3D"], bool] | None = None,
+    ) -> Iterator["Object3D"]:
+        """
+        Iterate over this object and all its descendants, depth-first, without recursion.
+
+        Arguments:
+            order: "pre" yields a parent before its children, "post" yields it after its children.
+            object_types: if set, only the instances of those types are yielded. Their descendants are still visited.
+            predicate: if set, objects for which it returns False are skipped along with their whole subtree.
+
+        Usage:
+        ```python
+        visible_meshes = scene.iter_traverse(object_types=Mesh, predicate=lambda object3d: object3d.name != "hidden")
+        ```
+        """
+        assert order in ("pre", "post"), f"order should be 'pre' or 'post', got {order}"
+
+        if predicate is not None and not predicate(self):
+            return
+
+        if order == "pre":
+            stack: list[Object3D] = [self]
+            while len(stack) > 0:
+                object3d = stack.pop()
+                if object_types is None or isinstance(object3d, object_types):
+                    yield object3d
+                # push children in reverse to visit them in order
+                for child in reversed(object3d._children):
+                    if predicate is None or predicate(child):
+                        stack.append(child)
+        else:
+            # each stack entry is (object3d, children_visited)
+            post_stack: list[tuple[Object3D, bool]] = [(self, False)]
+            while len(post_stack) > 0:
+                object3d, children_visited = post_stack.pop()
+                if children_visited:
+                    if object_types is None or isinstance(object3d, object_types):
+                        yield object3d
+                    continue
+                post_stack.append((object3d, True))
+                for child in reversed(object3d._children):
+                    if predicate is None or predicate(child):
+                        post_stack.append((child, False))
 
     def root(self) -> "Object3D":
         """Return the root Object3D of the scene graph this object belongs to."""
@@ -105,30 +331,76 @@ class Object3D:
     # =============================================================================
     # Update matrix
     # =============================================================================
-    def update_local_matrix(self) -> None:
-        scale_matrix = matrix44.create_from_scale(self.scale, dtype=np.float32)
-        rotation_matrix = matrix44.create_from_quaternion(self.rotation, dtype=np.float32)
-        translation_matrix = matrix44.create_from_translation(self.position, dtype=np.float32)
+    def is_local_matrix_dirty(self) -> bool:
+        """Return True if position/rotation/scale changed since the local matrix was last computed.
+
+        NOTE: in-place edits (e.g. `object3d.position[0] = 1.0`) are detected too, as they write into the same buffer.
+        """
+        return self._trs_snapshot.tobytes() != self._trs.tobytes()
 
+    def update_local_matrix(self) -> None:
         # compute the local matrix: first `scale`, then `rotate`, then `translate`
-        self._local_matrix = matrix44.create_identity(dtype=np.float32)
-        self._local_matrix = matrix44.multiply(self._local_matrix, scale_matrix)
-        self._local_matrix = matrix44.multiply(self._local_matrix, rotation_matrix)
-        self._local_matrix = matrix44.multiply(self._local_matrix, translation_matrix)
-
-    def update_world_matrix(self, parent_world_matrix: np.ndarray | None = None) -> None:
-        self.update_local_matrix()
-
-        if parent_world_matrix is not None:
-            # Compute world matrix by combining local and parent world matrices: first `local` then `parent's world`
-            self._world_matrix = matrix44.create_identity(dtype=np.float32)
-            self._world_matrix = matrix44.multiply(self._world_matrix, self._local_matrix)
-            self._world_matrix = matrix44.multiply(self._world_matrix, parent_world_matrix)
-        else:
-            self._world_matrix = self._local_matrix.copy()
+        # - same formula as TransformPool.compose_local_matrices(), on python floats, as pyrr is slow for a single matrix
+        # - written in place, as it may be a view in a TransformPool
+        px, py, pz, qx, qy, qz, qw, sx, sy, sz = self._trs.tolist()
+        sqx, sqy, sqz, sqw = qx * qx, qy * qy, qz * qz, qw * qw
+        invs = 1.0 / (sqx + sqy + sqz + sqw)
+        qxy, qzw, qxz, qyw, qyz, qxw = qx * qy, qz * qw, qx * qz, qy * qw, qy * qz, qx * qw
+        self._local_matrix[...] = (
+            ((sqx - sqy - sqz + sqw) * invs * sx, 2.0 * (qxy - qzw) * invs * sx, 2.0 * (qxz + qyw) * invs * sx, 0.0),
+            (2.0 * (qxy + qzw) * invs * sy, (-sqx + sqy - sqz + sqw) * invs * sy, 2.0 * (qyz - qxw) * invs * sy, 0.0),
+            (2.0 * (qxz - qyw) * invs * sz, 2.0 * (qyz + qxw) * invs * sz, (-sqx - sqy + sqz + sqw) * invs * sz, 0.0),
+            (px, py, pz, 1.0),
+        )
+
+        # remember which transform produced this local matrix
+        self._trs_snapshot[...] = self._trs
+
+    def update_world_matrix(self, parent_world_matrix: np.ndarray | None = None) -> int:
+        """Update the world matrix of this object and all its descendants.
+
+        Only the nodes whose local transform changed, or whose parent world matrix changed, are recomputed.
+        If this object is attached to a TransformPool, the whole pool is updated in a vectorized way.
+
+        Arguments:
+            parent_world_matrix (np.ndarray | None): world matrix of the parent. If None, this object is handled as a root.
+
+        Returns:
+            int: number of nodes whose world matrix got recomputed.
+        """
+        if self._transform_pool is not None:
+            return self._transform_pool.update_world_matrices()
+
+        # an explicit parent world matrix has no known version, so always recompute with it
+        parent_world_matrix_version = 0 if parent_world_matrix is None else None
+        return self._update_world_matrix(parent_world_matrix, parent_world_matrix_version)
+
+    def _update_world_matrix(self, parent_world_matrix: np.ndarray | None, parent_world_matrix_version: int | None) -> int:
+        updated_count = 0
+
+        # iterative depth-first walk, to support hierarchies deeper than the recursion limit
+        stack: list[tuple[Object3D, np.ndarray | None, int | None]] = [(self, parent_world_matrix, parent_world_matrix_version)]
+        while len(stack) > 0:
+            object3d, parent_world_matrix, parent_world_matrix_version = stack.pop()
+
+            local_matrix_dirty = object3d.is_local_matrix_dirty()
+            if local_matrix_dirty:
+                object3d.update_local_matrix()
 
-        for child in self._children:
-            child.update_world_matrix(self._world_matrix)
+            if local_matrix_dirty or parent_world_matrix_version is None or parent_world_matrix_version != object3d._parent_world_matrix_version:
+                if parent_world_matrix is not None:
+                    # Compute world matrix by combining local and parent world matrices: first `local` then `parent's world`
+                    np.matmul(object3d._local_matrix, parent_world_matrix, out=object3d._world_matrix)
+                else:
+                    object3d._world_matrix[...] = object3d._local_matrix
+                object3d._world_matrix_version += 1
+                object3d._parent_world_matrix_version = parent_world_matrix_version if parent_world_matrix_version is not None else -1
+                updated_count += 1
+
+            for child in object3d._children:
+                stack.append((child, object3d._world_matrix, object3d._world_matrix_version))
+
+        return updated_count
 
     def get_local_matrix(self) -> np.ndarray:
         return self._local_matrix
@@ -136,6 +408,12 @@ class Object3D:
     def get_world_matrix(self) -> np.ndarray:
         return self._world_matrix
 
+    def get_world_matrix_version(self) -> int:
+        """Return a counter incremented each time the world matrix of this object is recomputed."""
+        if self._transform_pool is not None:
+            return int(self._transform_pool._world_versions[self._transform_pool_index])
+        return self._world_matrix_version
+
     # =============================================================================
     # get_world_position/scale/rotation (quaternion)
     # =============================================================================
@@ -143,67 +421,150 @@ class Object3D:
         return self._world_matrix[3, :3]
 
     def get_world_scale(self) -> np.ndarray:
-        sx = np.linalg.norm(self._world_matrix[0, :3])
-        sy = np.linalg.norm(self._world_matrix[1, :3])
-        sz = np.linalg.norm(self._world_matrix[2, :3])
-        return vector3.create(sx, sy, sz)  # type: ignore
+        """Return the world scale (sx, sy, sz). Cached until the world matrix changes, so do not modify it."""
+        return self.get_world_decomposition()[2]
 
     def get_world_rotation_quaternion(self) -> np.ndarray:
-        """Return world rotation as a normalized quaternion.
+        """Return world rotation as a normalized quaternion. Cached until the world matrix changes, so do not modify it.
 
         Note: extracts rotation from the world matrix by removing the scale.
         """
-        # Extract and normalize the rotation axes to remove scale
-        m = self._world_matrix.astype(np.float64)
-        x_axis = m[0, :3]
-        y_axis = m[1, :3]
-        z_axis = m[2, :3]
+        return self.get_world_decomposition()[1]
+
+    def get_world_decomposition(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decompose the world matrix into position, rotation quaternion (x, y, z, w) and scale.
+
+        The result is cached until the world matrix changes, and its arrays are read-only.
+        For many objects at once, use `ObjectGroup.get_world_decompositions()`.
+        """
+        world_matrix_version = self.get_world_matrix_version()
+        if self._world_decomposition is None or self._world_decomposition_version != world_matrix_version:
+            self._world_decomposition = Object3D._decompose_matrix(self._world_matrix)
+            self._world_decomposition_version = world_matrix_version
+        return self._world_decomposition
 
-        sx = np.linalg.norm(x_axis)
-        sy = np.linalg.norm(y_axis)
-        sz = np.linalg.norm(z_axis)
+    @staticmethod
+    def _decompose_matrix(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decompose a single matrix, on python floats as numpy is slow for so few values. See `ObjectGroup.decompose_matrices()`."""
+        (m00, m01, m02, _), (m10, m11, m12, _), (m20, m21, m22, _), (px, py, pz, _) = matrix.tolist()
 
+        # Extract and normalize the rotation axes to remove scale
+        sx = math.sqrt(m00 * m00 + m01 * m01 + m02 * m02)
+        sy = math.sqrt(m10 * m10 + m11 * m11 + m12 * m12)
+        sz = math.sqrt(m20 * m20 + m21 * m21 + m22 * m22)
         if sx > 0:
-            x_axis = x_axis / sx
+            m00, m01, m02 = m00 / sx, m01 / sx, m02 / sx
         if sy > 0:
-            y_axis = y_axis / sy
+            m10, m11, m12 = m10 / sy, m11 / sy, m12 / sy
         if sz > 0:
-            z_axis = z_axis / sz
-
-        R = np.stack([x_axis, y_axis, z_axis], axis=0)
+            m20, m21, m22 = m20 / sz, m21 / sz, m22 / sz
 
         # Convert 3x3 rotation matrix to quaternion (x, y, z, w)
-        trace = np.trace(R)
+        trace = m00 + m11 + m22
         if trace > 0.0:
-            s = np.sqrt(trace + 1.0) * 2.0
+            s = math.sqrt(trace + 1.0) * 2.0
             qw = 0.25 * s
-            qx = (R[2, 1] - R[1, 2]) / s
-            qy = (R[0, 2] - R[2, 0]) / s
-            qz = (R[1, 0] - R[0, 1]) / s
+            qx = (m21 - m12) / s
+            qy = (m02 - m20) / s
+            qz = (m10 - m01) / s
+        elif m00 > m11 and m00 > m22:
+            s = math.sqrt(1.0 + m00 - m11 - m22) * 2.0
+            qw = (m21 - m12) / s
+            qx = 0.25 * s
+            qy = (m01 + m10) / s
+            qz = (m02 + m20) / s
+        elif m11 > m22:
+            s = math.sqrt(1.0 + m11 - m00 - m22) * 2.0
+            qw = (m02 - m20) / s
+            qx = (m01 + m10) / s
+            qy = 0.25 * s
+            qz = (m12 + m21) / s
         else:
-            if R[0, 0] > R[1, 1] and R[0, 0] > R[2, 2]:
-                s = np.sqrt(1.0 + R[0, 0] - R[1, 1] - R[2, 2]) * 2.0
-                qw = (R[2, 1] - R[1, 2]) / s
-                qx = 0.25 * s
-                qy = (R[0, 1] + R[1, 0]) / s
-                qz = (R[0, 2] + R[2, 0]) / s
-            elif R[1, 1] > R[2, 2]:
-                s = np.sqrt(1.0 + R[1, 1] - R[0, 0] - R[2, 2]) * 2.0
-                qw = (R[0, 2] - R[2, 0]) / s
-                qx = (R[0, 1] + R[1, 0]) / s
-                qy = 0.25 * s
-                qz = (R[1, 2] + R[2, 1]) / s
-            else:
-                s = np.sqrt(1.0 + R[2, 2] - R[0, 0] - R[1, 1]) * 2.0
-                qw = (R[1, 0] - R[0, 1]) / s
-                qx = (R[0, 2] + R[2, 0]) / s
-                qy = (R[1, 2] + R[2, 1]) / s
-                qz = 0.25 * s
-
-        q = np.array([qx, qy, qz, qw], dtype=np.float32)
+            s = math.sqrt(1.0 + m22 - m00 - m11) * 2.0
+            qw = (m10 - m01) / s
+            qx = (m02 + m20) / s
+            qy = (m12 + m21) / s
+            qz = 0.25 * s
+
         # Normalize to ensure a valid quaternion
-        q = q / np.linalg.norm(q)
-        return q
+        q_norm = math.sqrt(qx * qx + qy * qy + qz * qz + qw * qw)
+        position = np.array((px, py, pz), dtype=np.float32)
+        rotation = np.array((qx / q_norm, qy / q_norm, qz / q_norm, qw / q_norm), dtype=np.float32)
+        scale = np.array((sx, sy, sz), dtype=np.float32)
+        for array in (position, rotation, scale):
+            array.flags.writeable = False
+        return position, rotation, scale
+
+    # =============================================================================
+    # Bounding volumes
+    # =============================================================================
+    def get_local_bounding_box(self) -> np.ndarray | None:
+        """
+        Return the bounding box [min_xyz, max_xyz] of this object alone, in local space, shape (2, 3).
+
+        None if the object has no extent, like a plain Object3D. Subclasses with a geometry override it.
+        """
+        return None
+
+    def get_world_bounding_box(self) -> np.ndarray | None:
+        """Return the bounding box of this object alone in world space, shape (2, 3). Cached until the world matrix or the geometry changes."""
+        local_bounding_box = self.get_local_bounding_box()
+        if local_bounding_box is None:
+            return None
+
+        world_matrix_version = self.get_world_matrix_version()
+        key = self._world_bounding_box_key
+        if key is None or key[0] != world_matrix_version or key[1] is not local_bounding_box:
+            self._world_bounding_box = BoundsUtils.transform_bounding_box(local_bounding_box, self._world_matrix)
+            self._world_bounding_box_key = (world_matrix_version, local_bounding_box)
+        return self._world_bounding_box
+
+    def get_world_bounding_sphere(self) -> np.ndarray | None:
+        """Return a bounding sphere [center_xyz, radius] of this object alone in world space, shape (4,)."""
+        world_bounding_box = self.get_world_bounding_box()
+        if world_bounding_box is None:
+            return None
+        return BoundsUtils.bounding_box_to_sphere(world_bounding_box)
+
+    def update_subtree_bounding_boxes(self) -> np.ndarray | None:
+        """
+        Compute the world bounding box of the subtree of every object under this one, merging them bottom-up.
+
+        Call it after `update_world_matrix()`. Read the results with `get_subtree_bounding_box()`.
+
+        Incremental: an object merges its boxes again only if its own world bounding box changed (world matrix or geometry version),
+        a child got added or removed, or the box of a child got merged again - so the changes propagate up from the dirty objects only,
+        and an unchanged object costs a version check.
+
+        Returns:
+            np.ndarray | None: the world bounding box of this whole subtree, or None if nothing in it has an extent.
+        """
+        for object3d in self.iter_traverse(order="post"):
+            world_bounding_box = object3d.get_world_bounding_box()
+            stamp = object3d._subtree_bounding_box_stamp
+            if (
+                stamp >= 0
+                and world_bounding_box is object3d._subtree_bounding_box_own
+                and all(child._subtree_bounding_box_stamp <= stamp for child in object3d._children)
+            ):
+                continue
+
+            bounding_boxes: list[np.ndarray] = []
+            if world_bounding_box is not None:
+                bounding_boxes.append(world_bounding_box)
+            for child in object3d._children:
+                if child._subtree_bounding_box is not None:
+                    bounding_boxes.append(child._subtree_bounding_box)
+            object3d._subtree_bounding_box = BoundsUtils.merge_bounding_boxes(bounding_boxes)
+            object3d._subtree_bounding_box_own = world_bounding_box
+            Object3D._subtree_bounding_box_clock += 1
+            object3d._subtree_bounding_box_stamp = Object3D._subtree_bounding_box_clock
+        return self._subtree_bounding_box
+
+    def get_subtree_bounding_box(self) -> np.ndarray | None:
+        """Return the world bounding box of this object and all its descendants, as of the last `update_subtree_bounding_boxes()`."""
+        return self._subtree_bounding_box
 
     # =============================================================================
     # rotate_x / rotate_y / rotate_z (local space)
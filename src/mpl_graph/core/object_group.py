@@ -0,0 +1,346 @@
+# pip imports
+import numpy as np
+from typing import Sequence
+
+# local imports
+from .object_3d import Object3D
+from .transform_pool import TransformPool
+
+
+class ObjectGroup:
+    """
+    Vectorized transform operations over many objects at once.
+
+    - every operation takes arrays, one row per object, e.g. (N, 3) positions or (N, 4) quaternions
+    - a single row, or a scalar angle, is broadcasted to all the objects
+    - the results are written back into the transforms of the objects, so `update_world_matrix()` picks them up
+
+    The transforms are read and written in a single array:
+    - if the objects are attached to a TransformPool, the pool arrays are used directly
+    - else the objects transforms are moved into an array owned by the group, and the objects get views on it
+
+    Usage:
+    ```python
+    group = ObjectGroup(spheres)
+    group.translate(velocities * delta_time)
+    group.rotate_y(angular_speeds * delta_time)
+    group.look_at(camera.position)
+    ```
+
+    NOTE: the rotations follow the same conventions as `Object3D.rotate_x()`, `.rotate_axis()`, `.look_at()`, etc.
+    """
+
+    __slots__ = ("_objects", "_trs", "_rows", "_rows_transform_pool", "_rows_binding_version")
+
+    def __init__(self, objects: Sequence[Object3D]) -> None:
+        assert len(objects) > 0, "ObjectGroup needs at least one object"
+
+        self._objects: list[Object3D] = list(objects)
+        """The objects of the group, one row per object in all the arrays."""
+        self._trs: np.ndarray = np.zeros((0, 10), dtype=np.float32)
+        """Packed transforms owned by the group, shape (N, 10). Unused if the objects are in a TransformPool."""
+        self._rows: np.ndarray = np.zeros((0,), dtype=np.int64)
+        """Row of each object in the packed transforms array - see `._get_trs_rows()`"""
+        self._rows_transform_pool: TransformPool | None = None
+        """TransformPool holding the transforms when `._rows` got computed, None if it is the group array."""
+        self._rows_binding_version: int = -1
+        """`Object3D._trs_binding_version` when `._rows` got computed. -1 means they have to be computed."""
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def objects(self) -> list[Object3D]:
+        return self._objects
+
+    # =============================================================================
+    # get/set positions/rotations/scales
+    # =============================================================================
+
+    def get_positions(self) -> np.ndarray:
+        """Return a copy of the local positions, shape (N, 3)."""
+        trs, rows = self._get_trs_rows()
+        return trs[rows, 0:3]
+
+    def get_rotations(self) -> np.ndarray:
+        """Return a copy of the local rotation quaternions (x, y, z, w), shape (N, 4)."""
+        trs, rows = self._get_trs_rows()
+        return trs[rows, 3:7]
+
+    def get_scales(self) -> np.ndarray:
+        """Return a copy of the local scales, shape (N, 3)."""
+        trs, rows = self._get_trs_rows()
+        return trs[rows, 7:10]
+
+    def set_positions(self, positions: np.ndarray) -> "ObjectGroup":
+        """Set the local positions, shape (N, 3) or (3,)."""
+        trs, rows = self._get_trs_rows()
+        trs[rows, 0:3] = positions
+        return self
+
+    def set_rotations(self, rotations: np.ndarray) -> "ObjectGroup":
+        """Set the local rotation quaternions (x, y, z, w), shape (N, 4) or (4,). They are normalized."""
+        trs, rows = self._get_trs_rows()
+        trs[rows, 3:7] = ObjectGroup.normalize_quaternions(np.broadcast_to(rotations, (len(self._objects), 4)))
+        return self
+
+    def set_scales(self, scales: np.ndarray) -> "ObjectGroup":
+        """Set the local scales, shape (N, 3) or (3,)."""
+        trs, rows = self._get_trs_rows()
+        trs[rows, 7:10] = scales
+        return self
+
+    # =============================================================================
+    # World matrices
+    # =============================================================================
+
+    def get_world_matrices(self) -> np.ndarray:
+        """Return a copy of the world matrices, shape (N, 4, 4). Call `update_world_matrix()` on the scene before."""
+        transform_pool = self._objects[0]._transform_pool
+        if transform_pool is not None:
+            _, rows = self._get_trs_rows()
+            return transform_pool._world_matrices[rows]
+        return np.array([object3d._world_matrix for object3d in self._objects])
+
+    def get_world_decompositions(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decompose the world matrices of all the objects at once. The batched version of `Object3D.get_world_decomposition()`.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: world positions (N, 3), rotation quaternions (N, 4) and scales (N, 3)
+        """
+        return ObjectGroup.decompose_matrices(self.get_world_matrices())
+
+    @staticmethod
+    def decompose_matrices(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decompose matrices into positions, rotation quaternions (x, y, z, w) and scales.
+
+        Arguments:
+            matrices (np.ndarray): matrices in pyrr row-vector convention, without shear, shape (N, 4, 4)
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: positions (N, 3), rotation quaternions (N, 4) and scales (N, 3), as float32
+        """
+        matrices = np.asarray(matrices, dtype=np.float64)
+        positions = matrices[:, 3, :3]
+
+        # the scale is the length of each rotation row
+        scales = np.linalg.norm(matrices[:, :3, :3], axis=2)
+        rotation_matrices = matrices[:, :3, :3] / np.where(scales == 0.0, 1.0, scales)[:, :, np.newaxis]
+        rotations = ObjectGroup.normalize_quaternions(ObjectGroup.quaternions_from_rotation_matrices(rotation_matrices))
+
+        return positions.astype(np.float32), rotations.astype(np.float32), scales.astype(np.float32)
+
+    # =============================================================================
+    # translate/scale
+    # =============================================================================
+
+    def translate(self, offsets: np.ndarray) -> "ObjectGroup":
+        """Add `offsets` to the local positions, shape (N, 3) or (3,)."""
+        trs, rows = self._get_trs_rows()
+        trs[rows, 0:3] += offsets
+        return self
+
+    def scale_by(self, factors: np.ndarray | float) -> "ObjectGroup":
+        """Multiply the local scales by `factors`, shape (N, 3), (N, 1), (3,) or a scalar."""
+        trs, rows = self._get_trs_rows()
+        trs[rows, 7:10] *= factors
+        return self
+
+    # =============================================================================
+    # rotate_x / rotate_y / rotate_z / rotate_axis (local space)
+    # =============================================================================
+
+    def rotate_x(self, angles_rad: np.ndarray | float) -> "ObjectGroup":
+        """Rotate locally around +X by `angles_rad` (radians), shape (N,) or a scalar."""
+        return self.rotate_axis(np.array([1.0, 0.0, 0.0]), angles_rad)
+
+    def rotate_y(self, angles_rad: np.ndarray | float) -> "ObjectGroup":
+        """Rotate locally around +Y by `angles_rad` (radians), shape (N,) or a scalar."""
+        return self.rotate_axis(np.array([0.0, 1.0, 0.0]), angles_rad)
+
+    def rotate_z(self, angles_rad: np.ndarray | float) -> "ObjectGroup":
+        """Rotate locally around +Z by `angles_rad` (radians), shape (N,) or a scalar."""
+        return self.rotate_axis(np.array([0.0, 0.0, 1.0]), angles_rad)
+
+    def rotate_axis(self, axes: np.ndarray, angles_rad: np.ndarray | float) -> "ObjectGroup":
+        """
+        Rotate locally around `axes` by `angles_rad` (radians).
+
+        Arguments:
+            axes (np.ndarray): rotation axes, shape (N, 3) or (3,). They are normalized, zero axes leave the rotation unchanged.
+            angles_rad (np.ndarray | float): rotation angles, shape (N,) or a scalar.
+        """
+        count = len(self._objects)
+        axes = np.broadcast_to(np.asarray(axes, dtype=np.float64), (count, 3))
+        half_angles = 0.5 * np.broadcast_to(np.asarray(angles_rad, dtype=np.float64), (count,))
+
+        # axis-angle quaternions, identity for the zero axes
+        axes_norm = np.linalg.norm(axes, axis=1)
+        axes_norm[axes_norm == 0.0] = np.inf
+        quaternions = np.empty((count, 4), dtype=np.float64)
+        quaternions[:, 0:3] = axes * (np.sin(half_angles) / axes_norm)[:, np.newaxis]
+        quaternions[:, 3] = np.where(np.isfinite(axes_norm), np.cos(half_angles), 1.0)
+
+        # apply the current rotation, then the new one
+        trs, rows = self._get_trs_rows()
+        trs[rows, 3:7] = ObjectGroup.normalize_quaternions(ObjectGroup.multiply_quaternions(quaternions, trs[rows, 3:7]))
+        return self
+
+    def look_at(self, targets: np.ndarray, up: np.ndarray | None = None) -> "ObjectGroup":
+        """
+        Orient the objects so their forward (-Z) points toward `targets`.
+
+        Same as calling `Object3D.look_at()` on each object. The objects already at their target are left unchanged.
+
+        Arguments:
+            targets (np.ndarray): targets in the parent space of the objects, shape (N, 3) or (3,).
+            up (np.ndarray | None): up vectors, shape (N, 3) or (3,). Defaults to +Y.
+        """
+        if up is None:
+            up = np.array([0.0, 1.0, 0.0])
+
+        count = len(self._objects)
+        trs, rows = self._get_trs_rows()
+        eyes = trs[rows, 0:3].astype(np.float64)
+        targets = np.broadcast_to(np.asarray(targets, dtype=np.float64), (count, 3))
+        ups = np.broadcast_to(np.asarray(up, dtype=np.float64), (count, 3))
+
+        # same basis as pyrr matrix44.create_look_at, the object rotation is the inverse of the view rotation
+        forwards = ObjectGroup._normalize_vectors(targets - eyes)
+        sides = ObjectGroup._normalize_vectors(np.cross(forwards, ups))
+        ups = ObjectGroup._normalize_vectors(np.cross(sides, forwards))
+        rotation_matrices = np.stack([sides, ups, -forwards], axis=1)
+
+        # keep the rotation of the objects already at their target
+        moved = ~np.all(np.isclose(eyes, targets), axis=1)
+        trs[rows[moved], 3:7] = ObjectGroup.normalize_quaternions(ObjectGroup.quaternions_from_rotation_matrices(rotation_matrices[moved]))
+        return self
+
+    # =============================================================================
+    # Quaternion helpers
+    # =============================================================================
+
+    @staticmethod
+    def multiply_quaternions(quaternions_1: np.ndarray, quaternions_2: np.ndarray) -> np.ndarray:
+        """
+        Multiply quaternions (x, y, z, w) row by row, shape (N, 4). Same as pyrr quaternion.cross().
+
+        The result applies `quaternions_2` first, then `quaternions_1`.
+        """
+        q1x, q1y, q1z, q1w = quaternions_1[:, 0], quaternions_1[:, 1], quaternions_1[:, 2], quaternions_1[:, 3]
+        q2x, q2y, q2z, q2w = quaternions_2[:, 0], quaternions_2[:, 1], quaternions_2[:, 2], quaternions_2[:, 3]
+        return np.stack(
+            [
+                q1x * q2w + q1y * q2z - q1z * q2y + q1w * q2x,
+                -q1x * q2z + q1y * q2w + q1z * q2x + q1w * q2y,
+                q1x * q2y - q1y * q2x + q1z * q2w + q1w * q2z,
+                -q1x * q2x - q1y * q2y - q1z * q2z + q1w * q2w,
+            ],
+            axis=1,
+        )
+
+    @staticmethod
+    def normalize_quaternions(quaternions: np.ndarray) -> np.ndarray:
+        """Normalize quaternions, shape (N, 4). Zero quaternions become the identity."""
+        norms = np.linalg.norm(quaternions, axis=1, keepdims=True)
+        normalized = quaternions / np.where(norms == 0.0, 1.0, norms)
+        normalized[norms[:, 0] == 0.0] = (0.0, 0.0, 0.0, 1.0)
+        return normalized
+
+    @staticmethod
+    def quaternions_from_rotation_matrices(rotation_matrices: np.ndarray) -> np.ndarray:
+        """
+        Convert rotation matrices into quaternions (x, y, z, w). Same as pyrr quaternion.create_from_matrix(), vectorized.
+
+        Arguments:
+            rotation_matrices (np.ndarray): orthonormal rotation matrices, shape (N, 3, 3)
+
+        Returns:
+            np.ndarray: quaternions, shape (N, 4)
+        """
+        m = rotation_matrices
+        m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+        trace = m00 + m11 + m22
+        quaternions = np.empty((len(m), 4), dtype=np.float64)
+
+        # pick the most stable formula for each matrix, like the scalar version
+        case_trace = trace > 0.0
+        case_x = ~case_trace & (m00 > m11) & (m00 > m22)
+        case_y = ~case_trace & ~case_x & (m11 > m22)
+        case_z = ~case_trace & ~case_x & ~case_y
+
+        c = case_trace
+        s = 0.5 / np.sqrt(trace[c] + 1.0)
+        quaternions[c, 0] = (m[c, 2, 1] - m[c, 1, 2]) * s
+        quaternions[c, 1] = (m[c, 0, 2] - m[c, 2, 0]) * s
+        quaternions[c, 2] = (m[c, 1, 0] - m[c, 0, 1]) * s
+        quaternions[c, 3] = 0.25 / s
+
+        c = case_x
+        s = 2.0 * np.sqrt(1.0 + m00[c] - m11[c] - m22[c])
+        quaternions[c, 0] = 0.25 * s
+        quaternions[c, 1] = (m[c, 0, 1] + m[c, 1, 0]) / s
+        quaternions[c, 2] = (m[c, 0, 2] + m[c, 2, 0]) / s
+        quaternions[c, 3] = (m[c, 2, 1] - m[c, 1, 2]) / s
+
+        c = case_y
+        s = 2.0 * np.sqrt(1.0 + m11[c] - m00[c] - m22[c])
+        quaternions[c, 0] = (m[c, 0, 1] + m[c, 1, 0]) / s
+        quaternions[c, 1] = 0.25 * s
+        quaternions[c, 2] = (m[c, 1, 2] + m[c, 2, 1]) / s
+        quaternions[c, 3] = (m[c, 0, 2] - m[c, 2, 0]) / s
+
+        c = case_z
+        s = 2.0 * np.sqrt(1.0 + m22[c] - m00[c] - m11[c])
+        quaternions[c, 0] = (m[c, 0, 2] + m[c, 2, 0]) / s
+        quaternions[c, 1] = (m[c, 1, 2] + m[c, 2, 1]) / s
+        quaternions[c, 2] = 0.25 * s
+        quaternions[c, 3] = (m[c, 1, 0] - m[c, 0, 1]) / s
+
+        return quaternions
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    @staticmethod
+    def _normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0.0, 1.0, norms)
+
+    def _get_trs_rows(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the packed transforms array holding the transforms of the objects, and the row of each object in it.
+
+        Writing in `trs[rows]` updates the objects transforms.
+        The rows are cached until a TransformPool or another ObjectGroup rebinds some transforms - see `Object3D._trs_binding_version`.
+        """
+        if self._rows_binding_version != Object3D._trs_binding_version:
+            self._update_trs_rows()
+
+        # use the pool arrays - fetched on each call, as the pool reallocates them when it grows
+        if self._rows_transform_pool is not None:
+            return self._rows_transform_pool._trs, self._rows
+        return self._trs, self._rows
+
+    def _update_trs_rows(self) -> None:
+        """Compute the rows of the objects, moving their transforms in the group array if they are not in a TransformPool."""
+        transform_pool = self._objects[0]._transform_pool
+        if transform_pool is not None:
+            rows = np.fromiter((object3d._transform_pool_index for object3d in self._objects if object3d._transform_pool is transform_pool), dtype=np.int64)
+            assert len(rows) == len(self._objects), "The objects of an ObjectGroup should all be in the same TransformPool, or in none"
+            self._rows = rows
+        else:
+            # move the objects transforms in the group array, unless they are already views on it
+            if not all(object3d._trs.base is self._trs for object3d in self._objects):
+                assert all(object3d._transform_pool is None for object3d in self._objects), "The objects of an ObjectGroup should all be in the same TransformPool, or in none"
+                self._trs = np.array([object3d._trs for object3d in self._objects], dtype=np.float32)
+                for index, object3d in enumerate(self._objects):
+                    object3d._trs = self._trs[index]
+                Object3D._trs_binding_version += 1
+            self._rows = np.arange(len(self._objects))
+
+        self._rows_transform_pool = transform_pool
+        self._rows_binding_version = Object3D._trs_binding_version
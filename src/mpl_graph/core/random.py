@@ -29,20 +29,32 @@ class Random:
         Returns:
             str: A randomly generated UUID string.
         """
+        return Random.random_uuids(1)[0]
 
-        # Generate 16 random bytes
-        bytes = [Random.__np_random_generator.integers(0, 255) for _ in range(16)]
+    @staticmethod
+    def random_uuids(count: int) -> list[str]:
+        """Generate `count` random UUID strings at once - much faster than calling `random_uuid()` in a loop.
+
+        It draws the same random numbers as `count` calls to `random_uuid()`, so seeded uuids do not change.
+
+        Args:
+            count (int): The number of UUID strings to generate.
+
+        Returns:
+            list[str]: The randomly generated UUID strings.
+        """
+
+        # Generate 16 random bytes per uuid
+        uuids_bytes = Random.__np_random_generator.integers(0, 255, size=(count, 16)).astype(np.uint8)
         # Set version to 4 (random)
-        bytes[6] = (bytes[6] & 0x0F) | 0x40
+        uuids_bytes[:, 6] = (uuids_bytes[:, 6] & 0x0F) | 0x40
         # Set variant to RFC 4122
-        bytes[8] = (bytes[8] & 0x3F) | 0x80
-        # Format as a UUID string
-        uuid_str = (
-            '{:02x}{:02x}{:02x}{:02x}-'
-            '{:02x}{:02x}-'
-            '{:02x}{:02x}-'
-            '{:02x}{:02x}-'
-            '{:02x}{:02x}{:02x}{:02x}{:02x}{:02x}'
-        ).format(*bytes)
-
-        return uuid_str
\ No newline at end of file
+        uuids_bytes[:, 8] = (uuids_bytes[:, 8] & 0x3F) | 0x80
+        # Format as UUID strings
+        uuids_hex = uuids_bytes.tobytes().hex()
+        uuid_strs = []
+        for offset in range(0, 32 * count, 32):
+            uuid_hex = uuids_hex[offset : offset + 32]
+            uuid_strs.append(f"{uuid_hex[0:8]}-{uuid_hex[8:12]}-{uuid_hex[12:16]}-{uuid_hex[16:20]}-{uuid_hex[20:32]}")
+
+        return uuid_strs
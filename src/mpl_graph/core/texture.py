@@ -4,19 +4,38 @@ import matplotlib.image
 
 
 class Texture:
-    __slots__ = ("data",)
+    __slots__ = ("_data", "_version")
 
     def __init__(self, data: np.ndarray | None = None) -> None:
         """
         float texture image data of shape [H, W, 3] or [H, W, 4] in range [0, 1]
         """
 
-        self.data: np.ndarray = data if data is not None else np.array([], dtype=np.float32).reshape((0, 0, 3))
-        """float texture image data of shape [H, W, 3] or [H, W, 4] in range [0, 1]"""
+        self._version: int = 0
+        self.data = data if data is not None else np.array([], dtype=np.float32).reshape((0, 0, 3))
 
         assert self.data.ndim == 3 and self.data.shape[2] in [3, 4], f"image should be of shape [H, W, 3] or [H, W, 4], got {self.data.shape}"
         assert self.data.dtype in [np.float32, np.float64], f"image should be of type float32 or float64, got {self.data.dtype}"
 
+    @property
+    def data(self) -> np.ndarray:
+        """float texture image data of shape [H, W, 3] or [H, W, 4] in range [0, 1]"""
+        return self._data
+
+    @data.setter
+    def data(self, data: np.ndarray) -> None:
+        self._data = data
+        self.mark_dirty()
+
+    @property
+    def version(self) -> int:
+        """Counter incremented each time the texture changes. Compare it with a stored value to know if cached data is stale."""
+        return self._version
+
+    def mark_dirty(self) -> None:
+        """Increment the version. Assigning `.data` does it automatically, call it after editing `.data` in place."""
+        self._version += 1
+
     def copy(self) -> "Texture":
         """Return a copy of the texture."""
         return Texture(self.data.copy())
@@ -0,0 +1,320 @@
+# stdlib imports
+import typing
+
+# pip imports
+import numpy as np
+
+# local imports
+from .object_3d import Object3D
+
+
+class TransformPool:
+    """
+    Scene-wide structure-of-arrays storage for the transforms of a scene graph.
+
+    - all the positions/rotations/scales and local/world matrices of the subtree live in contiguous arrays
+    - each `Object3D` of the subtree gets views into those arrays, so `object3d.position[0] = 1.0` writes in the pool
+    - `update_world_matrices()` computes all the local matrices in one vectorized pass, then all the world
+      matrices one hierarchy depth at a time
+
+    Usage:
+    ```python
+    scene = Scene()
+    ...
+    transform_pool = TransformPool(scene)
+    # now scene.update_world_matrix() is done by the pool
+    ```
+
+    NOTE: when the pool grows, the arrays are reallocated and the views are updated.
+    So do not keep references on `object3d.position` and friends across `.add()` calls.
+    """
+
+    __slots__ = (
+        "_root",
+        "_capacity",
+        "_size",
+        "_trs",
+        "_trs_snapshot",
+        "_local_matrices",
+        "_world_matrices",
+        "_world_versions",
+        "_world_dirty",
+        "_used",
+        "_parent_indices",
+        "_objects",
+        "_free_indices",
+        "_levels",
+    )
+
+    def __init__(self, root: "Object3D", capacity: int = 1024) -> None:
+        """
+        Create a pool and attach the whole subtree of `root` to it.
+
+        Arguments:
+            root (Object3D): the root of the subtree. it MUST NOT have a parent.
+            capacity (int): initial number of objects the pool can hold without reallocating.
+        """
+        # sanity checks
+        assert root.parent is None, "The root of a TransformPool must not have a parent"
+        assert root._transform_pool is None, "The root is already attached to a TransformPool"
+        assert capacity > 0, f"capacity should be > 0, got {capacity}"
+
+        self._root = root
+        self._capacity = 0
+        self._size = 0
+        """number of rows in use, including the freed ones."""
+        self._trs = np.zeros((0, 10), dtype=np.float32)
+        self._trs_snapshot = np.zeros((0, 10), dtype=np.float32)
+        self._local_matrices = np.zeros((0, 4, 4), dtype=np.float32)
+        self._world_matrices = np.zeros((0, 4, 4), dtype=np.float32)
+        self._world_versions = np.zeros((0,), dtype=np.int64)
+        self._world_dirty = np.zeros((0,), dtype=bool)
+        self._used = np.zeros((0,), dtype=bool)
+        self._parent_indices = np.zeros((0,), dtype=np.int64)
+        self._objects: list["Object3D | None"] = []
+        self._free_indices: list[int] = []
+        self._levels: list[np.ndarray] | None = None
+        """indices of the objects grouped by hierarchy depth. None when the hierarchy changed."""
+
+        self._grow(capacity)
+        self.attach_subtree(root)
+
+    def __len__(self) -> int:
+        return self._size - len(self._free_indices)
+
+    # =============================================================================
+    # Views on the arrays
+    # =============================================================================
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Positions of all the rows, shape (N, 3). Freed rows are included."""
+        return self._trs[: self._size, 0:3]
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """Rotation quaternions (x, y, z, w) of all the rows, shape (N, 4). Freed rows are included."""
+        return self._trs[: self._size, 3:7]
+
+    @property
+    def scales(self) -> np.ndarray:
+        """Scales of all the rows, shape (N, 3). Freed rows are included."""
+        return self._trs[: self._size, 7:10]
+
+    @property
+    def local_matrices(self) -> np.ndarray:
+        """Local matrices of all the rows, shape (N, 4, 4). Freed rows are included."""
+        return self._local_matrices[: self._size]
+
+    @property
+    def world_matrices(self) -> np.ndarray:
+        """World matrices of all the rows, shape (N, 4, 4). Freed rows are included."""
+        return self._world_matrices[: self._size]
+
+    def index_of(self, object3d: "Object3D") -> int:
+        """Return the row of `object3d` in the pool arrays."""
+        assert object3d._transform_pool is self, "The object is not attached to this pool"
+        return object3d._transform_pool_index
+
+    # =============================================================================
+    # attach/detach
+    # =============================================================================
+
+    def attach_subtree(self, object3d: "Object3D") -> None:
+        """Attach `object3d` and all its descendants to the pool. Their current transform is kept."""
+        stack: list["Object3D"] = [object3d]
+        while len(stack) > 0:
+            node = stack.pop()
+            assert node._transform_pool is None, f"{node.name} is already attached to a TransformPool"
+
+            # get a free row
+            if len(self._free_indices) > 0:
+                index = self._free_indices.pop()
+            else:
+                if self._size == self._capacity:
+                    self._grow(self._capacity * 2)
+                index = self._size
+                self._size += 1
+
+            # copy the node state in the row, then make the node use views on the row
+            self._trs[index] = node._trs
+            self._trs_snapshot[index] = np.nan
+            self._local_matrices[index] = node._local_matrix
+            self._world_matrices[index] = node._world_matrix
+            self._world_versions[index] = node._world_matrix_version
+            self._world_dirty[index] = True
+            self._used[index] = True
+            self._objects[index] = node
+            node._transform_pool = self
+            node._transform_pool_index = index
+            self._bind_views(node, index)
+
+            stack.extend(node._children)
+
+        self._levels = None
+        Object3D._trs_binding_version += 1
+
+    def detach_subtree(self, object3d: "Object3D") -> None:
+        """Detach `object3d` and all its descendants from the pool. They get their own copy of their transform."""
+        stack: list["Object3D"] = [object3d]
+        while len(stack) > 0:
+            node = stack.pop()
+            assert node._transform_pool is self, f"{node.name} is not attached to this TransformPool"
+            index = node._transform_pool_index
+
+            node._trs = self._trs[index].copy()
+            node._trs_snapshot = self._trs_snapshot[index].copy()
+            node._local_matrix = self._local_matrices[index].copy()
+            node._world_matrix = self._world_matrices[index].copy()
+            node._world_matrix_version = int(self._world_versions[index])
+            node._parent_world_matrix_version = -1
+            node._transform_pool = None
+            node._transform_pool_index = -1
+
+            self._used[index] = False
+            self._world_dirty[index] = False
+            self._trs_snapshot[index] = np.nan
+            self._objects[index] = None
+            self._free_indices.append(index)
+
+            stack.extend(node._children)
+
+        self._levels = None
+        Object3D._trs_binding_version += 1
+
+    def detach(self) -> None:
+        """Detach the whole scene graph from the pool. The pool is unusable afterward."""
+        self.detach_subtree(self._root)
+
+    # =============================================================================
+    # Update
+    # =============================================================================
+
+    def update_world_matrices(self) -> int:
+        """
+        Update the local and world matrices of all the objects whose transform, or ancestors transform, changed.
+
+        Returns:
+            int: number of objects whose world matrix got recomputed.
+        """
+        if self._levels is None:
+            self._build_levels()
+        assert self._levels is not None
+
+        size = self._size
+        trs = self._trs[:size]
+        trs_snapshot = self._trs_snapshot[:size]
+        local_matrices = self._local_matrices[:size]
+        world_matrices = self._world_matrices[:size]
+        parent_indices = self._parent_indices[:size]
+
+        # find the changed local transforms - NaN snapshots are never equal, so new rows are dirty
+        local_dirty = np.any(trs != trs_snapshot, axis=1) & self._used[:size]
+        local_dirty_indices = np.flatnonzero(local_dirty)
+        if len(local_dirty_indices) > 0:
+            local_matrices[local_dirty_indices] = TransformPool.compose_local_matrices(trs[local_dirty_indices])
+            trs_snapshot[local_dirty_indices] = trs[local_dirty_indices]
+
+        # propagate world dirtiness down the hierarchy, one depth at a time
+        world_dirty = self._world_dirty[:size]
+        world_dirty |= local_dirty
+        for depth, level_indices in enumerate(self._levels):
+            if depth == 0:
+                dirty_indices = level_indices[world_dirty[level_indices]]
+                world_matrices[dirty_indices] = local_matrices[dirty_indices]
+                continue
+            world_dirty[level_indices] |= world_dirty[parent_indices[level_indices]]
+            dirty_indices = level_indices[world_dirty[level_indices]]
+            if len(dirty_indices) == 0:
+                continue
+            # first `local` then `parent's world`
+            world_matrices[dirty_indices] = np.matmul(local_matrices[dirty_indices], world_matrices[parent_indices[dirty_indices]])
+
+        updated_count = int(np.count_nonzero(world_dirty))
+        self._world_versions[:size][world_dirty] += 1
+        world_dirty[:] = False
+
+        return updated_count
+
+    @staticmethod
+    def compose_local_matrices(trs: np.ndarray) -> np.ndarray:
+        """
+        Compose local matrices from packed transforms, first `scale`, then `rotate`, then `translate`.
+
+        Arguments:
+            trs (np.ndarray): packed transforms (px, py, pz, qx, qy, qz, qw, sx, sy, sz), shape (N, 10)
+
+        Returns:
+            np.ndarray: local matrices in pyrr row-vector convention, shape (N, 4, 4)
+        """
+        qx, qy, qz, qw = trs[:, 3], trs[:, 4], trs[:, 5], trs[:, 6]
+
+        # same formula as pyrr matrix33.create_from_quaternion, normalizing the quaternion
+        sqx, sqy, sqz, sqw = qx * qx, qy * qy, qz * qz, qw * qw
+        invs = 1.0 / (sqx + sqy + sqz + sqw)
+        qxy, qzw, qxz, qyw, qyz, qxw = qx * qy, qz * qw, qx * qz, qy * qw, qy * qz, qx * qw
+
+        matrices = np.zeros((len(trs), 4, 4), dtype=np.float32)
+        matrices[:, 0, 0] = (sqx - sqy - sqz + sqw) * invs
+        matrices[:, 1, 1] = (-sqx + sqy - sqz + sqw) * invs
+        matrices[:, 2, 2] = (-sqx - sqy + sqz + sqw) * invs
+        matrices[:, 1, 0] = 2.0 * (qxy + qzw) * invs
+        matrices[:, 0, 1] = 2.0 * (qxy - qzw) * invs
+        matrices[:, 2, 0] = 2.0 * (qxz - qyw) * invs
+        matrices[:, 0, 2] = 2.0 * (qxz + qyw) * invs
+        matrices[:, 2, 1] = 2.0 * (qyz + qxw) * invs
+        matrices[:, 1, 2] = 2.0 * (qyz - qxw) * invs
+
+        # scale the rotation rows, then translate
+        matrices[:, :3, :3] *= trs[:, 7:10, np.newaxis]
+        matrices[:, 3, :3] = trs[:, 0:3]
+        matrices[:, 3, 3] = 1.0
+
+        return matrices
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate all the arrays to `capacity` rows, and rebind the views of the attached objects."""
+        extra_count = capacity - self._capacity
+
+        self._trs = np.concatenate([self._trs, np.tile(np.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 1], dtype=np.float32), (extra_count, 1))])
+        self._trs_snapshot = np.concatenate([self._trs_snapshot, np.full((extra_count, 10), np.nan, dtype=np.float32)])
+        identities = np.tile(np.eye(4, dtype=np.float32), (extra_count, 1, 1))
+        self._local_matrices = np.concatenate([self._local_matrices, identities])
+        self._world_matrices = np.concatenate([self._world_matrices, identities])
+        self._world_versions = np.concatenate([self._world_versions, np.zeros((extra_count,), dtype=np.int64)])
+        self._world_dirty = np.concatenate([self._world_dirty, np.zeros((extra_count,), dtype=bool)])
+        self._used = np.concatenate([self._used, np.zeros((extra_count,), dtype=bool)])
+        self._parent_indices = np.concatenate([self._parent_indices, np.full((extra_count,), -1, dtype=np.int64)])
+        self._objects.extend([None] * extra_count)
+        self._capacity = capacity
+
+        for index, object3d in enumerate(self._objects):
+            if object3d is not None:
+                self._bind_views(object3d, index)
+
+    def _bind_views(self, object3d: "Object3D", index: int) -> None:
+        object3d._trs = self._trs[index]
+        object3d._trs_snapshot = self._trs_snapshot[index]
+        object3d._local_matrix = self._local_matrices[index]
+        object3d._world_matrix = self._world_matrices[index]
+
+    def _build_levels(self) -> None:
+        """Group the attached objects by hierarchy depth, and record the parent row of each object."""
+        levels: list[list[int]] = []
+        current_level: list["Object3D"] = [self._root]
+        while len(current_level) > 0:
+            next_level: list["Object3D"] = []
+            level_indices: list[int] = []
+            for object3d in current_level:
+                index = object3d._transform_pool_index
+                level_indices.append(index)
+                self._parent_indices[index] = object3d.parent._transform_pool_index if object3d.parent is not None else -1
+                next_level.extend(object3d._children)
+            levels.append(level_indices)
+            current_level = next_level
+
+        self._levels = [np.array(level_indices, dtype=np.int64) for level_indices in levels]
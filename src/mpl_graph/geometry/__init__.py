@@ -1,3 +1,5 @@
 from .geometry import Geometry
 from .mesh_geometry import MeshGeometry
+from .mesh_bvh import MeshBVH
 from .geometry_utils import GeometryUtils
+from .bounds_utils import BoundsUtils
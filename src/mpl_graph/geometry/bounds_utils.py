@@ -0,0 +1,75 @@
+# pip imports
+import numpy as np
+
+
+class BoundsUtils:
+    """
+    Helpers for bounding volumes.
+
+    - a bounding box is an axis-aligned box stored as np.ndarray of shape (2, 3): [min_xyz, max_xyz]
+    - a bounding sphere is stored as np.ndarray of shape (4,): [center_x, center_y, center_z, radius]
+
+    Matrices follow the pyrr row-vector convention used in the rest of the library: `world = local @ matrix`.
+    """
+
+    @staticmethod
+    def compute_bounding_box(vertices: np.ndarray) -> np.ndarray | None:
+        """Return the bounding box of `vertices` (shape [N, 3]), or None if there is no vertex."""
+        assert vertices.ndim == 2 and vertices.shape[1] == 3, f"vertices should be of shape [N, 3]. Got {vertices.shape}"
+        if len(vertices) == 0:
+            return None
+        return np.array([vertices.min(axis=0), vertices.max(axis=0)], dtype=np.float32)
+
+    @staticmethod
+    def compute_bounding_sphere(vertices: np.ndarray) -> np.ndarray | None:
+        """
+        Return a bounding sphere of `vertices` (shape [N, 3]), or None if there is no vertex.
+
+        The center is the center of the bounding box - not the smallest sphere, but tight enough and a single pass.
+        """
+        bounding_box = BoundsUtils.compute_bounding_box(vertices)
+        if bounding_box is None:
+            return None
+        center = (bounding_box[0] + bounding_box[1]) / 2.0
+        radius = np.sqrt(((vertices - center) ** 2).sum(axis=1).max())
+        return np.array([center[0], center[1], center[2], radius], dtype=np.float32)
+
+    @staticmethod
+    def transform_bounding_box(bounding_box: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Return the bounding box of `bounding_box` once transformed by `matrix` (shape [4, 4]).
+
+        Transforms the center and the half extent (Arvo's method), so there is no need to transform the 8 corners.
+        """
+        center = (bounding_box[0] + bounding_box[1]) / 2.0
+        half_extent = (bounding_box[1] - bounding_box[0]) / 2.0
+
+        center_transformed = center @ matrix[:3, :3] + matrix[3, :3]
+        half_extent_transformed = half_extent @ np.abs(matrix[:3, :3])
+
+        return np.array([center_transformed - half_extent_transformed, center_transformed + half_extent_transformed], dtype=np.float32)
+
+    @staticmethod
+    def transform_bounding_sphere(bounding_sphere: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Return a bounding sphere of `bounding_sphere` once transformed by `matrix` (shape [4, 4]). The radius is scaled by the largest axis scale."""
+        center_transformed = bounding_sphere[:3] @ matrix[:3, :3] + matrix[3, :3]
+        max_scale = np.sqrt((matrix[:3, :3] ** 2).sum(axis=1).max())
+        radius_transformed = bounding_sphere[3] * max_scale
+        return np.array([center_transformed[0], center_transformed[1], center_transformed[2], radius_transformed], dtype=np.float32)
+
+    @staticmethod
+    def merge_bounding_boxes(bounding_boxes: list[np.ndarray]) -> np.ndarray | None:
+        """Return the bounding box containing all `bounding_boxes`, or None if the list is empty."""
+        if len(bounding_boxes) == 0:
+            return None
+        if len(bounding_boxes) == 1:
+            return bounding_boxes[0]
+        stacked = np.stack(bounding_boxes)
+        return np.array([stacked[:, 0].min(axis=0), stacked[:, 1].max(axis=0)], dtype=np.float32)
+
+    @staticmethod
+    def bounding_box_to_sphere(bounding_box: np.ndarray) -> np.ndarray:
+        """Return the bounding sphere of a bounding box."""
+        center = (bounding_box[0] + bounding_box[1]) / 2.0
+        radius = np.linalg.norm(bounding_box[1] - center)
+        return np.array([center[0], center[1], center[2], radius], dtype=np.float32)
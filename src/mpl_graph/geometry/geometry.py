@@ -1,6 +1,9 @@
 # pip imports
 import numpy as np
 
+# local imports
+from .bounds_utils import BoundsUtils
+
 
 class Geometry:
     def __init__(self, vertices: np.ndarray | None = None) -> None:
@@ -12,8 +15,66 @@ class Geometry:
         """
 
         # assign attributes
-        self.vertices: np.ndarray = vertices if vertices is not None else np.zeros((0, 3)).astype(np.float32)
-        """array of vertex coordinates, shape (N, 3)"""
+        self.vertices = vertices if vertices is not None else np.zeros((0, 3)).astype(np.float32)
 
         # sanity check - make sure we have triangular faces
         assert self.vertices.ndim == 2 and self.vertices.shape[1] == 3, f"vertices_coords should be of shape [N, 3], got {self.vertices.shape}"
+
+    # =============================================================================
+    # vertices
+    # =============================================================================
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """array of vertex coordinates, shape (N, 3)"""
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: np.ndarray) -> None:
+        self._vertices = vertices
+        self.mark_dirty()
+
+    # =============================================================================
+    # Version
+    # =============================================================================
+
+    _version: int = 0
+
+    @property
+    def version(self) -> int:
+        """Counter incremented each time the geometry changes. Compare it with a stored value to know if cached data is stale."""
+        return self._version
+
+    def mark_dirty(self) -> None:
+        """
+        Increment the version, dropping the data cached from the geometry, e.g. the bounding volumes.
+        Assigning an attribute, e.g. `.vertices`, does it automatically.
+
+        Call it after editing the arrays in place, e.g. `geometry.vertices[0, 0] = 1.0`.
+        """
+        self._version += 1
+
+    def invalidate_bounds(self) -> None:
+        """Same as `mark_dirty()`."""
+        self.mark_dirty()
+
+    # =============================================================================
+    # Bounding volumes
+    # =============================================================================
+
+    _bounding_box_version: int = -1
+    _bounding_sphere_version: int = -1
+
+    def get_bounding_box(self) -> np.ndarray | None:
+        """Return the local space bounding box [min_xyz, max_xyz] of the vertices, shape (2, 3). None if there is no vertex. Cached."""
+        if self._bounding_box_version != self._version:
+            self._bounding_box: np.ndarray | None = BoundsUtils.compute_bounding_box(self._vertices)
+            self._bounding_box_version = self._version
+        return self._bounding_box
+
+    def get_bounding_sphere(self) -> np.ndarray | None:
+        """Return the local space bounding sphere [center_xyz, radius] of the vertices, shape (4,). None if there is no vertex. Cached."""
+        if self._bounding_sphere_version != self._version:
+            self._bounding_sphere: np.ndarray | None = BoundsUtils.compute_bounding_sphere(self._vertices)
+            self._bounding_sphere_version = self._version
+        return self._bounding_sphere
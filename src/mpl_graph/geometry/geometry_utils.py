@@ -39,6 +39,57 @@ class GeometryUtils:
 
         return vertices_ndc, vertices_clip
 
+    @staticmethod
+    def apply_mvp_matrix_homogeneous(vertices: np.ndarray, transform_matrix: np.ndarray) -> np.ndarray:
+        """
+        Return the homogeneous clip space coordinates of the vertices, shape [N, 4], without perspective divide.
+
+        Use it to clip in clip space before dividing by w - see RendererUtils.clip_triangles_near_plane().
+        """
+        # sanity checks
+        assert vertices.shape[1] == 3 and vertices.ndim == 2, f"vertices should be of shape [N, 3]. Got {vertices.shape}"
+        assert transform_matrix.shape == (4, 4), f"transform should be of shape [4, 4]. Got {transform_matrix.shape}"
+
+        # apply full transform to homogeneous vertices
+        vertices_clip = vertices @ transform_matrix[:3] + transform_matrix[3]  # [N, 4]
+        return vertices_clip
+
+    @staticmethod
+    def apply_world_and_mvp_matrices(
+        vertices: np.ndarray, world_matrix: np.ndarray, mvp_matrix: np.ndarray, out: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the world space coordinates [N, 3] and the homogeneous clip space coordinates [N, 4] of the vertices, in a single pass.
+
+        Both matrices are stacked into one [4, 7] matrix, so the vertices are read and multiplied once, without building
+        homogeneous coordinates. The world matrix must be affine, as for any Object3D. There is no perspective divide,
+        see apply_mvp_matrix_homogeneous().
+
+        Arguments:
+            vertices (np.ndarray): local space coordinates, shape [N, 3]
+            world_matrix (np.ndarray): world matrix, shape [4, 4]
+            mvp_matrix (np.ndarray): model-view-projection matrix, shape [4, 4]
+            out (np.ndarray | None): optional buffer of shape [N, 7] to write into - reuse it across frames to avoid allocations
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: world and clip space coordinates - both are views on `out` when it is given
+        """
+        # sanity checks
+        assert vertices.shape[1] == 3 and vertices.ndim == 2, f"vertices should be of shape [N, 3]. Got {vertices.shape}"
+        assert world_matrix.shape == (4, 4), f"world_matrix should be of shape [4, 4]. Got {world_matrix.shape}"
+        assert mvp_matrix.shape == (4, 4), f"mvp_matrix should be of shape [4, 4]. Got {mvp_matrix.shape}"
+
+        # [4, 7] matrix: world xyz columns, then the mvp columns
+        stacked_matrix = np.concatenate([world_matrix[:, :3], mvp_matrix], axis=1)
+        if out is not None:
+            assert out.shape == (vertices.shape[0], 7), f"out should be of shape [{vertices.shape[0]}, 7]. Got {out.shape}"
+
+        # one matmul for both transforms, the translation row is added in place
+        vertices_out = np.matmul(vertices, stacked_matrix[:3], out=out)  # [N, 7]
+        vertices_out += stacked_matrix[3]
+
+        return vertices_out[:, :3], vertices_out[:, 3:]
+
     @staticmethod
     def apply_transform(vertices: np.ndarray, transform_matrix: np.ndarray) -> np.ndarray:
         # sanity checks
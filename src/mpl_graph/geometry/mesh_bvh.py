@@ -0,0 +1,215 @@
+# pip imports
+import numpy as np
+
+
+class MeshBVH:
+    """
+    Bounding volume hierarchy over the triangles of a mesh, to intersect rays without testing every triangle.
+
+    It is built without recursion nor python loop over the nodes:
+    - the triangles are sorted along a Morton curve of their centroids, then grouped by `leaf_size` into leaves
+    - the leaves are the last level of a complete binary tree, stored as a heap: the children of node i are 2i+1 and 2i+2
+    - the bounding box of a node merges the bounding boxes of its children, computed one level at a time
+
+    Rays are intersected in the local space of the mesh. Use MeshGeometry.get_bvh() to get a cached one.
+    """
+
+    def __init__(self, vertices: np.ndarray, indices: np.ndarray, leaf_size: int = 8) -> None:
+        # sanity checks
+        assert vertices.ndim == 2 and vertices.shape[1] == 3, f"vertices should be of shape [N, 3]. Got {vertices.shape}"
+        assert indices.ndim == 2 and indices.shape[1] == 3, f"indices should be of shape [M, 3]. Got {indices.shape}"
+        assert len(indices) > 0, "The mesh must have at least one face"
+        assert leaf_size > 0, f"leaf_size should be > 0. Got {leaf_size}"
+
+        faces_vertices = vertices[indices].astype(np.float32)
+
+        # =============================================================================
+        # Sort the faces along a Morton curve, so close faces end up in the same leaves
+        # =============================================================================
+        faces_centroids = faces_vertices.mean(axis=1)
+        centroids_min = faces_centroids.min(axis=0)
+        centroids_extent = np.maximum(faces_centroids.max(axis=0) - centroids_min, 1e-12)
+        faces_cells = ((faces_centroids - centroids_min) / centroids_extent * 1023).astype(np.uint64)
+        faces_order = np.argsort(MeshBVH._compute_morton_codes(faces_cells), kind="stable")
+
+        self.leaf_size = leaf_size
+        """number of faces per leaf."""
+        self.face_count = len(indices)
+        """number of faces in the bvh."""
+        self._faces_indices: np.ndarray = faces_order
+        """index in the geometry of each sorted face, shape [M]"""
+        self._faces_vertices: np.ndarray = faces_vertices[faces_order]
+        """vertices of each sorted face, shape [M, 3, 3]"""
+
+        # =============================================================================
+        # Compute the bounding box of all nodes, from the leaves to the root
+        # =============================================================================
+        leaf_count = (self.face_count + leaf_size - 1) // leaf_size
+        self._level_count = int(np.ceil(np.log2(leaf_count))) if leaf_count > 1 else 0
+        """number of levels below the root. The leaves are at this level."""
+        self._leaf_offset = 2**self._level_count - 1
+        """index of the first leaf node."""
+        node_count = 2 ** (self._level_count + 1) - 1
+
+        # the leaves padding the tree are empty - min = +inf and max = -inf
+        self._nodes_bounding_box = np.empty((node_count, 2, 3), dtype=np.float32)
+        """bounding box [min_xyz, max_xyz] of each node, shape [node_count, 2, 3]"""
+        self._nodes_bounding_box[:, 0] = np.inf
+        self._nodes_bounding_box[:, 1] = -np.inf
+
+        leaves_start = np.arange(0, self.face_count, leaf_size)
+        leaves_slice = slice(self._leaf_offset, self._leaf_offset + leaf_count)
+        self._nodes_bounding_box[leaves_slice, 0] = np.minimum.reduceat(self._faces_vertices.min(axis=1), leaves_start, axis=0)
+        self._nodes_bounding_box[leaves_slice, 1] = np.maximum.reduceat(self._faces_vertices.max(axis=1), leaves_start, axis=0)
+
+        for level in range(self._level_count - 1, -1, -1):
+            nodes_index = np.arange(2**level - 1, 2 ** (level + 1) - 1)
+            children_bounding_box_a = self._nodes_bounding_box[2 * nodes_index + 1]
+            children_bounding_box_b = self._nodes_bounding_box[2 * nodes_index + 2]
+            self._nodes_bounding_box[nodes_index, 0] = np.minimum(children_bounding_box_a[:, 0], children_bounding_box_b[:, 0])
+            self._nodes_bounding_box[nodes_index, 1] = np.maximum(children_bounding_box_a[:, 1], children_bounding_box_b[:, 1])
+
+        self._nodes_empty: np.ndarray = self._nodes_bounding_box[:, 0, 0] > self._nodes_bounding_box[:, 1, 0]
+        """True for the nodes without any face, shape [node_count]"""
+
+    # =============================================================================
+    # Intersection
+    # =============================================================================
+
+    def intersect_rays(
+        self, origins: np.ndarray, directions: np.ndarray, near: float = 0.0, far: float = np.inf
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersect rays with the triangles of the mesh, and return the closest hit of each ray.
+        The distance is in unit of direction length, so normalize the directions to get distances.
+
+        Arguments:
+            origins (np.ndarray): ray origins, shape [R, 3]
+            directions (np.ndarray): ray directions, shape [R, 3]
+            near (float): hits closer than this distance are ignored
+            far (float): hits further than this distance are ignored
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]:
+            - faces_index, shape [R]: index of the hit face in the geometry, -1 if no hit
+            - distances, shape [R]: distance along the ray, +inf if no hit
+            - barycentrics, shape [R, 3]: barycentric coordinates of the hit point in the face
+        """
+        assert origins.ndim == 2 and origins.shape[1] == 3, f"origins should be of shape [R, 3]. Got {origins.shape}"
+        assert directions.shape == origins.shape, f"directions should be of shape {origins.shape}. Got {directions.shape}"
+
+        ray_count = len(origins)
+        with np.errstate(divide="ignore"):
+            inv_directions = 1.0 / directions
+
+        # =============================================================================
+        # Go down the tree, one level at a time, keeping the (ray, node) pairs which hit the node bounding box
+        # =============================================================================
+        rays_index = np.arange(ray_count)
+        nodes_index = np.zeros(ray_count, dtype=np.int64)
+        for level in range(self._level_count + 1):
+            nodes_hit = ~self._nodes_empty[nodes_index] & MeshBVH.intersect_rays_boxes(
+                origins[rays_index], inv_directions[rays_index], self._nodes_bounding_box[nodes_index], near, far
+            )
+            rays_index = rays_index[nodes_hit]
+            nodes_index = nodes_index[nodes_hit]
+            if level < self._level_count:
+                rays_index = np.repeat(rays_index, 2)
+                nodes_index = (2 * nodes_index[:, np.newaxis] + np.array([1, 2])).ravel()
+
+        # =============================================================================
+        # Intersect the rays with the faces of the leaves they hit
+        # =============================================================================
+        faces_sorted_index = ((nodes_index - self._leaf_offset) * self.leaf_size)[:, np.newaxis] + np.arange(self.leaf_size)
+        rays_index = np.broadcast_to(rays_index[:, np.newaxis], faces_sorted_index.shape)
+        faces_valid = faces_sorted_index < self.face_count
+        faces_sorted_index = faces_sorted_index[faces_valid]
+        rays_index = rays_index[faces_valid]
+
+        faces_vertices = self._faces_vertices[faces_sorted_index]
+        distances, barycentrics_u, barycentrics_v = MeshBVH.intersect_triangles(
+            origins[rays_index], directions[rays_index], faces_vertices[:, 0], faces_vertices[:, 1], faces_vertices[:, 2]
+        )
+        candidates_hit = np.isfinite(distances) & (distances >= near) & (distances <= far)
+
+        # =============================================================================
+        # Keep the closest hit of each ray
+        # =============================================================================
+        hits_index = np.flatnonzero(candidates_hit)
+        hits_order = hits_index[np.lexsort((distances[hits_index], rays_index[hits_index]))]
+        hits_first = np.ones(len(hits_order), dtype=bool)
+        hits_first[1:] = rays_index[hits_order][1:] != rays_index[hits_order][:-1]
+        hits_closest = hits_order[hits_first]
+        hits_ray = rays_index[hits_closest]
+
+        faces_index = np.full(ray_count, -1, dtype=np.int64)
+        faces_index[hits_ray] = self._faces_indices[faces_sorted_index[hits_closest]]
+        hits_distance = np.full(ray_count, np.inf)
+        hits_distance[hits_ray] = distances[hits_closest]
+        barycentrics = np.zeros((ray_count, 3))
+        barycentrics[hits_ray, 1] = barycentrics_u[hits_closest]
+        barycentrics[hits_ray, 2] = barycentrics_v[hits_closest]
+        barycentrics[hits_ray, 0] = 1.0 - barycentrics[hits_ray, 1] - barycentrics[hits_ray, 2]
+
+        return faces_index, hits_distance, barycentrics
+
+    @staticmethod
+    def intersect_rays_boxes(origins: np.ndarray, inv_directions: np.ndarray, bounding_boxes: np.ndarray, near: float, far: float) -> np.ndarray:
+        """
+        Slab test between rays (shape [R, 3], with 1 / direction) and bounding boxes (shape [R, 2, 3]), one box per ray.
+
+        Returns:
+            np.ndarray: boolean array of shape [R], True if the ray hits the box between near and far
+        """
+        with np.errstate(invalid="ignore"):
+            distances_a = (bounding_boxes[:, 0] - origins) * inv_directions
+            distances_b = (bounding_boxes[:, 1] - origins) * inv_directions
+        # fmin/fmax ignore the nan of a ray parallel to a slab, and starting on its border
+        distances_enter = np.fmax(np.fmin(distances_a, distances_b).max(axis=1), near)
+        distances_exit = np.fmin(np.fmax(distances_a, distances_b).min(axis=1), far)
+        return distances_enter <= distances_exit
+
+    @staticmethod
+    def intersect_triangles(
+        origins: np.ndarray, directions: np.ndarray, vertices_0: np.ndarray, vertices_1: np.ndarray, vertices_2: np.ndarray, epsilon: float = 1e-12
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized Möller-Trumbore ray/triangle intersection - one triangle per ray, all arrays of shape [R, 3].
+        Both sides of the triangles are hit.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: distances (+inf if no hit), barycentrics u and v - all of shape [R]
+        """
+        edges_1 = vertices_1 - vertices_0
+        edges_2 = vertices_2 - vertices_0
+        p = np.cross(directions, edges_2)
+        determinants = (edges_1 * p).sum(axis=1)
+        parallel = np.abs(determinants) < epsilon
+        inv_determinants = 1.0 / np.where(parallel, 1.0, determinants)
+
+        s = origins - vertices_0
+        barycentrics_u = (s * p).sum(axis=1) * inv_determinants
+        q = np.cross(s, edges_1)
+        barycentrics_v = (directions * q).sum(axis=1) * inv_determinants
+        distances = (edges_2 * q).sum(axis=1) * inv_determinants
+
+        hit = ~parallel & (barycentrics_u >= 0.0) & (barycentrics_v >= 0.0) & (barycentrics_u + barycentrics_v <= 1.0) & (distances >= 0.0)
+        distances = np.where(hit, distances, np.inf)
+        return distances, barycentrics_u, barycentrics_v
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    @staticmethod
+    def _compute_morton_codes(cells: np.ndarray) -> np.ndarray:
+        """Interleave the bits of integer coordinates in [0, 1023], shape [N, 3], into 30 bits Morton codes, shape [N]."""
+
+        def spread_bits(values: np.ndarray) -> np.ndarray:
+            values = (values | (values << np.uint64(16))) & np.uint64(0x030000FF)
+            values = (values | (values << np.uint64(8))) & np.uint64(0x0300F00F)
+            values = (values | (values << np.uint64(4))) & np.uint64(0x030C30C3)
+            values = (values | (values << np.uint64(2))) & np.uint64(0x09249249)
+            return values
+
+        return (spread_bits(cells[:, 0]) << np.uint64(2)) | (spread_bits(cells[:, 1]) << np.uint64(1)) | spread_bits(cells[:, 2])
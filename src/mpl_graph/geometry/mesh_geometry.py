@@ -4,6 +4,7 @@ from pyrr import vector3, vector4
 
 # local imports
 from .geometry import Geometry
+from .mesh_bvh import MeshBVH
 
 
 class MeshGeometry(Geometry):
@@ -28,16 +29,16 @@ class MeshGeometry(Geometry):
         """
 
         # assign attributes
-        self.vertices: np.ndarray = vertices if vertices is not None else np.array([0.0, 0.0, 0.0], dtype=np.float32).reshape((1, 3))
+        self.vertices = vertices if vertices is not None else np.array([0.0, 0.0, 0.0], dtype=np.float32).reshape((1, 3))
         """array of vertex coordinates, shape (N, 3)"""
 
-        self.indices: np.ndarray = indices if indices is not None else np.array([0, 0, 0], dtype=np.int32).reshape((1, 3))
+        self.indices = indices if indices is not None else np.array([0, 0, 0], dtype=np.int32).reshape((1, 3))
         """array of face indices, shape (M, 3) or None if there is no face"""
 
-        self.uvs: np.ndarray | None = uvs
+        self.uvs = uvs
         """array of texture coordinates, shape (N, 2) or None if there is no texture"""
 
-        self.normals: np.ndarray | None = normals
+        self.normals = normals
         """array of normal coordinates, shape (N, 3) or None if there is no normal"""
 
         # sanity check - make sure we have triangular faces
@@ -50,6 +51,53 @@ class MeshGeometry(Geometry):
             assert self.normals.ndim == 2 and self.normals.shape[1] == 3, f"normals should be of shape [N, 3], got {self.normals.shape}"
             assert len(self.normals) == len(self.vertices), "The number of normals must be equal to the number of vertices"
 
+    # =============================================================================
+    # indices/uvs/normals
+    # =============================================================================
+
+    @property
+    def indices(self) -> np.ndarray:
+        """array of face indices, shape (M, 3)"""
+        return self._indices
+
+    @indices.setter
+    def indices(self, indices: np.ndarray) -> None:
+        self._indices = indices
+        self.mark_dirty()
+
+    @property
+    def uvs(self) -> np.ndarray | None:
+        """array of texture coordinates, shape (N, 2) or None if there is no texture"""
+        return self._uvs
+
+    @uvs.setter
+    def uvs(self, uvs: np.ndarray | None) -> None:
+        self._uvs = uvs
+        self.mark_dirty()
+
+    @property
+    def normals(self) -> np.ndarray | None:
+        """array of normal coordinates, shape (N, 3) or None if there is no normal"""
+        return self._normals
+
+    @normals.setter
+    def normals(self, normals: np.ndarray | None) -> None:
+        self._normals = normals
+        self.mark_dirty()
+
+    # =============================================================================
+    # Bounding volumes
+    # =============================================================================
+
+    _bvh_version: int = -1
+
+    def get_bvh(self) -> MeshBVH:
+        """Return the bounding volume hierarchy of the faces, used to intersect rays. Cached until the geometry version changes."""
+        if self._bvh_version != self._version:
+            self._bvh = MeshBVH(self.vertices, self.indices)
+            self._bvh_version = self._version
+        return self._bvh
+
     def copy(self) -> "MeshGeometry":
         return MeshGeometry(
             vertices=self.vertices.copy(),
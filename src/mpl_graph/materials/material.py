@@ -1,4 +1,25 @@
+# stdlib imports
+from typing import Any
+
+
 class Material:
     """A simple material class to hold material properties."""
 
+    _version: int = 0
+
     def __init__(self): ...
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # any public attribute assignment, e.g. `material.colors = ...`, changes the version
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_version", self._version + 1)
+
+    @property
+    def version(self) -> int:
+        """Counter incremented each time the material changes. Compare it with a stored value to know if cached data is stale."""
+        return self._version
+
+    def mark_dirty(self) -> None:
+        """Increment the version. Assigning an attribute does it automatically, call it after editing an array in place, e.g. `material.colors[0] = ...`."""
+        super().__setattr__("_version", self._version + 1)
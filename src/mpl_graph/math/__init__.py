@@ -1 +1,4 @@
 from .transform_utils import TransformUtils
+from .frustum_utils import FrustumUtils
+from .raycaster import Raycaster, RaycasterHit
+from .grid_index_2d import GridIndex2D
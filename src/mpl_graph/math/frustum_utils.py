@@ -0,0 +1,79 @@
+# pip imports
+import numpy as np
+
+# local imports
+from ..cameras.camera import Camera
+
+
+class FrustumUtils:
+    """
+    View-frustum helpers, used to skip objects which can not be visible from a camera.
+
+    A frustum is stored as np.ndarray of shape (6, 4): one plane (a, b, c, d) per row, in order left, right, bottom, top, near, far.
+    A point (x, y, z) is inside a plane when `a*x + b*y + c*z + d >= 0`.
+    """
+
+    PLANE_LEFT = 0
+    PLANE_RIGHT = 1
+    PLANE_BOTTOM = 2
+    PLANE_TOP = 3
+    PLANE_NEAR = 4
+    PLANE_FAR = 5
+
+    @staticmethod
+    def compute_frustum_planes(view_projection_matrix: np.ndarray) -> np.ndarray:
+        """
+        Extract the world space frustum planes from a view-projection matrix (Gribb & Hartmann).
+
+        The matrix follows the pyrr row-vector convention: `clip = [x, y, z, 1] @ view_projection_matrix`,
+        so the planes are built from its columns.
+        """
+        assert view_projection_matrix.shape == (4, 4), f"view_projection_matrix should be of shape [4, 4]. Got {view_projection_matrix.shape}"
+
+        m = view_projection_matrix.astype(np.float64)
+        planes = np.array(
+            [
+                m[:, 3] + m[:, 0],  # left
+                m[:, 3] - m[:, 0],  # right
+                m[:, 3] + m[:, 1],  # bottom
+                m[:, 3] - m[:, 1],  # top
+                m[:, 3] + m[:, 2],  # near
+                m[:, 3] - m[:, 2],  # far
+            ]
+        )
+
+        # normalize the planes, so the plane equation gives a distance
+        normals_length = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        planes = planes / normals_length
+        return planes
+
+    @staticmethod
+    def compute_camera_frustum_planes(camera: Camera) -> np.ndarray:
+        """Extract the world space frustum planes of a camera. Its world matrix must be up to date."""
+        view_projection_matrix = camera.get_view_projection_matrix()
+        return FrustumUtils.compute_frustum_planes(view_projection_matrix)
+
+    @staticmethod
+    def is_bounding_box_outside(frustum_planes: np.ndarray, bounding_box: np.ndarray) -> bool:
+        """
+        Return True if the bounding box [min_xyz, max_xyz] is entirely outside the frustum.
+
+        Conservative: a box outside of the frustum, but not entirely behind a single plane, is reported as inside.
+        """
+        # for each plane, the box corner the furthest along the plane normal
+        corners = np.where(frustum_planes[:, :3] >= 0, bounding_box[1], bounding_box[0])
+        distances = (corners * frustum_planes[:, :3]).sum(axis=1) + frustum_planes[:, 3]
+        return bool((distances < 0).any())
+
+    @staticmethod
+    def are_bounding_boxes_outside(frustum_planes: np.ndarray, bounding_boxes: np.ndarray) -> np.ndarray:
+        """Vectorized `is_bounding_box_outside()` for bounding boxes of shape (N, 2, 3). Returns a boolean array of shape (N,)."""
+        corners = np.where(frustum_planes[np.newaxis, :, :3] >= 0, bounding_boxes[:, np.newaxis, 1], bounding_boxes[:, np.newaxis, 0])
+        distances = (corners * frustum_planes[np.newaxis, :, :3]).sum(axis=2) + frustum_planes[np.newaxis, :, 3]
+        return (distances < 0).any(axis=1)
+
+    @staticmethod
+    def is_bounding_sphere_outside(frustum_planes: np.ndarray, bounding_sphere: np.ndarray) -> bool:
+        """Return True if the bounding sphere [center_xyz, radius] is entirely outside the frustum."""
+        distances = frustum_planes[:, :3] @ bounding_sphere[:3] + frustum_planes[:, 3]
+        return bool((distances < -bounding_sphere[3]).any())
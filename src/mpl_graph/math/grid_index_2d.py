@@ -0,0 +1,91 @@
+# pip imports
+import numpy as np
+
+
+class GridIndex2D:
+    def __init__(self, points_2d: np.ndarray, points_per_cell: int = 4) -> None:
+        """
+        Uniform grid over 2D points, to find the nearest point to a position without testing them all.
+
+        The grid is built lazily on the first query, so creating one for each frame costs nothing until queried.
+        The points must not be modified after creation.
+
+        Arguments:
+            points_2d (np.ndarray): points coordinates, shape (N, 2). Non finite points are ignored.
+            points_per_cell (int): average number of points per cell
+        """
+        assert points_2d.ndim == 2 and points_2d.shape[1] == 2, f"points_2d should be of shape [N, 2]. Got {points_2d.shape}"
+        assert points_per_cell > 0, f"points_per_cell should be > 0. Got {points_per_cell}"
+
+        self.points_2d: np.ndarray = points_2d
+        """points coordinates, shape (N, 2)"""
+        self.points_per_cell: int = points_per_cell
+        """average number of points per cell"""
+
+        self._grid_size: int = 0
+        """number of cells along each axis"""
+        self._grid_min: np.ndarray = np.zeros(2)
+        """coordinates of the grid corner"""
+        self._cell_size: np.ndarray = np.ones(2)
+        """size of a cell along each axis"""
+        self._sorted_indices: np.ndarray | None = None
+        """point indices sorted by cell, row major. None until the grid is built"""
+        self._cell_starts: np.ndarray = np.zeros(1, dtype=np.int64)
+        """start of each cell in `_sorted_indices`, shape (grid_size * grid_size + 1,)"""
+
+    def query_nearest(self, x: float, y: float, radius: float) -> tuple[int, float]:
+        """
+        Return the index of the nearest point to (x, y) within radius, and its distance. (-1, inf) if there is none.
+        """
+        if self._sorted_indices is None:
+            self._build()
+        assert self._sorted_indices is not None
+
+        if len(self._sorted_indices) == 0:
+            return -1, np.inf
+
+        # range of cells overlapping the square around the query circle
+        position = np.array([x, y])
+        cell_min = np.floor((position - radius - self._grid_min) / self._cell_size).astype(np.int64)
+        cell_max = np.floor((position + radius - self._grid_min) / self._cell_size).astype(np.int64)
+        if np.any(cell_max < 0) or np.any(cell_min >= self._grid_size):
+            return -1, np.inf
+        cell_min = np.clip(cell_min, 0, self._grid_size - 1)
+        cell_max = np.clip(cell_max, 0, self._grid_size - 1)
+
+        # the cells of a row are contiguous in _sorted_indices, so gather one slice per row
+        rows_start = self._cell_starts[np.arange(cell_min[1], cell_max[1] + 1) * self._grid_size + cell_min[0]]
+        rows_end = self._cell_starts[np.arange(cell_min[1], cell_max[1] + 1) * self._grid_size + cell_max[0] + 1]
+        candidates = np.concatenate([self._sorted_indices[row_start:row_end] for row_start, row_end in zip(rows_start, rows_end)])
+        if len(candidates) == 0:
+            return -1, np.inf
+
+        # keep the nearest candidate within radius
+        distances = np.sqrt(((self.points_2d[candidates] - position) ** 2).sum(axis=1))
+        nearest = int(np.argmin(distances))
+        if distances[nearest] > radius:
+            return -1, np.inf
+        return int(candidates[nearest]), float(distances[nearest])
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    def _build(self) -> None:
+        points_indices = np.flatnonzero(np.isfinite(self.points_2d).all(axis=1))
+        points_2d = self.points_2d[points_indices]
+        if len(points_2d) == 0:
+            self._sorted_indices = points_indices
+            return
+
+        # pick the grid size to get `points_per_cell` points per cell on average
+        self._grid_size = max(1, int(np.sqrt(len(points_2d) / self.points_per_cell)))
+        self._grid_min = points_2d.min(axis=0)
+        grid_extent = points_2d.max(axis=0) - self._grid_min
+        self._cell_size = np.maximum(grid_extent / self._grid_size, 1e-12)
+
+        # sort the points by cell
+        cells_xy = np.clip(((points_2d - self._grid_min) / self._cell_size).astype(np.int64), 0, self._grid_size - 1)
+        cells_index = cells_xy[:, 1] * self._grid_size + cells_xy[:, 0]
+        self._sorted_indices = points_indices[np.argsort(cells_index, kind="stable")]
+        self._cell_starts = np.concatenate([[0], np.cumsum(np.bincount(cells_index, minlength=self._grid_size * self._grid_size))])
@@ -0,0 +1,110 @@
+# pip imports
+import numpy as np
+
+# local imports
+from ..cameras.camera import Camera
+from ..core.object_3d import Object3D
+from ..geometry.mesh_bvh import MeshBVH
+from ..objects.mesh import Mesh
+
+
+class RaycasterHit:
+    __slots__ = ("object3d", "face_index", "barycentric", "distance", "point")
+
+    def __init__(self, object3d: Mesh, face_index: int, barycentric: np.ndarray, distance: float, point: np.ndarray) -> None:
+        """
+        An intersection between a ray and a mesh face, as returned by Raycaster.
+        """
+        self.object3d: Mesh = object3d
+        """the mesh which got hit"""
+        self.face_index: int = face_index
+        """index of the hit face in `object3d.geometry.indices`"""
+        self.barycentric: np.ndarray = barycentric
+        """barycentric coordinates of the hit point in the face, shape (3,)"""
+        self.distance: float = distance
+        """distance from the ray origin to the hit point, in world space"""
+        self.point: np.ndarray = point
+        """hit point in world space, shape (3,)"""
+
+
+class Raycaster:
+    def __init__(self, origin: np.ndarray | None = None, direction: np.ndarray | None = None, near: float = 0.0, far: float = np.inf) -> None:
+        """
+        Intersect a ray with the meshes of a scene - e.g. to find what the user clicked on.
+
+        Each mesh is tested in its local space with the bvh cached on its geometry, so the world matrices must be up to date.
+        """
+        self.origin: np.ndarray = np.zeros(3)
+        """origin of the ray in world space, shape (3,)"""
+        self.direction: np.ndarray = np.array([0.0, 0.0, -1.0])
+        """unit direction of the ray in world space, shape (3,)"""
+        self.near: float = near
+        """hits closer than this distance are ignored"""
+        self.far: float = far
+        """hits further than this distance are ignored"""
+
+        self.set(origin if origin is not None else self.origin, direction if direction is not None else self.direction)
+
+    def set(self, origin: np.ndarray, direction: np.ndarray) -> None:
+        """Set the ray, the direction gets normalized."""
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.direction = np.asarray(direction, dtype=np.float64) / np.linalg.norm(direction)
+
+    def set_from_camera(self, ndc_x: float, ndc_y: float, camera: Camera) -> None:
+        """
+        Set the ray going from the camera through a point in normalized device coordinates (NDC), in [-1, 1].
+        The renderer axes use NDC, so `event.xdata` and `event.ydata` of a matplotlib mouse event can be used directly.
+        """
+        inv_view_projection_matrix = np.linalg.inv(camera.get_view_matrix().astype(np.float64) @ camera.get_projection_matrix())
+        points_hom = np.array([[ndc_x, ndc_y, -1.0, 1.0], [ndc_x, ndc_y, 1.0, 1.0]]) @ inv_view_projection_matrix
+        point_near, point_far = points_hom[:, :3] / points_hom[:, 3:4]
+        self.set(point_near, point_far - point_near)
+
+    # =============================================================================
+    # Intersection
+    # =============================================================================
+
+    def intersect_object(self, object3d: Object3D, recursive: bool = True) -> list[RaycasterHit]:
+        """Return the hits of the ray with `object3d` (and its descendants if recursive), sorted from the closest."""
+        return self.intersect_objects([object3d], recursive=recursive)
+
+    def intersect_objects(self, objects: list[Object3D], recursive: bool = True) -> list[RaycasterHit]:
+        """Return the hits of the ray with `objects` (and their descendants if recursive), sorted from the closest. One hit per mesh."""
+        hits: list[RaycasterHit] = []
+        for object3d in objects:
+            meshes = object3d.iter_traverse(object_types=Mesh) if recursive else [object3d] if isinstance(object3d, Mesh) else []
+            for mesh in meshes:
+                hit = self._intersect_mesh(mesh)
+                if hit is not None:
+                    hits.append(hit)
+
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    def _intersect_mesh(self, mesh: Mesh) -> RaycasterHit | None:
+        # skip the mesh early if the ray misses its world bounding box
+        world_bounding_box = mesh.get_world_bounding_box()
+        if world_bounding_box is None:
+            return None
+        with np.errstate(divide="ignore"):
+            inv_direction = 1.0 / self.direction
+        if not MeshBVH.intersect_rays_boxes(self.origin[np.newaxis], inv_direction[np.newaxis], world_bounding_box[np.newaxis], self.near, self.far)[0]:
+            return None
+
+        # move the ray in the mesh local space - the direction is not normalized, so distances stay in world unit
+        inv_world_matrix = np.linalg.inv(mesh.get_world_matrix().astype(np.float64))
+        origin_local = self.origin @ inv_world_matrix[:3, :3] + inv_world_matrix[3, :3]
+        direction_local = self.direction @ inv_world_matrix[:3, :3]
+
+        bvh = mesh.geometry.get_bvh()
+        faces_index, distances, barycentrics = bvh.intersect_rays(origin_local[np.newaxis], direction_local[np.newaxis], self.near, self.far)
+        if faces_index[0] < 0:
+            return None
+
+        distance = float(distances[0])
+        point = self.origin + distance * self.direction
+        return RaycasterHit(mesh, int(faces_index[0]), barycentrics[0], distance, point)
@@ -25,6 +25,10 @@ class Lines(Object3D):
         # sanity checks
         assert len(self.geometry.vertices) % 2 == 0, f"Lines vertices length must be even, got {len(self.geometry.vertices)}"
 
+    def get_local_bounding_box(self) -> np.ndarray | None:
+        """Return the bounding box of the geometry, in local space."""
+        return self.geometry.get_bounding_box()
+
     @staticmethod
     def from_mesh_geometry(mesh_geometry: MeshGeometry, dedup_edges: bool = True) -> "Lines":
         """
@@ -39,5 +39,10 @@ class Mesh(Object3D):
             assert len(self.geometry.uvs) == len(
                 self.geometry.vertices
             ), f"The number of uvs must be equal to the number of vertices, got {len(self.geometry.uvs)} uvs and {len(self.geometry.vertices)} vertices"
-        else:
-            raise TypeError(f"The material must be of type MeshPhongMaterial or MeshBasicMaterial, got {type(self.material)}")
+        elif not isinstance(self.material, MeshMaterial):
+            # other MeshMaterial subclasses are rendered by the renderer registered with RendererMesh.register_material_renderer()
+            raise TypeError(f"The material must be a MeshMaterial, got {type(self.material)}")
+
+    def get_local_bounding_box(self) -> np.ndarray | None:
+        """Return the bounding box of the geometry, in local space."""
+        return self.geometry.get_bounding_box()
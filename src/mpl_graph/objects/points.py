@@ -21,3 +21,7 @@ class Points(Object3D):
         self.name = f"a {Points.__name__}"
         self.geometry: Geometry = geometry if geometry is not None else Geometry()
         self.material: PointsMaterial = material if material is not None else PointsMaterial()
+
+    def get_local_bounding_box(self) -> np.ndarray | None:
+        """Return the bounding box of the geometry, in local space."""
+        return self.geometry.get_bounding_box()
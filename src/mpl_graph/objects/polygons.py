@@ -40,6 +40,10 @@ class Polygons(Object3D):
         self.material: PolygonsMaterial = material if material is not None else PolygonsMaterial()
         """Material object containing the material properties."""
 
+    def get_local_bounding_box(self) -> np.ndarray | None:
+        """Return the bounding box of the geometry, in local space."""
+        return self.geometry.get_bounding_box()
+
     @staticmethod
     def from_mesh_geometry(geometry: MeshGeometry) -> "Polygons":
         """
@@ -1,7 +1,67 @@
+# stdlib imports
+import typing
+
+# local imports
 from ..core.object_3d import Object3D
 
+T = typing.TypeVar("T", bound=Object3D)
+
 
 class Scene(Object3D):
+    # classes an object is indexed under, per object type - shared by all scenes
+    _indexed_types_cache: dict[type, tuple[type, ...]] = {}
+
     def __init__(self) -> None:
         super().__init__()
         self.name = "the scene"
+
+        self._objects_by_type: dict[type, dict[int, Object3D]] = {}
+        """Index of the descendants of the scene, by type. Maintained by `.add()`/`.remove()`, keyed by id(object)."""
+
+    # =============================================================================
+    # Typed object index
+    # =============================================================================
+
+    def get_objects_by_type(self, object_type: type[T]) -> list[T]:
+        """
+        Return all the descendants of the scene which are instances of `object_type`, without traversing the scene graph.
+
+        Usage:
+        ```python
+        lights = scene.get_objects_by_type(Light)
+        ```
+        """
+        objects = self._objects_by_type.get(object_type)
+        if objects is None:
+            return []
+        return typing.cast(list[T], list(objects.values()))
+
+    def count_objects_by_type(self, object_type: type[Object3D]) -> int:
+        """Return the number of descendants of the scene which are instances of `object_type`."""
+        objects = self._objects_by_type.get(object_type)
+        return len(objects) if objects is not None else 0
+
+    def _on_subtree_added(self, subtree_root: Object3D) -> None:
+        stack: list[Object3D] = [subtree_root]
+        while len(stack) > 0:
+            object3d = stack.pop()
+            for indexed_type in Scene._get_indexed_types(type(object3d)):
+                self._objects_by_type.setdefault(indexed_type, {})[id(object3d)] = object3d
+            stack.extend(reversed(object3d._children))
+
+    def _on_subtree_removed(self, subtree_root: Object3D) -> None:
+        stack: list[Object3D] = [subtree_root]
+        while len(stack) > 0:
+            object3d = stack.pop()
+            for indexed_type in Scene._get_indexed_types(type(object3d)):
+                self._objects_by_type[indexed_type].pop(id(object3d), None)
+            stack.extend(object3d._children)
+
+    @staticmethod
+    def _get_indexed_types(object_type: type) -> tuple[type, ...]:
+        """Return the classes an object of `object_type` is indexed under: its own class and all its Object3D base classes."""
+        indexed_types = Scene._indexed_types_cache.get(object_type)
+        if indexed_types is None:
+            indexed_types = tuple(cls for cls in object_type.__mro__ if isinstance(cls, type) and issubclass(cls, Object3D))
+            Scene._indexed_types_cache[object_type] = indexed_types
+        return indexed_types
@@ -0,0 +1,108 @@
+# stdlib imports
+import threading
+import time
+import typing
+
+
+class RenderStats:
+    def __init__(self, frame_index: int) -> None:
+        """
+        Statistics of one `Renderer.render()` - see `Renderer.stats_enabled`.
+
+        The stage times are summed over the objects, and over the threads when objects are computed in parallel:
+        - "world_matrix": update of the world matrices
+        - "culling": frustum culling of the objects
+        - "transform": vertex transforms and clipping of the meshes and polygons
+        - "shading": face colors of the meshes
+        - "sorting": face sorting and face culling of the meshes and polygons
+        - "artist_update": update of the matplotlib artists of the meshes and polygons
+        - "draw": matplotlib draw of the figure, if done by `Renderer.render_to_array()` or `RendererBlitter.update()`
+
+        The stages spent on an object are also broken down by object in `.object_stage_times`, and by renderer class
+        in `.renderer_class_stage_times` - e.g. to find which objects the "shading" time goes to.
+
+        Arguments:
+            frame_index (int): index of the render, counted by the renderer
+        """
+        self.frame_index: int = frame_index
+        """index of the render, counted by the renderer"""
+        self.timestamp: float = time.time()
+        """time of the render start, in seconds since the epoch"""
+        self.render_time: float = 0.0
+        """wall time of `Renderer.render()`, in seconds"""
+
+        self.object_visited_count: int = 0
+        """number of objects traversed by the render, without the culled subtrees"""
+        self.object_culled_count: int = 0
+        """number of objects skipped by frustum culling"""
+        self.object_rendered_count: int = 0
+        """number of objects rendered - the unchanged ones are skipped with `only_changed=True`"""
+        self.face_input_count: int = 0
+        """number of faces of the rendered meshes and polygons"""
+        self.face_drawn_count: int = 0
+        """number of faces drawn, after clipping and face culling"""
+        self.changed_artist_count: int = 0
+        """number of artists returned by `Renderer.render()`"""
+
+        self.stage_times: dict[str, float] = {}
+        """time spent in each stage, in seconds"""
+        self.renderer_class_times: dict[str, float] = {}
+        """time spent rendering the objects, by renderer class name, in seconds"""
+        self.object_times: dict[str, float] = {}
+        """time spent rendering each object, by uuid, in seconds"""
+        self.object_stage_times: dict[str, dict[str, float]] = {}
+        """time spent in each stage for each object, by uuid then stage, in seconds"""
+        self.renderer_class_stage_times: dict[str, dict[str, float]] = {}
+        """time spent in each stage for the objects of each renderer class, by renderer class name then stage, in seconds"""
+
+        self._lock = threading.Lock()
+        """the objects may be computed in the renderer threads"""
+
+    @property
+    def face_culled_count(self) -> int:
+        """number of faces not drawn, clipped or culled"""
+        return self.face_input_count - self.face_drawn_count
+
+    def add_stage_time(self, stage: str, seconds: float, object_uuid: str | None = None, renderer_class: type | None = None) -> None:
+        """Add time to a stage, and to the stage of the object and of its renderer class if given."""
+        with self._lock:
+            self.stage_times[stage] = self.stage_times.get(stage, 0.0) + seconds
+            if object_uuid is not None:
+                object_stage_times = self.object_stage_times.setdefault(object_uuid, {})
+                object_stage_times[stage] = object_stage_times.get(stage, 0.0) + seconds
+            if renderer_class is not None:
+                class_stage_times = self.renderer_class_stage_times.setdefault(renderer_class.__name__, {})
+                class_stage_times[stage] = class_stage_times.get(stage, 0.0) + seconds
+
+    def add_object_time(self, object_uuid: str, renderer_class: type, seconds: float) -> None:
+        with self._lock:
+            self.object_times[object_uuid] = self.object_times.get(object_uuid, 0.0) + seconds
+            self.renderer_class_times[renderer_class.__name__] = self.renderer_class_times.get(renderer_class.__name__, 0.0) + seconds
+
+    def add_input_faces(self, face_count: int) -> None:
+        with self._lock:
+            self.face_input_count += face_count
+
+    def add_drawn_faces(self, face_count: int) -> None:
+        with self._lock:
+            self.face_drawn_count += face_count
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Return the statistics as a JSON serializable dict."""
+        return {
+            "frame_index": self.frame_index,
+            "timestamp": self.timestamp,
+            "render_time": self.render_time,
+            "object_visited_count": self.object_visited_count,
+            "object_culled_count": self.object_culled_count,
+            "object_rendered_count": self.object_rendered_count,
+            "face_input_count": self.face_input_count,
+            "face_culled_count": self.face_culled_count,
+            "face_drawn_count": self.face_drawn_count,
+            "changed_artist_count": self.changed_artist_count,
+            "stage_times": dict(self.stage_times),
+            "renderer_class_times": dict(self.renderer_class_times),
+            "object_times": dict(self.object_times),
+            "object_stage_times": {object_uuid: dict(stage_times) for object_uuid, stage_times in self.object_stage_times.items()},
+            "renderer_class_stage_times": {class_name: dict(stage_times) for class_name, stage_times in self.renderer_class_stage_times.items()},
+        }
@@ -1,11 +1,17 @@
 # stdlib imports
+import collections
+import concurrent.futures
+import json
+import time
 import typing
 
 # pip imports
 import matplotlib.pyplot
 import matplotlib.artist
+import matplotlib.collections
 import matplotlib.figure
 import matplotlib.axes
+import matplotlib.backends.backend_agg
 import numpy as np
 
 # local imports
@@ -19,13 +25,30 @@ from ..objects.mesh import Mesh
 from ..objects.scene import Scene
 from ..objects.text import Text
 from ..cameras.camera import Camera
+from ..lights.light import Light
+from ..math.frustum_utils import FrustumUtils
+from ..math.grid_index_2d import GridIndex2D
+from .render_stats import RenderStats
 
 
 class Renderer:
     __slot__ = "depth_sorting"
 
     def __init__(
-        self, figure_w: int = 256, figure_h: int = 256, dpi: int = 100, /, depth_sorting: bool = False, background_color: np.ndarray | None = None
+        self,
+        figure_w: int = 256,
+        figure_h: int = 256,
+        dpi: int = 100,
+        /,
+        depth_sorting: bool = False,
+        background_color: np.ndarray | None = None,
+        frustum_culling: bool = True,
+        points_picking: bool = False,
+        merged_depth_sorting: bool = False,
+        thread_count: int = 1,
+        thread_min_vertex_count: int = 5000,
+        stats_enabled: bool = False,
+        stats_log_path: str | None = None,
     ) -> None:
         self.width = figure_w
         """Width of the figure in pixels."""
@@ -35,6 +58,40 @@ class Renderer:
         """DPI (dots per inch) of the figure."""
         self.background_color = background_color if background_color is not None else Constants.Color.WHITE
         """Background color of the figure."""
+        self.frustum_culling = frustum_culling
+        """
+        Whether to skip the objects entirely outside of the camera frustum. Objects without bounding box are never culled.
+        The bounding boxes are cached per geometry version: call `geometry.mark_dirty()` after editing its vertices in place,
+        e.g. `geometry.vertices[:] = ...`, else the object may be culled while it is on screen.
+        """
+        self.culled_object_count = 0
+        """Number of objects skipped by frustum culling during the last `.render()`."""
+        self.disposed_artist_count = 0
+        """Number of artists disposed during the last `.render()`, as their object got removed from the scene."""
+        self.points_picking = points_picking
+        """Whether to retain the 2D projections of the Points, to query them with `RendererPoints.pick_points()`."""
+        self.merged_depth_sorting = merged_depth_sorting
+        """
+        Whether to draw the faces of all the Mesh and Polygons objects in a single PolyCollection, sorted by depth across objects.
+        It draws interpenetrating objects correctly and uses one artist, instead of one per object sorted by distance to the camera.
+        Textured meshes keep their own artists.
+        """
+        self.thread_count = thread_count
+        """
+        Number of threads computing the objects in parallel during `.render()` - vertex transforms, clipping, shading, sorting.
+        The artists are still updated on the calling thread. 1 computes everything on the calling thread.
+        """
+        self.thread_min_vertex_count = thread_min_vertex_count
+        """Minimum number of vertices of an object to compute it in a thread - below, the thread overhead costs more than it saves."""
+        self.stats_enabled = stats_enabled
+        """Whether to collect the statistics of each `.render()` in `.last_render_stats` - see `RenderStats`."""
+        self.stats_log_path = stats_log_path
+        """
+        JSON-lines file to append the statistics of each `.render()` to, if `.stats_enabled` is True. None to not log them.
+        A frame is logged once the next `.render()` starts, or on `.close()`, so it includes the matplotlib draw time.
+        """
+        self.last_render_stats: RenderStats | None = None
+        """Statistics of the last `.render()`, if `.stats_enabled` is True."""
 
         # =============================================================================
         # Setup matplotlib
@@ -54,8 +111,50 @@ class Renderer:
         self._axis.set_xlim(-1, 1)
         self._axis.set_ylim(-1, 1)
         self._artists: dict[str, matplotlib.artist.Artist] = {}
+        self._artists_inputs: dict[str, tuple[typing.Any, ...]] = {}
+        """Inputs last uploaded to each artist, by artist key, e.g. (texture, texture version), to skip the upload when they did not change."""
+        self._points_grid_indices: dict[str, tuple[Points, GridIndex2D]] = {}
+        """2D projections of the rendered Points, by uuid - only if `.points_picking` is True"""
+        self._view_inputs_key: tuple | None = None
+        """Camera and lights state used by the last `.render()`."""
+        self._objects_inputs_keys: dict[str, tuple] = {}
+        """Inputs of each object rendered by `.render()`, by uuid, to detect the objects which changed since."""
+        self._merged_faces: dict[str, tuple] = {}
+        """
+        Faces of each object drawn in the merged artist, by uuid - only if `.merged_depth_sorting` is True.
+        (faces_depth, faces_vertices_2d, faces_colors, edge_colors, edge_widths, distance_to_camera)
+        """
+        self._merged_faces_changed = False
+        """Whether `._merged_faces` changed since the merged artist got updated."""
+        self._computed_cache: dict[str, tuple[tuple, typing.Any]] = {}
+        """
+        Last `.compute()` result of each Mesh and Polygons, by uuid, with the key of its inputs - see `._compute_object_cached()`.
+        (compute key, computed)
+        """
+        self._vertices_buffers: dict[str, np.ndarray] = {}
+        """Transformed vertices of each object, by uuid, reused across frames - see `._get_vertices_buffer()`"""
+        self._rendered_uuids: set[str] = set()
+        """uuids of the objects rendered by this renderer, whose artists are disposed once they leave the scene."""
+        self._thread_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        """Threads computing the objects, created on first use - see `.thread_count`"""
+        self._thread_pool_size = 0
+        """Number of threads of `._thread_pool`, to create it again if `.thread_count` changes."""
+        self._stats: RenderStats | None = None
+        """Statistics being collected by the current `.render()`. None outside of it, or if `.stats_enabled` is False."""
+        self._stats_frame_count = 0
+        """Number of `.render()` with statistics, to index the frames."""
+        self._stats_log_pending = False
+        """Whether `.last_render_stats` still has to be appended to `.stats_log_path`."""
 
     def close(self) -> None:
+        # stop the compute threads if any
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+        # log the statistics of the last render if any
+        self._flush_render_stats()
+
         # stop the event loop if any - thus .show(block=True) will return
         self._figure.canvas.stop_event_loop()
         # close the figure
@@ -71,82 +170,606 @@ class Renderer:
     def get_axis(self) -> matplotlib.axes.Axes:
         return self._axis
 
-    def render(self, scene: Scene, camera: Camera) -> list[matplotlib.artist.Artist]:
+    def render(
+        self, scene: Scene, camera: Camera, only_changed: bool = False, changed_objects: typing.Iterable[Object3D] = ()
+    ) -> list[matplotlib.artist.Artist]:
+        """
+        Render the scene, and return the artists which changed.
+
+        Arguments:
+            scene (Scene): the scene to render
+            camera (Camera): the camera to render the scene from
+            only_changed (bool): if True, render only the objects whose inputs changed since the last `.render()`:
+                their transform (or an ancestor one), geometry, material or texture - see their `.version`.
+                Everything is rendered if the camera or a light changed. The objects with a `pre_rendering`
+                subscriber are always rendered, as the subscriber may change them.
+                CAUTION: editing an array in place, e.g. `geometry.vertices[:] = ...` or `material.colors[0] = ...`,
+                does not change any version. Call `geometry.mark_dirty()` or `material.mark_dirty()` after it,
+                or pass the object in `changed_objects`, else it is not rendered again.
+            changed_objects (Iterable[Object3D]): objects to render even if their inputs did not change, with `only_changed=True`
+
+        The faces computed for the meshes and polygons are reused while their inputs and the camera and lights do not change,
+        so the unchanged ones only update their artists - the same versions decide it, so the same CAUTION applies.
+        """
+        render_time_start = time.perf_counter()
+        stats = self._begin_render_stats()
+
         # update world matrices
+        time_start = time.perf_counter()
         scene.update_world_matrix()
+        self._add_stage_time("world_matrix", time_start)
 
-        # render objects
         changed_artists: list[matplotlib.artist.Artist] = []
-        for object3d in scene.traverse():
-            _changed_artists = self._render_object(object3d, camera)
-            changed_artists.extend(_changed_artists)
+        self.culled_object_count = 0
+        self.disposed_artist_count = 0
+
+        # =============================================================================
+        # Setup change tracking
+        # =============================================================================
+        view_inputs_key = self._compute_view_inputs_key(scene, camera)
+        computing_objects: list[tuple[Object3D, type, concurrent.futures.Future, tuple | None]] = []
+        render_all = not only_changed or view_inputs_key != self._view_inputs_key
+        self._view_inputs_key = view_inputs_key
+        objects_inputs_keys = self._objects_inputs_keys
+        visited_uuids: set[str] = set()
+        changed_uuids = {changed_object.uuid for changed_object in changed_objects}
+        visited_object_count = 0
+        rendered_object_count = 0
+
+        # =============================================================================
+        # Setup frustum culling
+        # =============================================================================
+        frustum_planes: np.ndarray | None = None
+        predicate: typing.Callable[[Object3D], bool] | None = None
+        if self.frustum_culling:
+            time_start = time.perf_counter()
+            frustum_planes = self._compute_culling_planes(camera)
+            scene.update_subtree_bounding_boxes()
+            self._add_stage_time("culling", time_start)
+
+            def predicate(object3d: Object3D) -> bool:
+                # skip the whole subtree if its bounding box is outside of the frustum
+                assert frustum_planes is not None
+                time_start = time.perf_counter()
+                subtree_bounding_box = object3d.get_subtree_bounding_box()
+                is_outside = subtree_bounding_box is not None and FrustumUtils.is_bounding_box_outside(frustum_planes, subtree_bounding_box)
+                self._add_stage_time("culling", time_start, object3d)
+                if not is_outside:
+                    return True
+                for culled_object3d in object3d.iter_traverse():
+                    visited_uuids.add(culled_object3d.uuid)
+                    changed_artists.extend(self._hide_object_artists(culled_object3d))
+                    objects_inputs_keys.pop(culled_object3d.uuid, None)
+                    self.culled_object_count += 1
+                return False
+
+        # =============================================================================
+        # render objects
+        # =============================================================================
+        for object3d in scene.iter_traverse(predicate=predicate):
+            visited_uuids.add(object3d.uuid)
+            visited_object_count += 1
+
+            # skip this object if it did not change since the last render
+            inputs_key = self._compute_object_inputs_key(object3d)
+            if not render_all and inputs_key is not None and objects_inputs_keys.get(object3d.uuid) == inputs_key and object3d.uuid not in changed_uuids:
+                continue
+
+            # skip this object if it is outside of the frustum, even if some of its descendants are not
+            if frustum_planes is not None and self._is_culled(object3d, frustum_planes):
+                changed_artists.extend(self._hide_object_artists(object3d))
+                objects_inputs_keys.pop(object3d.uuid, None)
+                self.culled_object_count += 1
+                continue
+
+            # reuse the faces computed by the last render if neither the object nor the view changed
+            compute_key = (inputs_key, view_inputs_key) if inputs_key is not None else None
+
+            # compute the large objects in the thread pool, and update their artists once all are submitted
+            rendered_object_count += 1
+            computing_object = self._submit_object_compute(object3d, camera, compute_key)
+            if computing_object is not None:
+                computing_objects.append(computing_object)
+            else:
+                changed_artists.extend(self._render_object(object3d, camera, compute_key))
+            if inputs_key is not None:
+                objects_inputs_keys[object3d.uuid] = inputs_key
+
+        # update the artists of the objects computed in the thread pool, in traversal order
+        for object3d, renderer_class, future, compute_key in computing_objects:
+            changed_artists.extend(self._apply_object_compute(object3d, camera, renderer_class, future.result(), compute_key))
+
+        # =============================================================================
+        # dispose the artists of the objects removed from the scene since the last render
+        # =============================================================================
+        for removed_uuid in self._rendered_uuids - visited_uuids:
+            self._dispose_artists(removed_uuid)
+        for removed_uuid in objects_inputs_keys.keys() - visited_uuids:
+            del objects_inputs_keys[removed_uuid]
+
+        # draw the faces of all the objects, sorted by depth
+        time_start = time.perf_counter()
+        changed_artists.extend(self._update_merged_faces_artist())
+        self._add_stage_time("artist_update", time_start)
+
+        # =============================================================================
+        # complete the statistics
+        # =============================================================================
+        if stats is not None:
+            stats.object_visited_count = visited_object_count
+            stats.object_culled_count = self.culled_object_count
+            stats.object_rendered_count = rendered_object_count
+            stats.changed_artist_count = len(changed_artists)
+            stats.render_time = time.perf_counter() - render_time_start
+            self._stats = None
 
         return changed_artists
 
     def render_object(self, object3d: Object3D, camera: Camera) -> list[matplotlib.artist.Artist]:
+        """
+        Render a single object, and return the artists which changed.
+
+        Its artists are disposed by the next `.render()` if the object is not in the rendered scene.
+        """
+        # skip this object if it is outside of the frustum
+        if self.frustum_culling:
+            frustum_planes = self._compute_culling_planes(camera)
+            if self._is_outside_frustum(object3d, frustum_planes):
+                return self._hide_object_artists(object3d)
+
         changed_artists: list[matplotlib.artist.Artist] = self._render_object(object3d, camera)
+        changed_artists.extend(self._update_merged_faces_artist())
         return changed_artists
 
+    def render_to_array(self, scene: Scene, camera: Camera, copy: bool = True) -> np.ndarray:
+        """
+        Render the scene and return its pixels, as an RGBA uint8 array of shape (height, width, 4) - no pyplot, no image encoding.
+
+        The figure is drawn on an Agg canvas: its own canvas if it is Agg based, as with the Agg, TkAgg or QtAgg backends.
+
+        Arguments:
+            scene (Scene): the scene to render
+            camera (Camera): the camera to render the scene from
+            copy (bool): if False, return a view on the canvas buffer, without copy. It is valid until the next draw of the figure.
+        """
+        self.render(scene, camera)
+
+        canvas = self._figure.canvas
+        if isinstance(canvas, matplotlib.backends.backend_agg.FigureCanvasAgg):
+            time_start = time.perf_counter()
+            canvas.draw()
+            self._add_draw_time(time.perf_counter() - time_start)
+            image = np.asarray(canvas.buffer_rgba())
+            return image.copy() if copy else image
+
+        # draw on a temporary Agg canvas, then give the figure its own canvas back - the buffer goes with it, so copy
+        agg_canvas = matplotlib.backends.backend_agg.FigureCanvasAgg(self._figure)
+        try:
+            time_start = time.perf_counter()
+            agg_canvas.draw()
+            self._add_draw_time(time.perf_counter() - time_start)
+            image = np.array(agg_canvas.buffer_rgba())
+        finally:
+            self._figure.set_canvas(canvas)
+        return image
+
+    def render_to_arrays(
+        self, scene: Scene, camera: Camera, positions: np.ndarray, rotations: np.ndarray, copy: bool = True
+    ) -> typing.Iterator[np.ndarray]:
+        """
+        Render the scene for each camera pose, and yield its pixels - see `.render_to_array()`.
+
+        The camera pose is restored once done, or if the generator is closed early.
+
+        Arguments:
+            scene (Scene): the scene to render
+            camera (Camera): the camera to move
+            positions (np.ndarray): camera positions, shape (N, 3)
+            rotations (np.ndarray): camera rotations, as quaternions (x, y, z, w), shape (N, 4)
+            copy (bool): if False, yield views on the canvas buffer, valid until the next frame
+        """
+        assert positions.ndim == 2 and positions.shape[1] == 3, f"positions should be of shape [N, 3]. Got {positions.shape}"
+        assert rotations.shape == (len(positions), 4), f"rotations should be of shape [{len(positions)}, 4]. Got {rotations.shape}"
+
+        position_original = camera.position.copy()
+        rotation_original = camera.rotation.copy()
+        try:
+            for position, rotation in zip(positions, rotations):
+                camera.position[:] = position
+                camera.rotation[:] = rotation
+                yield self.render_to_array(scene, camera, copy=copy)
+        finally:
+            camera.position[:] = position_original
+            camera.rotation[:] = rotation_original
+
+    def get_artist_counts(self) -> dict[str, int]:
+        """
+        Return the number of artists owned by the renderer, by artist type - e.g. {"PolyCollection": 2, "AxesImage": 12}.
+
+        Hidden artists are counted too, as they are kept to be reused. Use it to monitor long-running renderers.
+        """
+        return dict(collections.Counter(type(artist).__name__ for artist in self._artists.values()))
+
+    # =============================================================================
+    # Renderers registry
+    # =============================================================================
+    _object_renderers: dict[type, type] = {}
+    """Renderer class registered for each object type. See `.register_object_renderer()`."""
+    _object_renderers_resolved: dict[type, type | None] = {}
+    """Renderer class of each concrete object type, resolved once through its base classes."""
+
+    @staticmethod
+    def register_object_renderer(object_type: type[Object3D], renderer_class: type) -> None:
+        """
+        Register the renderer class of an object type. It is used for its subclasses too, unless they have their own.
+
+        `renderer_class.render(renderer, object3d, camera)` is called for each object and returns the changed artists.
+
+        Optionally, the renderer class splits it in `compute(renderer, object3d, camera)`, which must not touch any artist,
+        and `apply(renderer, object3d, camera, computed)`, which updates the artists and returns the changed ones. Then large
+        objects are computed in the renderer threads - see `.thread_count`.
+
+        Usage:
+        ```python
+        class RendererArrow:
+            @staticmethod
+            def render(renderer: Renderer, arrow: Arrow, camera: Camera) -> list[matplotlib.artist.Artist]: ...
+
+        Renderer.register_object_renderer(Arrow, RendererArrow)
+        ```
+        """
+        Renderer._register_default_renderers()
+        Renderer._object_renderers[object_type] = renderer_class
+        Renderer._object_renderers_resolved.clear()
+
+    @staticmethod
+    def get_object_renderer(object_type: type[Object3D]) -> type | None:
+        """Return the renderer class for an object type, looked up through its base classes. None if there is none."""
+        if object_type not in Renderer._object_renderers_resolved:
+            Renderer._register_default_renderers()
+            renderer_class = next((Renderer._object_renderers[base] for base in object_type.__mro__ if base in Renderer._object_renderers), None)
+            Renderer._object_renderers_resolved[object_type] = renderer_class
+        return Renderer._object_renderers_resolved[object_type]
+
+    @staticmethod
+    def _register_default_renderers() -> None:
+        if len(Renderer._object_renderers) > 0:
+            return
+
+        # imported here, as the renderer modules import this one
+        from .renderer_points import RendererPoints
+        from .renderer_lines import RendererLines
+        from .renderer_mesh import RendererMesh
+        from .renderer_polygons import RendererPolygons
+        from .renderer_sprite import RendererSprite
+        from .renderer_text import RendererText
+
+        Renderer._object_renderers.update(
+            {
+                Points: RendererPoints,
+                Lines: RendererLines,
+                Mesh: RendererMesh,
+                Polygons: RendererPolygons,
+                Sprite: RendererSprite,
+                Text: RendererText,
+            }
+        )
+
     # =============================================================================
     # Private functions
     # =============================================================================
-    def _render_object(self, object3d: Object3D, camera: Camera) -> list[matplotlib.artist.Artist]:
+    def _compute_culling_planes(self, camera: Camera) -> np.ndarray:
+        # the far plane is not used - objects beyond it are not clipped by the renderers, so they are still drawn
+        frustum_planes = FrustumUtils.compute_camera_frustum_planes(camera)
+        return np.delete(frustum_planes, FrustumUtils.PLANE_FAR, axis=0)
+
+    def _is_outside_frustum(self, object3d: Object3D, frustum_planes: np.ndarray) -> bool:
+        world_bounding_box = object3d.get_world_bounding_box()
+        if world_bounding_box is None:
+            return False
+        return FrustumUtils.is_bounding_box_outside(frustum_planes, world_bounding_box)
+
+    def _is_culled(self, object3d: Object3D, frustum_planes: np.ndarray) -> bool:
+        """Same as `._is_outside_frustum()`, timed in the statistics."""
+        time_start = time.perf_counter()
+        is_outside = self._is_outside_frustum(object3d, frustum_planes)
+        self._add_stage_time("culling", time_start, object3d)
+        return is_outside
+
+    # =============================================================================
+    # Statistics
+    # =============================================================================
+
+    def _begin_render_stats(self) -> RenderStats | None:
+        """Log the statistics of the previous render, and start collecting the ones of this render if `.stats_enabled` is True."""
+        self._flush_render_stats()
+        if not self.stats_enabled:
+            self._stats = None
+            return None
+
+        self._stats = RenderStats(self._stats_frame_count)
+        self._stats_frame_count += 1
+        self.last_render_stats = self._stats
+        self._stats_log_pending = self.stats_log_path is not None
+        return self._stats
+
+    def _flush_render_stats(self) -> None:
+        """Append `.last_render_stats` to `.stats_log_path`, if not done yet."""
+        if not self._stats_log_pending:
+            return
+        self._stats_log_pending = False
+        if self.last_render_stats is None or self.stats_log_path is None:
+            return
+        with open(self.stats_log_path, "a", encoding="utf-8") as log_file:
+            log_file.write(json.dumps(self.last_render_stats.to_dict()) + "\n")
+
+    def _add_stage_time(self, stage: str, time_start: float, object3d: Object3D | None = None) -> None:
+        """
+        Add the time elapsed since `time_start` to a stage of the statistics - see `RenderStats`. Thread safe.
+        If the stage was spent on an object, pass it to break the time down by object and by renderer class too.
+        """
+        if self._stats is None:
+            return
+        if object3d is None:
+            self._stats.add_stage_time(stage, time.perf_counter() - time_start)
+        else:
+            self._stats.add_stage_time(stage, time.perf_counter() - time_start, object3d.uuid, Renderer.get_object_renderer(type(object3d)))
+
+    def _add_input_faces(self, face_count: int) -> None:
+        if self._stats is not None:
+            self._stats.add_input_faces(face_count)
+
+    def _add_drawn_faces(self, face_count: int) -> None:
+        if self._stats is not None:
+            self._stats.add_drawn_faces(face_count)
+
+    def _add_draw_time(self, seconds: float) -> None:
+        """Add a matplotlib draw of the figure to the statistics of the last render, which it shows."""
+        if self.stats_enabled and self.last_render_stats is not None:
+            self.last_render_stats.add_stage_time("draw", seconds)
+
+    def _compute_view_inputs_key(self, scene: Scene, camera: Camera) -> tuple:
+        """Return the state of the camera and the lights, which affects the rendering of every object."""
+        lights_key = tuple(
+            (light, light.get_world_matrix_version(), np.asarray(getattr(light, "color", ())).tobytes(), getattr(light, "intensity", None))
+            for light in scene.get_objects_by_type(Light)
+        )
+        return (camera, camera.get_world_matrix_version(), camera.get_projection_matrix().tobytes(), lights_key, self.merged_depth_sorting)
+
+    def _compute_object_inputs_key(self, object3d: Object3D) -> tuple | None:
+        """Return the state of the inputs used to render an object. None if it must be rendered each time."""
+        if object3d.has_pre_rendering_subscribers():
+            return None
+
+        geometry = getattr(object3d, "geometry", None)
+        material = getattr(object3d, "material", None)
+        texture = getattr(material, "texture", None)
+        return (
+            object3d.get_world_matrix_version(),
+            geometry,
+            geometry.version if geometry is not None else None,
+            material,
+            material.version if material is not None else None,
+            texture,
+            texture.version if texture is not None else None,
+            getattr(object3d, "content", None),
+        )
+
+    def _get_vertices_buffer(self, uuid: str, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """
+        Return the vertices buffer of the object with this uuid, reallocated only when its shape or dtype changes.
+
+        Its content is overwritten by the next frame, so do not keep references to it.
+        """
+        buffer = self._vertices_buffers.get(uuid)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._vertices_buffers[uuid] = buffer
+        return buffer
+
+    def _hide_object_artists(self, object3d: Object3D) -> list[matplotlib.artist.Artist]:
+        """Hide the artists of an object, if it has been rendered before. Return the artists which got hidden."""
+        return self._hide_artists(object3d.uuid)
+
+    def _hide_artists(self, uuid: str) -> list[matplotlib.artist.Artist]:
+        """Hide the artists of the object with this uuid. Return the artists which got hidden."""
+        # remove its faces from the merged artist, updated at the end of the render
+        if self._merged_faces.pop(uuid, None) is not None:
+            self._merged_faces_changed = True
+
+        hidden_artists = [self._artists[artist_key] for artist_key in self._get_artists_keys(uuid)]
+        hidden_artists = [artist for artist in hidden_artists if artist.get_visible()]
+        for artist in hidden_artists:
+            artist.set_visible(False)
+        return hidden_artists
+
+    def _dispose_artists(self, uuid: str) -> None:
+        """Remove the artists of the object with this uuid from the axes, and forget everything kept for it."""
+        for artist_key in self._get_artists_keys(uuid):
+            artist = self._artists.pop(artist_key)
+            # remove every reference - RendererPoints adds its scatter collection twice
+            while artist in self._axis.get_children():
+                artist.remove()
+            self._artists_inputs.pop(artist_key, None)
+            self.disposed_artist_count += 1
+
+        self._points_grid_indices.pop(uuid, None)
+        self._computed_cache.pop(uuid, None)
+        self._vertices_buffers.pop(uuid, None)
+        if self._merged_faces.pop(uuid, None) is not None:
+            self._merged_faces_changed = True
+        self._rendered_uuids.discard(uuid)
+
+    def _get_artists_keys(self, uuid: str) -> list[str]:
+        """Return the keys in `._artists` of the artists of the object with this uuid."""
+        artists_keys: list[str] = []
+
+        # single artist objects use the uuid as key, textured meshes use one artist per face
+        if uuid in self._artists:
+            artists_keys.append(uuid)
+        face_index = 0
+        while (face_key := f"{uuid}_face_{face_index}") in self._artists:
+            artists_keys.append(face_key)
+            face_index += 1
+        return artists_keys
+
+    def _update_merged_faces_artist(self) -> list[matplotlib.artist.Artist]:
+        """
+        Draw the faces of `._merged_faces` in a single PolyCollection, sorted from the farthest to the nearest.
+        Return the changed artists - none if the faces did not change.
+        """
+        if self._merged_faces_changed is False:
+            return []
+        self._merged_faces_changed = False
+
+        if "merged_faces" not in self._artists:
+            mpl_poly_collection = matplotlib.collections.PolyCollection([], clip_on=False, snap=False)
+            self._axis.add_collection(mpl_poly_collection)
+            self._artists["merged_faces"] = mpl_poly_collection
+        mpl_poly_collection = typing.cast(matplotlib.collections.PolyCollection, self._artists["merged_faces"])
+
+        merged_faces = [faces for faces in self._merged_faces.values() if len(faces[0]) > 0]
+        if len(merged_faces) == 0:
+            mpl_poly_collection.set_visible(False)
+            return [mpl_poly_collection]
+
+        # painter's algorithm across all the objects - larger NDC z is farther, so it is drawn first
+        faces_depth = np.concatenate([faces[0] for faces in merged_faces])
+        depth_sorted_indices = np.argsort(-faces_depth, kind="stable")
+        faces_vertices_2d = np.concatenate([faces[1] for faces in merged_faces])[depth_sorted_indices]
+        faces_colors = np.concatenate([faces[2] for faces in merged_faces])[depth_sorted_indices]
+        edge_colors = np.concatenate([faces[3] for faces in merged_faces])[depth_sorted_indices]
+        edge_widths = np.concatenate([faces[4] for faces in merged_faces])[depth_sorted_indices]
+
+        # sort the artist with the other ones as the farthest object
+        mpl_poly_collection.set_zorder(-max(faces[5] for faces in merged_faces))
+        mpl_poly_collection.set_verts(typing.cast(list, faces_vertices_2d))
+        mpl_poly_collection.set_facecolor(typing.cast(list, faces_colors))
+        mpl_poly_collection.set_edgecolor(typing.cast(list, edge_colors))
+        mpl_poly_collection.set_linewidth(typing.cast(list, edge_widths))
+        mpl_poly_collection.set_visible(True)
+        return [mpl_poly_collection]
+
+    def _submit_object_compute(
+        self, object3d: Object3D, camera: Camera, compute_key: tuple | None
+    ) -> tuple[Object3D, type, concurrent.futures.Future, tuple | None] | None:
+        """
+        Submit the computation of the object to the thread pool, if its renderer supports it and it is large enough.
+        Return (object3d, renderer_class, future, compute_key) - None if the object has to be rendered on this thread.
+        """
+        if self.thread_count <= 1:
+            return None
+        renderer_class = Renderer.get_object_renderer(type(object3d))
+        if renderer_class is None or not hasattr(renderer_class, "compute"):
+            return None
+        # the post_transform subscribers are called during the computation, so keep it on this thread
+        if object3d.has_post_transform_subscribers():
+            return None
+        geometry = getattr(object3d, "geometry", None)
+        if geometry is None or len(geometry.vertices) < self.thread_min_vertex_count:
+            return None
+        # nothing to compute if the last computation can be reused
+        cached = self._computed_cache.get(object3d.uuid)
+        if compute_key is not None and cached is not None and cached[0] == compute_key:
+            return None
+
+        # dispatch the pre_rendering event before the computation, as subscribers may change the object
+        if object3d.has_pre_rendering_subscribers():
+            object3d.pre_rendering.dispatch(renderer=self, camera=camera)
+        self._rendered_uuids.add(object3d.uuid)
+
+        # compute the camera matrices once, on this thread
+        camera.get_view_projection_matrix()
+
+        if self._thread_pool is None or self._thread_pool_size != self.thread_count:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown()
+            self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.thread_count, thread_name_prefix="mpl_graph_renderer")
+            self._thread_pool_size = self.thread_count
+        future = self._thread_pool.submit(self._compute_object, renderer_class, object3d, camera)
+        return object3d, renderer_class, future, compute_key
+
+    def _compute_object(self, renderer_class: type, object3d: Object3D, camera: Camera) -> typing.Any:
+        """Run `renderer_class.compute()` in a pool thread, timed in the statistics."""
+        time_start = time.perf_counter()
+        computed = renderer_class.compute(self, object3d, camera)
+        if self._stats is not None:
+            self._stats.add_object_time(object3d.uuid, renderer_class, time.perf_counter() - time_start)
+        return computed
+
+    def _compute_object_cached(self, renderer_class: type, object3d: Object3D, camera: Camera, compute_key: tuple) -> typing.Any:
+        """
+        Return `renderer_class.compute()` of the object, reused from the last render if its compute key did not change.
+
+        The compute key holds the versions of everything the computation reads: the world matrix, the geometry, the material,
+        the texture, and the camera and lights - see `._compute_object_inputs_key()` and `._compute_view_inputs_key()`.
+        """
+        cached = self._computed_cache.get(object3d.uuid)
+        if cached is not None and cached[0] == compute_key:
+            return cached[1]
+        computed = renderer_class.compute(self, object3d, camera)
+        self._computed_cache[object3d.uuid] = (compute_key, computed)
+        return computed
+
+    def _apply_object_compute(
+        self, object3d: Object3D, camera: Camera, renderer_class: type, computed: typing.Any, compute_key: tuple | None
+    ) -> list[matplotlib.artist.Artist]:
+        """Update the artists of an object computed by `._submit_object_compute()`, and return the changed ones."""
+        if compute_key is not None:
+            self._computed_cache[object3d.uuid] = (compute_key, computed)
+
+        time_start = time.perf_counter()
+        changed_artists = renderer_class.apply(self, object3d, camera, computed)
+        if self._stats is not None:
+            self._stats.add_object_time(object3d.uuid, renderer_class, time.perf_counter() - time_start)
+
+        # dispatch the post_rendering event - skipped if nobody subscribed
+        if object3d.has_post_rendering_subscribers():
+            object3d.post_rendering.dispatch(renderer=self, camera=camera)
+
+        return changed_artists
+
+    def _render_object(self, object3d: Object3D, camera: Camera, compute_key: tuple | None = None) -> list[matplotlib.artist.Artist]:
+        """
+        Render the object on this thread, and return the changed artists.
+        If `compute_key` is set, the computation of the renderers with a `.compute()` is reused while the key does not change.
+        """
 
         # =============================================================================
         # Dispatch pre_rendering Event
         # =============================================================================
 
-        # dispatch the pre_rendering event
-        object3d.pre_rendering.dispatch(renderer=self, camera=camera)
+        # dispatch the pre_rendering event - skipped if nobody subscribed
+        if object3d.has_pre_rendering_subscribers():
+            object3d.pre_rendering.dispatch(renderer=self, camera=camera)
 
         # =============================================================================
-        # Render the object based on its type
+        # Render the object with the renderer registered for its type
         # =============================================================================
         changed_artists: list[matplotlib.artist.Artist] = []
-
-        # call the appropriate renderer based on the object type
-        if isinstance(object3d, Points):
-            from .renderer_points import RendererPoints
-
-            _changed_artists = RendererPoints.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Lines):
-            from .renderer_lines import RendererLines
-
-            _changed_artists = RendererLines.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Mesh):
-            from .renderer_mesh import RendererMesh
-
-            _changed_artists = RendererMesh.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Polygons):
-            from .renderer_polygons import RendererPolygons
-
-            _changed_artists = RendererPolygons.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Sprite):
-            from .renderer_sprite import RendererSprite
-
-            _changed_artists = RendererSprite.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Text):
-            from .renderer_text import RendererText
-
-            _changed_artists = RendererText.render(self, object3d, camera)
-            changed_artists.extend(_changed_artists)
-        elif isinstance(object3d, Object3D):
-            # base class, do nothing
-            pass
-        else:
-            raise NotImplementedError(f"Rendering for {type(object3d)} not implemented yet")
+        self._rendered_uuids.add(object3d.uuid)
+
+        renderer_class = Renderer.get_object_renderer(type(object3d))
+
+        # objects without renderer, like groups, cameras or lights, draw nothing
+        if renderer_class is not None:
+            time_start = time.perf_counter()
+            # the post_transform subscribers are called during the computation, so compute each time for them
+            if compute_key is not None and hasattr(renderer_class, "compute") and not object3d.has_post_transform_subscribers():
+                computed = self._compute_object_cached(renderer_class, object3d, camera, compute_key)
+                changed_artists = renderer_class.apply(self, object3d, camera, computed)
+            else:
+                changed_artists = renderer_class.render(self, object3d, camera)
+            if self._stats is not None:
+                self._stats.add_object_time(object3d.uuid, renderer_class, time.perf_counter() - time_start)
 
         # =============================================================================
         # Dispatch post_rendering Event
         # =============================================================================
 
-        # dispatch the post_rendering event
-        object3d.post_rendering.dispatch(renderer=self, camera=camera)
+        # dispatch the post_rendering event - skipped if nobody subscribed
+        if object3d.has_post_rendering_subscribers():
+            object3d.post_rendering.dispatch(renderer=self, camera=camera)
 
         # return the list of changed artists
         return changed_artists
@@ -0,0 +1,168 @@
+# stdlib imports
+import collections
+import time
+
+# pip imports
+import matplotlib.artist
+import matplotlib.collections
+import matplotlib.transforms
+import numpy as np
+
+# local imports
+from .renderer import Renderer
+
+
+class RendererBlitter:
+    def __init__(self, renderer: Renderer) -> None:
+        """
+        Redraw only the artists changed by `Renderer.render()`, on top of a cached background of the unchanged ones.
+
+        The changed artists are marked as animated, so the full draws skip them and the background can be saved.
+        Each `.update()` then restores the background, draws the animated artists and blits the figure.
+        It falls back to a full redraw when:
+        - new artists change, as the background includes them
+        - the canvas got resized
+        - an animated artist has to be drawn below an unchanged one it overlaps, because of their zorders - blitting draws the animated artists on top.
+        Then everything is drawn normally for this frame, and the artists are marked as animated again as they change.
+
+        Usage:
+            ```python
+            blitter = RendererBlitter(renderer)
+            # for each frame
+            changed_artists = renderer.render(scene, camera, only_changed=True)
+            blitter.update(changed_artists)
+            ```
+        Call `.close()` before saving the figure, as full draws skip the animated artists.
+
+        Arguments:
+            renderer (Renderer): the renderer whose figure is drawn
+        """
+        self._renderer = renderer
+        self._background: object | None = None
+        """Saved region of the figure, without the animated artists. None if it has to be redrawn."""
+        self._background_size: tuple[int, int] | None = None
+        """Canvas size when `._background` got saved, to detect the resizes."""
+        self._animated_artists: list[matplotlib.artist.Artist] = []
+        """Artists marked as animated, drawn at each `.update()`"""
+
+        self.blit_count = 0
+        """Number of `.update()` which blitted the animated artists only."""
+        self.full_redraw_count = 0
+        """Number of `.update()` which redrew the whole figure."""
+
+    def update(self, changed_artists: list[matplotlib.artist.Artist]) -> bool:
+        """
+        Draw the changed artists, usually returned by `Renderer.render()`. Return True if it blitted, False if it redrew the whole figure.
+        The draw time is added to the renderer statistics, if enabled - see `RenderStats`.
+        """
+        time_start = time.perf_counter()
+        blitted = self._update(changed_artists)
+        self._renderer._add_draw_time(time.perf_counter() - time_start)
+        return blitted
+
+    def close(self) -> None:
+        """Stop blitting: the artists are not animated anymore, so a full draw of the figure draws them all again."""
+        for artist in self._animated_artists:
+            artist.set_animated(False)
+        self._animated_artists = []
+        self._background = None
+        self._background_size = None
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    def _update(self, changed_artists: list[matplotlib.artist.Artist]) -> bool:
+        figure = self._renderer.get_figure()
+        canvas = figure.canvas
+
+        # some backends can not blit, e.g. the vector ones
+        if not canvas.supports_blit:
+            self.full_redraw_count += 1
+            canvas.draw_idle()
+            return False
+
+        # forget the artists disposed by the renderer, and animate the new changed ones
+        self._animated_artists = [artist for artist in self._animated_artists if artist.axes is not None]
+        animated_artists_ids = {id(artist) for artist in self._animated_artists}
+        new_artists = [artist for artist in changed_artists if id(artist) not in animated_artists_ids and artist.axes is not None]
+        for artist in new_artists:
+            artist.set_animated(True)
+            self._animated_artists.append(artist)
+
+        # blitting draws the animated artists over the background, so none may be below a visible unchanged artist
+        if not self._is_layering_blittable():
+            self._redraw_without_blitting()
+            return False
+
+        # save the background again if it may have changed
+        canvas_size = canvas.get_width_height()
+        if self._background is None or len(new_artists) > 0 or canvas_size != self._background_size:
+            self.full_redraw_count += 1
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(figure.bbox)
+            self._background_size = canvas_size
+            self._draw_animated_artists()
+            canvas.blit(figure.bbox)
+            canvas.flush_events()
+            return False
+
+        # restore the background and draw only the animated artists
+        self.blit_count += 1
+        canvas.restore_region(self._background)
+        self._draw_animated_artists()
+        canvas.blit(figure.bbox)
+        canvas.flush_events()
+        return True
+
+    def _is_layering_blittable(self) -> bool:
+        """Return False if an animated artist is below an unchanged one and they overlap on screen."""
+        static_artists = [artist for artist in self._renderer._artists.values() if not artist.get_animated() and artist.get_visible()]
+        if len(static_artists) == 0:
+            return True
+        static_zorder_max = max(artist.get_zorder() for artist in static_artists)
+
+        for animated_artist in self._animated_artists:
+            # common case: above all the unchanged artists
+            if not animated_artist.get_visible() or animated_artist.get_zorder() >= static_zorder_max:
+                continue
+            animated_extent = self._get_display_extent(animated_artist)
+            if animated_extent is None:
+                continue
+            for static_artist in static_artists:
+                if static_artist.get_zorder() <= animated_artist.get_zorder():
+                    continue
+                static_extent = self._get_display_extent(static_artist)
+                if static_extent is not None and static_extent.overlaps(animated_extent):
+                    return False
+        return True
+
+    def _get_display_extent(self, artist: matplotlib.artist.Artist) -> matplotlib.transforms.Bbox | None:
+        """Return the extent of the artist in display coordinates. None if it draws nothing."""
+        if not isinstance(artist, matplotlib.collections.Collection):
+            extent = artist.get_window_extent()
+        else:
+            # the window extent of collections with offsets (e.g. scatter) is empty, so use their data limits
+            transform_data = self._renderer.get_axis().transData
+            extent = artist.get_datalim(transform_data).transformed(transform_data)
+            # pad by the markers radius, in pixels
+            sizes = artist.get_sizes()
+            if len(sizes) > 0:
+                extent = extent.padded(float(np.sqrt(sizes.max())) / 2 * self._renderer.dpi / 72.0)
+
+        if not np.isfinite(extent.get_points()).all():
+            return None
+        return extent
+
+    def _redraw_without_blitting(self) -> None:
+        self.full_redraw_count += 1
+        self.close()
+        self._renderer.get_figure().canvas.draw()
+
+    def _draw_animated_artists(self) -> None:
+        figure = self._renderer.get_figure()
+        # a full draw draws an artist once per reference in the axes, e.g. twice for the scatter of RendererPoints
+        reference_counts = collections.Counter(id(artist) for artist in self._renderer.get_axis().get_children())
+        for artist in sorted(self._animated_artists, key=lambda artist: artist.get_zorder()):
+            for _ in range(max(reference_counts[id(artist)], 1)):
+                figure.draw_artist(artist)
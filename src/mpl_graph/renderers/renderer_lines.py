@@ -37,8 +37,9 @@ class RendererLines:
         mvp_matrix = TransformUtils.compute_mvp_matrix(camera, lines)
         vertices_ndc, vertices_world = GeometryUtils.apply_mvp_matrix(geometry.vertices, mvp_matrix)
 
-        # dispatch the post_transforming event
-        lines.post_transform.dispatch(vertices_ndc)
+        # dispatch the post_transforming event - skipped if nobody subscribed
+        if lines.has_post_transform_subscribers():
+            lines.post_transform.dispatch(vertices_ndc)
 
         # =============================================================================
         # Switch vertices to 2d
@@ -1,4 +1,6 @@
 # stdlib imports
+import inspect
+import time
 import typing
 
 # pip imports
@@ -14,6 +16,7 @@ from .renderer import Renderer
 from ..cameras.camera import Camera
 from ..math.transform_utils import TransformUtils
 from ..geometry.geometry_utils import GeometryUtils
+from .renderer_utils import RendererUtils
 
 # https://chatgpt.com/c/68ee0eab-776c-8331-b44a-f131ba3f166b
 # local -> world -> view -> clip (NDC) -> screen (2D)
@@ -27,6 +30,16 @@ from ..geometry.geometry_utils import GeometryUtils
 class RendererMesh:
     @staticmethod
     def render(renderer: "Renderer", mesh: Mesh, camera: Camera) -> list[matplotlib.artist.Artist]:
+        computed = RendererMesh.compute(renderer, mesh, camera)
+        changed_artists = RendererMesh.apply(renderer, mesh, camera, computed)
+        return changed_artists
+
+    @staticmethod
+    def compute(renderer: "Renderer", mesh: Mesh, camera: Camera) -> tuple[type, dict[str, typing.Any], tuple | None]:
+        """
+        Compute the faces of the mesh, without touching any artist - so it can run in a worker thread.
+        Return (material renderer class, its render arguments, its computed faces - None if it can not compute apart)
+        """
 
         # =============================================================================
         # sanity checks
@@ -35,6 +48,8 @@ class RendererMesh:
         assert mesh.geometry.indices is not None, "The mesh geometry must have face indices to be rendered"
         assert mesh.geometry.uvs is not None, "The mesh geometry must have texture coordinates to be rendered"
 
+        time_start = time.perf_counter()
+
         # =============================================================================
         # Extract geometry and material
         # =============================================================================
@@ -44,26 +59,44 @@ class RendererMesh:
         faces_uvs = mesh.geometry.uvs[geometry.indices]
 
         # =============================================================================
-        # Compute the world space faces_vertices
+        # Compute the world space and clip space faces_vertices
         # =============================================================================
 
-        # Get the full transform matrix for the mesh
+        # transform the vertices to world and clip space in a single pass, into a buffer reused across frames
         world_matrix = mesh.get_world_matrix()
-        vertices_world = GeometryUtils.apply_transform(geometry.vertices, world_matrix)
+        mvp_matrix = TransformUtils.compute_mvp_matrix(camera, mesh)
+        vertices_buffer = renderer._get_vertices_buffer(
+            mesh.uuid, (len(geometry.vertices), 7), np.result_type(geometry.vertices, world_matrix, mvp_matrix)
+        )
+        vertices_world, vertices_clip = GeometryUtils.apply_world_and_mvp_matrices(geometry.vertices, world_matrix, mvp_matrix, out=vertices_buffer)
 
-        # build the faces vertices and uvs arrays
+        # build the faces vertices arrays - it copies them out of the buffer
         faces_vertices_world = vertices_world[geometry.indices]
+        faces_vertices_clip = vertices_clip[geometry.indices]
 
         # =============================================================================
-        # Compute the NDC faces_vertices
+        # Clip the faces - before any per-face work
         # =============================================================================
 
-        # Get the full transform matrix for the mesh
-        mvp_matrix = TransformUtils.compute_mvp_matrix(camera, mesh)
-        vertices_ndc, vertices_clip = GeometryUtils.apply_mvp_matrix(geometry.vertices, mvp_matrix)
+        # reject the faces fully outside of the clip volume
+        faces_indices = np.flatnonzero(~RendererUtils.compute_faces_outside_clip_volume(faces_vertices_clip))
+
+        # clip the faces crossing the near plane, so no vertex get divided by w <= 0
+        faces_weights: np.ndarray | None = None
+        if RendererUtils.compute_faces_crossing_near_plane(faces_vertices_clip[faces_indices]).any():
+            faces_indices, faces_weights = RendererUtils.clip_triangles_near_plane(faces_vertices_clip, faces_indices)
+
+        # CAUTION: here update ALL per-face arrays you use below to keep them in sync
+        faces_vertices_clip = RendererUtils.interpolate_faces_attribute(faces_vertices_clip, faces_indices, faces_weights)
+        faces_vertices_world = RendererUtils.interpolate_faces_attribute(faces_vertices_world, faces_indices, faces_weights)
+        faces_uvs = RendererUtils.interpolate_faces_attribute(faces_uvs, faces_indices, faces_weights)
+
+        # =============================================================================
+        # Compute the NDC faces_vertices
+        # =============================================================================
 
-        # build the faces vertices and uvs arrays
-        faces_vertices_ndc = vertices_ndc[geometry.indices]
+        # perspective divide
+        faces_vertices_ndc = faces_vertices_clip[..., :3] / faces_vertices_clip[..., 3:4]
 
         # =============================================================================
         # Switch vertices to 2d
@@ -71,64 +104,98 @@ class RendererMesh:
 
         # drop z for 2D rendering
         faces_vertices_2d = faces_vertices_ndc[..., :2]
+        renderer._add_stage_time("transform", time_start, mesh)
 
         # =============================================================================
         # Render the mesh using the appropriate material
         # =============================================================================
 
-        if isinstance(mesh.material, MeshBasicMaterial):
-            from .renderer_mesh_basic_material import RendererMeshBasicMaterial
-
-            changed_artists = RendererMeshBasicMaterial.render(
-                renderer=renderer,
-                mesh=mesh,
-                camera=camera,
-                faces_vertices_ndc=faces_vertices_ndc,
-                faces_vertices_2d=faces_vertices_2d,
-            )
-        elif isinstance(mesh.material, MeshNormalMaterial):
-            from .renderer_mesh_normal_material import RendererMeshNormalMaterial
-
-            changed_artists = RendererMeshNormalMaterial.render(
-                renderer=renderer,
-                mesh=mesh,
-                camera=camera,
-                faces_vertices_world=faces_vertices_world,
-                faces_vertices_ndc=faces_vertices_ndc,
-                faces_vertices_2d=faces_vertices_2d,
-            )
-        elif isinstance(mesh.material, MeshDepthMaterial):
-            from .renderer_mesh_depth_material import RendererMeshDepthMaterial
-
-            changed_artists = RendererMeshDepthMaterial.render(
-                renderer=renderer,
-                mesh=mesh,
-                camera=camera,
-                faces_vertices_ndc=faces_vertices_ndc,
-                faces_vertices_2d=faces_vertices_2d,
-            )
-        elif isinstance(mesh.material, MeshPhongMaterial):
-            from .renderer_mesh_phong_material import RendererMeshPhongMaterial
-
-            changed_artists = RendererMeshPhongMaterial.render(
-                renderer=renderer,
-                camera=camera,
-                mesh=mesh,
-                faces_vertices_world=faces_vertices_world,
-                faces_vertices_ndc=faces_vertices_ndc,
-                faces_vertices_2d=faces_vertices_2d,
-            )
-        elif isinstance(mesh.material, MeshTexturedMaterial):
-            from .renderer_mesh_textured_material import RendererMeshTexturedMaterial
-
-            changed_artists = RendererMeshTexturedMaterial.render(
-                renderer=renderer,
-                mesh=mesh,
-                camera=camera,
-                faces_vertices_world=faces_vertices_world,
-                faces_vertices_2d=faces_vertices_2d,
-                faces_uvs=faces_uvs,
-            )
-        else:
-            raise ValueError(f"Unsupported material type: {type(mesh.material)}")
+        renderer_class, parameter_names = RendererMesh.get_material_renderer(type(material))
+
+        # pass each material renderer only the arrays it asks for
+        arguments = {
+            "renderer": renderer,
+            "mesh": mesh,
+            "camera": camera,
+            "faces_vertices_world": faces_vertices_world,
+            "faces_vertices_ndc": faces_vertices_ndc,
+            "faces_vertices_2d": faces_vertices_2d,
+            "faces_uvs": faces_uvs,
+        }
+        render_arguments = {name: arguments[name] for name in parameter_names}
+
+        # the material renderers with a .compute() compute their faces here too
+        if not hasattr(renderer_class, "compute"):
+            return renderer_class, render_arguments, None
+        return renderer_class, render_arguments, renderer_class.compute(**render_arguments)
+
+    @staticmethod
+    def apply(
+        renderer: "Renderer", mesh: Mesh, camera: Camera, computed: tuple[type, dict[str, typing.Any], tuple | None]
+    ) -> list[matplotlib.artist.Artist]:
+        """Update the artists of the mesh from the result of `.compute()`, and return the changed ones."""
+        assert mesh.geometry.indices is not None, "The mesh geometry must have face indices to be rendered"
+        renderer._add_input_faces(len(mesh.geometry.indices))
+        renderer_class, render_arguments, faces = computed
+        if faces is None:
+            return renderer_class.render(**render_arguments)
+
+        changed_artists = RendererUtils.update_faces_artist(renderer, mesh, camera, *faces)
         return changed_artists
+
+    # =============================================================================
+    # Material renderers registry
+    # =============================================================================
+    _material_renderers: dict[type, tuple[type, tuple[str, ...]]] = {}
+    """Renderer class registered for each material type, with the names of its `.render()` parameters."""
+    _material_renderers_resolved: dict[type, tuple[type, tuple[str, ...]]] = {}
+    """Renderer of each concrete material type, resolved once through its base classes."""
+
+    @staticmethod
+    def register_material_renderer(material_type: type, renderer_class: type) -> None:
+        """
+        Register the renderer class of a mesh material type. It is used for its subclasses too, unless they have their own.
+
+        `renderer_class.render()` is called with keyword arguments, among `renderer`, `mesh`, `camera`, `faces_vertices_world`,
+        `faces_vertices_ndc`, `faces_vertices_2d` and `faces_uvs` - only the ones it declares. It returns the changed artists.
+
+        Optionally, `renderer_class.compute()` takes the same arguments, and returns the ones of `RendererUtils.update_faces_artist()`
+        without touching any artist. Then the faces can be computed in the renderer worker threads - see `Renderer.thread_count`,
+        and they are reused by the next renders while the mesh, its material and the view do not change, so it must have no other effect.
+        """
+        RendererMesh._register_default_material_renderers()
+        parameter_names = tuple(inspect.signature(renderer_class.render).parameters)
+        RendererMesh._material_renderers[material_type] = (renderer_class, parameter_names)
+        RendererMesh._material_renderers_resolved.clear()
+
+    @staticmethod
+    def get_material_renderer(material_type: type) -> tuple[type, tuple[str, ...]]:
+        """Return the renderer class for a mesh material type, and the names of its `.render()` parameters."""
+        if material_type not in RendererMesh._material_renderers_resolved:
+            RendererMesh._register_default_material_renderers()
+            material_renderer = next((RendererMesh._material_renderers[base] for base in material_type.__mro__ if base in RendererMesh._material_renderers), None)
+            if material_renderer is None:
+                raise ValueError(f"Unsupported material type: {material_type}")
+            RendererMesh._material_renderers_resolved[material_type] = material_renderer
+        return RendererMesh._material_renderers_resolved[material_type]
+
+    @staticmethod
+    def _register_default_material_renderers() -> None:
+        if len(RendererMesh._material_renderers) > 0:
+            return
+
+        # imported here, as some material renderer modules import this one
+        from .renderer_mesh_basic_material import RendererMeshBasicMaterial
+        from .renderer_mesh_normal_material import RendererMeshNormalMaterial
+        from .renderer_mesh_depth_material import RendererMeshDepthMaterial
+        from .renderer_mesh_phong_material import RendererMeshPhongMaterial
+        from .renderer_mesh_textured_material import RendererMeshTexturedMaterial
+
+        for material_type, renderer_class in (
+            (MeshBasicMaterial, RendererMeshBasicMaterial),
+            (MeshNormalMaterial, RendererMeshNormalMaterial),
+            (MeshDepthMaterial, RendererMeshDepthMaterial),
+            (MeshPhongMaterial, RendererMeshPhongMaterial),
+            (MeshTexturedMaterial, RendererMeshTexturedMaterial),
+        ):
+            RendererMesh._material_renderers[material_type] = (renderer_class, tuple(inspect.signature(renderer_class.render).parameters))
@@ -1,9 +1,9 @@
 # stdlib imports
+import time
 import typing
 
 # pip imports
 import matplotlib.artist
-import matplotlib.collections
 import matplotlib.pyplot
 import numpy as np
 
@@ -26,8 +26,20 @@ class RendererMeshDepthMaterial:
         faces_vertices_ndc: np.ndarray,
         faces_vertices_2d: np.ndarray,
     ) -> list[matplotlib.artist.Artist]:
-        geometry = mesh.geometry
+        faces = RendererMeshDepthMaterial.compute(renderer, mesh, camera, faces_vertices_ndc, faces_vertices_2d)
+        changed_artists = RendererUtils.update_faces_artist(renderer, mesh, camera, *faces)
+        return changed_artists
+
+    @staticmethod
+    def compute(
+        renderer: "Renderer",
+        mesh: Mesh,
+        camera: Camera,
+        faces_vertices_ndc: np.ndarray,
+        faces_vertices_2d: np.ndarray,
+    ) -> tuple[np.ndarray, typing.Any, typing.Any, typing.Any]:
         material = typing.cast(MeshDepthMaterial, mesh.material)
+        time_start = time.perf_counter()
 
         # =============================================================================
         # Sanity checks
@@ -40,18 +52,18 @@ class RendererMeshDepthMaterial:
         # sanity check
         assert isinstance(material, MeshDepthMaterial), f"Expected material to be a MeshDepthMaterial, got {type(material)}"
         assert faces_vertices_ndc.shape == (
-            len(geometry.indices),
+            len(faces_vertices_ndc),
             3,
             3,
-        ), f"Expected faces_vertices_world to have shape {(len(geometry.indices), 3, 3)}, got {faces_vertices_ndc.shape}"
+        ), f"Expected faces_vertices_world to have shape {(len(faces_vertices_ndc), 3, 3)}, got {faces_vertices_ndc.shape}"
         assert faces_vertices_2d.shape == (
-            len(geometry.indices),
+            len(faces_vertices_ndc),
             3,
             2,
-        ), f"Expected faces_vertices_2d to have shape {(len(geometry.indices), 3, 2)}, got {faces_vertices_2d.shape}"
+        ), f"Expected faces_vertices_2d to have shape {(len(faces_vertices_ndc), 3, 2)}, got {faces_vertices_2d.shape}"
         assert len(faces_vertices_2d) == len(
-            geometry.indices
-        ), f"Expected faces_vertices_2d to have {len(geometry.indices)} faces, got {len(faces_vertices_2d)}"
+            faces_vertices_ndc
+        ), f"Expected faces_vertices_2d to have {len(faces_vertices_ndc)} faces, got {len(faces_vertices_2d)}"
 
         # =============================================================================
         # Computes face_colors
@@ -75,6 +87,9 @@ class RendererMeshDepthMaterial:
         colors_rgba = color_map(brightness)
         faces_color = colors_rgba
 
+        renderer._add_stage_time("shading", time_start, mesh)
+        time_start = time.perf_counter()
+
         # =============================================================================
         # Honor material.face_sorting
         # =============================================================================
@@ -87,11 +102,12 @@ class RendererMeshDepthMaterial:
         if material.face_sorting:
             # compute the depth of each face as the mean z value of its vertices
             faces_depth = faces_vertices_ndc[:, :, 2].mean(axis=1)
-            # get the sorting indices (from farthest to nearest)
-            depth_sorted_indices = np.argsort(faces_depth)
+            # get the sorting indices (from farthest to nearest) - larger NDC z is farther, so it is drawn first
+            depth_sorted_indices = np.argsort(-faces_depth, kind="stable")
             # apply the sorting to faces_vertices and faces_hidden
             # CAUTION: here reorder ALL arrays you use below to keep them in sync
             faces_vertices_2d = faces_vertices_2d[depth_sorted_indices]
+            faces_vertices_ndc = faces_vertices_ndc[depth_sorted_indices]
             faces_color = faces_color[depth_sorted_indices]
 
         # =============================================================================
@@ -103,39 +119,8 @@ class RendererMeshDepthMaterial:
 
         # remove hidden faces - CAUTION: must be done after sorting be sure to keep the order of ALL arrays the same
         faces_vertices_2d = faces_vertices_2d[faces_visible]
+        faces_vertices_ndc = faces_vertices_ndc[faces_visible]
         faces_color = faces_color[faces_visible]
 
-        # =============================================================================
-        # Create artists if needed
-        # =============================================================================
-        if mesh.uuid not in renderer._artists:
-            mpl_poly_collection = matplotlib.collections.PolyCollection([], clip_on=False, snap=False)
-            mpl_poly_collection.set_visible(False)  # hide until properly positioned and sized
-            renderer._axis.add_collection(mpl_poly_collection)
-            renderer._artists[mesh.uuid] = mpl_poly_collection
-
-        # =============================================================================
-        # Get the mpl_artist
-        # =============================================================================
-
-        mpl_poly_collection = typing.cast(matplotlib.collections.PolyCollection, renderer._artists[mesh.uuid])
-        mpl_poly_collection.set_visible(True)
-
-        # =============================================================================
-        # do z-ordering based on distance to camera
-        # =============================================================================
-
-        # compute and set zorder on our single artist
-        RendererUtils.update_single_artist_zorder(camera, mesh, mpl_poly_collection)
-
-        # =============================================================================
-        # Update all the artists
-        # =============================================================================
-
-        # update the PathCollection with the new patches
-        mpl_poly_collection.set_verts(typing.cast(list, faces_vertices_2d))
-        mpl_poly_collection.set_facecolor(typing.cast(list, faces_color))
-        mpl_poly_collection.set_edgecolor(typing.cast(list, material.edge_colors))
-        mpl_poly_collection.set_linewidth(typing.cast(list, material.edge_widths))
-
-        return [mpl_poly_collection]
+        renderer._add_stage_time("sorting", time_start, mesh)
+        return faces_vertices_ndc, faces_color, material.edge_colors, material.edge_widths
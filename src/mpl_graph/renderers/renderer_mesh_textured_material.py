@@ -44,15 +44,16 @@ class RendererMeshTexturedMaterial:
         # =============================================================================
 
         faces_visible = RendererUtils.compute_faces_visible(faces_vertices_2d, material.face_culling)
+        renderer._add_drawn_faces(int(np.count_nonzero(faces_visible)))
 
         # =============================================================================
         # Lighting - compute faces_color
         # =============================================================================
 
-        # get the scene lights in the scene graph
+        # get the scene lights from the scene index - no traversal needed
         scene = mesh.root()
         assert isinstance(scene, Scene)
-        lights: list[Light] = [child for child in scene.traverse() if isinstance(child, Light)]
+        lights: list[Light] = scene.get_objects_by_type(Light)
 
         # compute face normals and centroids in world space
         faces_normals_unit = RendererUtils.compute_faces_normal_unit(faces_vertices_world)
@@ -79,21 +80,33 @@ class RendererMeshTexturedMaterial:
         # =============================================================================
         # Create the artists if needed
         # =============================================================================
-        face_uuid = f"{mesh.uuid}_face_0"
-        if face_uuid not in renderer._artists:
-            # Create a list of axes images for each face
-            faces_count = len(faces_vertices_2d)
-            fake_texture = np.zeros((1, 1, 3), dtype=np.uint8)
-            for face_index in range(faces_count):
-                axes_image = renderer._axis.imshow(fake_texture, origin="lower", extent=(0, 0, 0, 0))
-                axes_image.set_visible(False)  # hide until properly positioned and sized
-                face_uuid = f"{mesh.uuid}_face_{face_index}"
-                renderer._artists[face_uuid] = axes_image
+        # - the faces count may change between renders, as faces are clipped by the camera
+        # - so create an axes image for each face not having one yet
+        faces_count = len(faces_vertices_2d)
+        fake_texture = np.zeros((1, 1, 3), dtype=np.uint8)
+        for face_index in range(faces_count):
+            face_uuid = f"{mesh.uuid}_face_{face_index}"
+            if face_uuid in renderer._artists:
+                continue
+            axes_image = renderer._axis.imshow(fake_texture, origin="lower", extent=(0, 0, 0, 0))
+            axes_image.set_visible(False)  # hide until properly positioned and sized
+            renderer._artists[face_uuid] = axes_image
 
         # =============================================================================
-        # Loop over faces and draw them
+        # Hide the axes images of the faces not rendered this time
         # =============================================================================
         changed_artists: list[matplotlib.artist.Artist] = []
+        face_index = faces_count
+        while (face_uuid := f"{mesh.uuid}_face_{face_index}") in renderer._artists:
+            axes_image = typing.cast(matplotlib.image.AxesImage, renderer._artists[face_uuid])
+            if axes_image.get_visible():
+                axes_image.set_visible(False)
+                changed_artists.append(axes_image)
+            face_index += 1
+
+        # =============================================================================
+        # Loop over faces and draw them
+        # =============================================================================
         for face_index, (face_vertices_2d, face_uvs, face_color, face_visible, face_depth) in enumerate(
             zip(faces_vertices_2d, faces_uvs, faces_color, faces_visible, faces_depth)
         ):
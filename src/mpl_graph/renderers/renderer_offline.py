@@ -0,0 +1,125 @@
+# stdlib imports
+import concurrent.futures
+import multiprocessing
+import os
+import typing
+
+# pip imports
+import matplotlib
+import matplotlib.image
+import numpy as np
+
+# local imports
+from .renderer import Renderer
+from ..objects.scene import Scene
+from ..cameras.camera import Camera
+
+OfflineUpdateCallback = typing.Callable[[float], typing.Any]
+"""Update the scene for the next frame. Called with the delta time in seconds, like the animation loop callbacks."""
+OfflineSceneFactory = typing.Callable[[], tuple[Renderer, Scene, Camera, OfflineUpdateCallback]]
+"""Build the renderer, the scene, the camera and the update callback. It must be picklable, e.g. a module level function."""
+
+
+class RendererOffline:
+    @staticmethod
+    def render_frames(
+        scene_factory: OfflineSceneFactory,
+        frame_count: int,
+        fps: float = 30.0,
+        output_path: str | None = None,
+        frame_format: str = "png",
+        process_count: int | None = None,
+    ) -> list[str] | np.ndarray:
+        """
+        Render the frames of an animation at fixed simulated timesteps, in parallel over a process pool.
+
+        The frames are split in contiguous ranges, one per process. Each process builds its own renderer and scene with
+        `scene_factory()`, then calls the update callback with `1 / fps` for each frame - frame N shows the scene after N
+        updates. The frames before its range are only updated, not rendered, so stateful callbacks give the same frames
+        whatever the process count, as long as the factory is deterministic (e.g. seeds its random generators).
+
+        The processes are spawned and draw with the Agg backend, so the factory must be importable by them: a module level
+        function, in a script guarded by `if __name__ == "__main__":`.
+
+        Arguments:
+            scene_factory (OfflineSceneFactory): builds (renderer, scene, camera, update_callback)
+            frame_count (int): number of frames to render
+            fps (float): frames per second of the animation, giving the timestep
+            output_path (str | None): folder to write the frames into, named `frame_00000.png` etc... If None, return the frames.
+            frame_format (str): "png" for images, "npy" for raw RGBA arrays
+            process_count (int | None): number of processes, default to the number of cpus. 1 renders in this process.
+
+        Returns:
+            list[str] | np.ndarray: the frame paths in order, or the frames as an RGBA uint8 array of shape (frame_count, height, width, 4)
+        """
+        assert frame_count > 0, f"frame_count should be > 0. Got {frame_count}"
+        assert fps > 0, f"fps should be > 0. Got {fps}"
+        assert frame_format in ("png", "npy"), f"frame_format should be 'png' or 'npy'. Got {frame_format}"
+
+        if output_path is not None:
+            os.makedirs(output_path, exist_ok=True)
+
+        # split the frames in contiguous ranges, one per process
+        process_count = min(process_count if process_count is not None else (os.cpu_count() or 1), frame_count)
+        range_bounds = np.linspace(0, frame_count, process_count + 1).astype(int)
+        frame_ranges = [(int(frame_start), int(frame_end)) for frame_start, frame_end in zip(range_bounds[:-1], range_bounds[1:])]
+
+        if process_count == 1:
+            ranges_results = [RendererOffline._render_frame_range(scene_factory, 0, frame_count, fps, output_path, frame_format)]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=process_count, mp_context=multiprocessing.get_context("spawn"), initializer=RendererOffline._init_worker
+            ) as executor:
+                futures = [
+                    executor.submit(RendererOffline._render_frame_range, scene_factory, frame_start, frame_end, fps, output_path, frame_format)
+                    for frame_start, frame_end in frame_ranges
+                ]
+                # in frame order, whatever the order they complete in
+                ranges_results = [future.result() for future in futures]
+
+        if output_path is not None:
+            return [frame_path for range_result in ranges_results for frame_path in typing.cast(list[str], range_result)]
+        return np.concatenate(typing.cast(list[np.ndarray], ranges_results))
+
+    # =============================================================================
+    # Private functions
+    # =============================================================================
+
+    @staticmethod
+    def _init_worker() -> None:
+        # offline rendering needs no window
+        matplotlib.use("Agg")
+
+    @staticmethod
+    def _render_frame_range(
+        scene_factory: OfflineSceneFactory, frame_start: int, frame_end: int, fps: float, output_path: str | None, frame_format: str
+    ) -> list[str] | np.ndarray:
+        """Render the frames [frame_start, frame_end). Return the written frame paths, or the frames if output_path is None."""
+        renderer, scene, camera, update_callback = scene_factory()
+        delta_time = 1.0 / fps
+
+        frame_paths: list[str] = []
+        frames: list[np.ndarray] = []
+        try:
+            for frame_index in range(frame_end):
+                # frame N shows the scene after N updates
+                if frame_index > 0:
+                    update_callback(delta_time)
+                if frame_index < frame_start:
+                    continue
+
+                image = renderer.render_to_array(scene, camera, copy=output_path is None)
+                if output_path is None:
+                    frames.append(image)
+                    continue
+
+                frame_path = os.path.join(output_path, f"frame_{frame_index:05d}.{frame_format}")
+                if frame_format == "png":
+                    matplotlib.image.imsave(frame_path, image)
+                else:
+                    np.save(frame_path, image)
+                frame_paths.append(frame_path)
+        finally:
+            renderer.close()
+
+        return frame_paths if output_path is not None else np.stack(frames)
@@ -13,6 +13,7 @@ from ..cameras.camera import Camera
 from ..math.transform_utils import TransformUtils
 from ..geometry.geometry_utils import GeometryUtils
 from ..renderers.renderer_utils import RendererUtils
+from ..math.grid_index_2d import GridIndex2D
 
 
 class RendererPoints:
@@ -32,21 +33,33 @@ class RendererPoints:
         mvp_matrix = TransformUtils.compute_mvp_matrix(camera, points)
         vertices_npc, vertices_clip = GeometryUtils.apply_mvp_matrix(vertices_localspace, mvp_matrix)
 
-        # dispatch the post_transforming event
-        points.post_transform.dispatch(vertices_clip)
+        # dispatch the post_transforming event - skipped if nobody subscribed
+        if points.has_post_transform_subscribers():
+            points.post_transform.dispatch(vertices_clip)
+
+        # retain the 2D projections for picking - before the depth sorting, to keep the vertex indices
+        # - the grid index is built only if queried
+        if renderer.points_picking:
+            renderer._points_grid_indices[points.uuid] = (points, GridIndex2D(vertices_npc[:, :2]))
 
         # =============================================================================
         # Depth sort at the faces level
         # =============================================================================
 
         # Sort polygons by depth (painter's algorithm)
+        points_colors, points_sizes, points_edge_colors, points_edge_widths = material.colors, material.sizes, material.edge_colors, material.edge_widths
         if material.depth_sorting:
             # compute the depth of each face as the mean z value of its vertices
             points_depth = vertices_npc[:, 2]
-            # get the sorting indices (from farthest to nearest)
-            depth_sorted_indices = np.argsort(points_depth)
+            # get the sorting indices (from farthest to nearest) - larger NDC z is farther, so it is drawn first
+            depth_sorted_indices = np.argsort(-points_depth, kind="stable")
             # apply the sorting to vertices_npc
             vertices_npc = vertices_npc[depth_sorted_indices]
+            # CAUTION: reorder the per-point attributes too, to keep them with their points - a single value applies to all
+            points_colors, points_sizes, points_edge_colors, points_edge_widths = (
+                attribute[depth_sorted_indices] if len(attribute) == len(depth_sorted_indices) else attribute
+                for attribute in (points_colors, points_sizes, points_edge_colors, points_edge_widths)
+            )
 
         # =============================================================================
         # Switch vertices to 2d
@@ -83,9 +96,32 @@ class RendererPoints:
         # =============================================================================
 
         mpl_path_collection.set_offsets(offsets=vertices_2d)
-        mpl_path_collection.set_sizes(typing.cast(list, material.sizes))  # set a default size for each point
-        mpl_path_collection.set_color(typing.cast(list, material.colors))
-        mpl_path_collection.set_edgecolor(typing.cast(list, material.edge_colors))
-        mpl_path_collection.set_linewidth(typing.cast(list, material.edge_widths))
+        mpl_path_collection.set_sizes(typing.cast(list, points_sizes))  # set a default size for each point
+        mpl_path_collection.set_color(typing.cast(list, points_colors))
+        mpl_path_collection.set_edgecolor(typing.cast(list, points_edge_colors))
+        mpl_path_collection.set_linewidth(typing.cast(list, points_edge_widths))
 
         return [mpl_path_collection]
+
+    # =============================================================================
+    # Picking
+    # =============================================================================
+
+    @staticmethod
+    def pick_points(renderer: "Renderer", x: float, y: float, radius: float) -> tuple[Points, int, float] | None:
+        """
+        Return the nearest projected point to (x, y) as (points, vertex_index, distance), or None if none is within radius.
+        - x, y and radius are in normalized device coordinates - `event.xdata` and `event.ydata` of a matplotlib mouse event
+        - uses the projections of the last render, so the renderer must be created with `points_picking=True`
+        """
+        assert renderer.points_picking, "The renderer must be created with points_picking=True"
+
+        nearest: tuple[Points, int, float] | None = None
+        for points, grid_index in renderer._points_grid_indices.values():
+            # skip the points not drawn during the last render (e.g. culled)
+            if not renderer._artists[points.uuid].get_visible():
+                continue
+            vertex_index, distance = grid_index.query_nearest(x, y, radius)
+            if vertex_index >= 0 and (nearest is None or distance < nearest[2]):
+                nearest = (points, vertex_index, distance)
+        return nearest
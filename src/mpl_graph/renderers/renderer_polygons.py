@@ -1,11 +1,9 @@
 # stdlib imports
+import time
 import typing
 
 # pip imports
 import matplotlib.artist
-import matplotlib.collections
-import matplotlib.lines
-import matplotlib.patches
 import numpy as np
 
 from mpl_graph.renderers.renderer_utils import RendererUtils
@@ -22,8 +20,19 @@ from ..core.constants import Constants
 class RendererPolygons:
     @staticmethod
     def render(renderer: "Renderer", polygons: Polygons, camera: Camera) -> list[matplotlib.artist.Artist]:
+        computed = RendererPolygons.compute(renderer, polygons, camera)
+        changed_artists = RendererPolygons.apply(renderer, polygons, camera, computed)
+        return changed_artists
+
+    @staticmethod
+    def compute(renderer: "Renderer", polygons: Polygons, camera: Camera) -> tuple[np.ndarray, typing.Any, typing.Any, typing.Any]:
+        """
+        Compute the polygons to draw, without touching any artist - so it can run in a worker thread.
+        Return the arguments of `RendererUtils.update_faces_artist()`: (faces_vertices_ndc, faces_colors, edge_colors, edge_widths)
+        """
         geometry = polygons.geometry
         material = polygons.material
+        time_start = time.perf_counter()
 
         # TODO factorize with RendererMesh
 
@@ -38,13 +47,36 @@ class RendererPolygons:
 
         # full_transform = polygons.get_world_matrix()
         mvp_matrix = TransformUtils.compute_mvp_matrix(camera, polygons)
-        vertices_ndc, vertices_clip = GeometryUtils.apply_mvp_matrix(vertices_localspace, mvp_matrix)
+        vertices_clip = GeometryUtils.apply_mvp_matrix_homogeneous(vertices_localspace, mvp_matrix)
+
+        # reshape to faces - shape [P, V, 4]
+        faces_vertices_clip = vertices_clip.reshape(polygons.polygon_count, polygons.vertices_per_polygon, 4)
+
+        # dispatch the post_transforming event - skipped if nobody subscribed
+        if polygons.has_post_transform_subscribers():
+            polygons.post_transform.dispatch(vertices_clip[:, :3])
+
+        # =============================================================================
+        # Clip the polygons - before any per-face work
+        # =============================================================================
 
-        # reshape to faces - shape [P, V, 3]
-        faces_vertices_ndc = vertices_ndc.reshape(polygons.polygon_count, polygons.vertices_per_polygon, 3)
+        # reject the polygons fully outside of the clip volume
+        faces_indices = np.flatnonzero(~RendererUtils.compute_faces_outside_clip_volume(faces_vertices_clip))
 
-        # dispatch the post_transforming event
-        polygons.post_transform.dispatch(vertices_clip)
+        # clip the polygons crossing the near plane, so no vertex get divided by w <= 0
+        faces_weights: np.ndarray | None = None
+        if RendererUtils.compute_faces_crossing_near_plane(faces_vertices_clip[faces_indices]).any():
+            faces_weights = RendererUtils.clip_polygons_near_plane(faces_vertices_clip, faces_indices)
+        faces_vertices_clip = RendererUtils.interpolate_faces_attribute(faces_vertices_clip, faces_indices, faces_weights)
+
+        # keep the per-polygon colors in sync - CAUTION: here update them with ALL the per-face arrays below
+        per_face_colors = len(material.colors) == polygons.polygon_count
+        faces_color = material.colors[faces_indices] if per_face_colors else material.colors
+
+        # perspective divide - shape [P, V, 3]
+        faces_vertices_ndc = faces_vertices_clip[..., :3] / faces_vertices_clip[..., 3:4]
+        renderer._add_stage_time("transform", time_start, polygons)
+        time_start = time.perf_counter()
 
         # =============================================================================
         # Face culling
@@ -77,6 +109,8 @@ class RendererPolygons:
 
         # remove hidden faces
         faces_vertices_ndc = faces_vertices_ndc[faces_visible]
+        if per_face_colors:
+            faces_color = faces_color[faces_visible]
 
         # =============================================================================
         # Depth sort at the faces level
@@ -86,48 +120,21 @@ class RendererPolygons:
         if material.depth_sorting:
             # compute the depth of each face as the mean z value of its vertices
             faces_depth = faces_vertices_ndc[:, :, 2].mean(axis=1)
-            # get the sorting indices (from farthest to nearest)
-            depth_sorted_indices = np.argsort(faces_depth)
+            # get the sorting indices (from farthest to nearest) - larger NDC z is farther, so it is drawn first
+            depth_sorted_indices = np.argsort(-faces_depth, kind="stable")
             # apply the sorting to faces_vertices
             faces_vertices_ndc = faces_vertices_ndc[depth_sorted_indices]
+            if per_face_colors:
+                faces_color = faces_color[depth_sorted_indices]
 
-        # =============================================================================
-        # Switch vertices to 2d
-        # =============================================================================
-
-        faces_vertices_2d = faces_vertices_ndc[:, :, :2]  # drop z for 2D rendering
-
-        # =============================================================================
-        # Create artists if needed
-        # =============================================================================
-        if polygons.uuid not in renderer._artists:
-            mpl_poly_collection = matplotlib.collections.PolyCollection([], clip_on=False, snap=False)
-            mpl_poly_collection.set_visible(False)  # hide until properly positioned and sized
-            renderer._axis.add_collection(mpl_poly_collection)
-            renderer._artists[polygons.uuid] = mpl_poly_collection
-
-        # =============================================================================
-        # Get the mpl_artist
-        # =============================================================================
-
-        mpl_poly_collection = typing.cast(matplotlib.collections.PolyCollection, renderer._artists[polygons.uuid])
-        mpl_poly_collection.set_visible(True)
-
-        # =============================================================================
-        # do z-ordering based on distance to camera
-        # =============================================================================
-
-        # compute and set zorder on our single artist
-        RendererUtils.update_single_artist_zorder(camera, polygons, mpl_poly_collection)
+        renderer._add_stage_time("sorting", time_start, polygons)
+        return faces_vertices_ndc, faces_color, (0, 0, 0, 0.3), 0.5
 
-        # =============================================================================
-        # Update all the artists
-        # =============================================================================
-
-        # update the PathCollection with the new patches
-        mpl_poly_collection.set_verts(typing.cast(list, faces_vertices_2d))
-        mpl_poly_collection.set_facecolor(typing.cast(list, material.colors))
-        mpl_poly_collection.set_edgecolor((0, 0, 0, 0.3))
-        mpl_poly_collection.set_linewidth(0.5)
-
-        return [mpl_poly_collection]
+    @staticmethod
+    def apply(
+        renderer: "Renderer", polygons: Polygons, camera: Camera, computed: tuple[np.ndarray, typing.Any, typing.Any, typing.Any]
+    ) -> list[matplotlib.artist.Artist]:
+        """Update the artist of the polygons from the result of `.compute()`, and return the changed ones."""
+        renderer._add_input_faces(polygons.polygon_count)
+        changed_artists = RendererUtils.update_faces_artist(renderer, polygons, camera, *computed)
+        return changed_artists
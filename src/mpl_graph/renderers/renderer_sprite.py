@@ -33,8 +33,9 @@ class RendererSprite:
         mvp_matrix = TransformUtils.compute_mvp_matrix(camera, sprite)
         vertices_ndc, vertices_clip = GeometryUtils.apply_mvp_matrix(vertices_localspace, mvp_matrix)
 
-        # dispatch the post_transforming event
-        sprite.post_transform.dispatch(vertices_clip)
+        # dispatch the post_transforming event - skipped if nobody subscribed
+        if sprite.has_post_transform_subscribers():
+            sprite.post_transform.dispatch(vertices_clip)
 
         # =============================================================================
         # Switch vertices to 2d
@@ -86,7 +87,11 @@ class RendererSprite:
         # Update the artist
         # =============================================================================
 
-        mpl_axes_image.set_array(material.texture.data)
+        # upload the texture only if it changed - set_array() makes matplotlib resample the image
+        texture_inputs = (material.texture, material.texture.version)
+        if renderer._artists_inputs.get(sprite.uuid) != texture_inputs:
+            mpl_axes_image.set_array(material.texture.data)
+            renderer._artists_inputs[sprite.uuid] = texture_inputs
         mpl_axes_image.set_extent(extent_2d)
 
         return [mpl_axes_image]
@@ -31,8 +31,9 @@ class RendererText:
         mvp_matrix = TransformUtils.compute_mvp_matrix(camera, text)
         vertices_ndc, vertices_clip = GeometryUtils.apply_mvp_matrix(vertices_localspace, mvp_matrix)
 
-        # dispatch the post_transforming event
-        text.post_transform.dispatch(vertices_clip)
+        # dispatch the post_transforming event - skipped if nobody subscribed
+        if text.has_post_transform_subscribers():
+            text.post_transform.dispatch(vertices_clip)
 
         # =============================================================================
         # Switch vertices to 2d
@@ -1,5 +1,11 @@
+# stdlib imports
+import time
+import typing
+
 # pip imports
 import matplotlib.artist
+import matplotlib.collections
+import matplotlib.colors
 import numpy as np
 
 # local imports
@@ -8,6 +14,9 @@ from ..core import Object3D
 from ..core.constants import Constants
 from ..lights import Light, DirectionalLight, PointLight, AmbientLight
 
+if typing.TYPE_CHECKING:
+    from .renderer import Renderer
+
 
 class RendererUtils:
 
@@ -31,6 +40,86 @@ class RendererUtils:
         # set the artist zorder
         artist.set_zorder(object_zorder)
 
+    @staticmethod
+    def update_faces_artist(
+        renderer: "Renderer",
+        object3d: Object3D,
+        camera: Camera,
+        faces_vertices_ndc: np.ndarray,
+        faces_colors: typing.Any,
+        edge_colors: typing.Any,
+        edge_widths: typing.Any,
+    ) -> list[matplotlib.artist.Artist]:
+        """
+        Draw the faces of an object in its PolyCollection, and return the changed artists.
+
+        The artist zorder is based on the distance from the camera to the object. If `renderer.merged_depth_sorting` is True,
+        the faces are kept in the renderer instead, to be drawn with the faces of the other objects in a single PolyCollection
+        sorted by depth - see `Renderer._update_merged_faces_artist()`.
+
+        Arguments:
+            faces_vertices_ndc (np.ndarray): shape [N, V, 3], the faces to draw, in drawing order
+            faces_colors, edge_colors, edge_widths: as accepted by PolyCollection - one per face, or cycled over the faces
+        """
+        time_start = time.perf_counter()
+        renderer._add_drawn_faces(len(faces_vertices_ndc))
+        faces_vertices_2d = faces_vertices_ndc[:, :, :2]  # drop z for 2D rendering
+
+        if renderer.merged_depth_sorting:
+            # hide the own artist, in case it got rendered before merged_depth_sorting was enabled
+            changed_artists = renderer._hide_artists(object3d.uuid)
+
+            # expand the colors and widths to one per face, the same way matplotlib cycles them
+            face_count = len(faces_vertices_ndc)
+            distance_to_camera = float(np.linalg.norm(camera.get_world_position() - object3d.get_world_position()))
+            renderer._merged_faces[object3d.uuid] = (
+                faces_vertices_ndc[:, :, 2].mean(axis=1),
+                faces_vertices_2d,
+                np.resize(matplotlib.colors.to_rgba_array(faces_colors), (face_count, 4)),
+                np.resize(matplotlib.colors.to_rgba_array(edge_colors), (face_count, 4)),
+                np.resize(np.asarray(edge_widths, dtype=np.float64).ravel(), face_count),
+                distance_to_camera,
+            )
+            renderer._merged_faces_changed = True
+            renderer._add_stage_time("artist_update", time_start, object3d)
+            return changed_artists
+
+        # =============================================================================
+        # Create artists if needed
+        # =============================================================================
+        if object3d.uuid not in renderer._artists:
+            mpl_poly_collection = matplotlib.collections.PolyCollection([], clip_on=False, snap=False)
+            mpl_poly_collection.set_visible(False)  # hide until properly positioned and sized
+            renderer._axis.add_collection(mpl_poly_collection)
+            renderer._artists[object3d.uuid] = mpl_poly_collection
+
+        # =============================================================================
+        # Get the mpl_artist
+        # =============================================================================
+
+        mpl_poly_collection = typing.cast(matplotlib.collections.PolyCollection, renderer._artists[object3d.uuid])
+        mpl_poly_collection.set_visible(True)
+
+        # =============================================================================
+        # do z-ordering based on distance to camera
+        # =============================================================================
+
+        # compute and set zorder on our single artist
+        RendererUtils.update_single_artist_zorder(camera, object3d, mpl_poly_collection)
+
+        # =============================================================================
+        # Update all the artists
+        # =============================================================================
+
+        # update the PathCollection with the new patches
+        mpl_poly_collection.set_verts(typing.cast(list, faces_vertices_2d))
+        mpl_poly_collection.set_facecolor(typing.cast(list, faces_colors))
+        mpl_poly_collection.set_edgecolor(typing.cast(list, edge_colors))
+        mpl_poly_collection.set_linewidth(typing.cast(list, edge_widths))
+
+        renderer._add_stage_time("artist_update", time_start, object3d)
+        return [mpl_poly_collection]
+
     @staticmethod
     def compute_faces_centroids(faces_vertices_world: np.ndarray) -> np.ndarray:
         """Compute the face centroids.
@@ -172,3 +261,137 @@ class RendererUtils:
             shaded += specular
 
         return np.clip(shaded, 0, 1)
+
+    # =============================================================================
+    # Clip space
+    # =============================================================================
+    # faces_vertices_clip are homogeneous clip space coordinates, shape [F, K, 4], before the perspective divide.
+    # A vertex is inside the clip volume when -w <= x <= w, -w <= y <= w and -w <= z (near plane).
+    # The far plane is not used - the renderers never clipped on it, objects beyond it are still drawn.
+
+    @staticmethod
+    def compute_faces_outside_clip_volume(faces_vertices_clip: np.ndarray) -> np.ndarray:
+        """Return a boolean array of shape [F] - True for the faces with all their vertices outside the same clip plane."""
+        x, y, z, w = np.moveaxis(faces_vertices_clip, -1, 0)
+        faces_outside = (x < -w).all(axis=1)
+        faces_outside |= (x > w).all(axis=1)
+        faces_outside |= (y < -w).all(axis=1)
+        faces_outside |= (y > w).all(axis=1)
+        faces_outside |= (z < -w).all(axis=1)
+        return faces_outside
+
+    @staticmethod
+    def compute_faces_crossing_near_plane(faces_vertices_clip: np.ndarray) -> np.ndarray:
+        """Return a boolean array of shape [F] - True for the faces with at least one vertex behind the near plane."""
+        return (faces_vertices_clip[..., 2] + faces_vertices_clip[..., 3] < 0).any(axis=1)
+
+    @staticmethod
+    def clip_faces_near_plane(faces_vertices_clip: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Clip convex faces against the near plane (vectorized Sutherland-Hodgman).
+        - each face must have at least one vertex in front of the near plane
+        - a clipped face has at most K+1 vertices, the unused slots repeat the last vertex
+
+        Args:
+            faces_vertices_clip (np.ndarray): shape = [F, K, 4] in clip space
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+            - faces_weights, shape = [F, K+1, K]: each clipped vertex is `faces_weights @ faces_vertices_clip`,
+              use them to interpolate any other per-vertex attribute (world position, uvs...)
+            - faces_vertex_count, shape = [F]: number of vertices of each clipped face
+        """
+        faces_count, vertices_per_face = faces_vertices_clip.shape[:2]
+        next_indices = (np.arange(vertices_per_face) + 1) % vertices_per_face
+        identity = np.eye(vertices_per_face, dtype=np.float32)
+
+        # signed distances to the near plane - positive in front of it
+        distances = faces_vertices_clip[..., 2] + faces_vertices_clip[..., 3]
+        distances_next = distances[:, next_indices]
+        inside = distances >= 0
+        crossing = inside != (distances_next >= 0)
+
+        # for each edge i -> i+1, 2 candidate vertices: the vertex i if inside, then the intersection if the edge crosses the plane
+        edge_ratios = np.divide(distances, distances - distances_next, out=np.zeros_like(distances), where=crossing)
+        weights_vertex = np.broadcast_to(identity, (faces_count, vertices_per_face, vertices_per_face))
+        weights_intersection = (1.0 - edge_ratios)[..., np.newaxis] * identity + edge_ratios[..., np.newaxis] * identity[next_indices]
+        candidates_weights = np.stack([weights_vertex, weights_intersection], axis=2).reshape(faces_count, 2 * vertices_per_face, vertices_per_face)
+        candidates_valid = np.stack([inside, crossing], axis=2).reshape(faces_count, 2 * vertices_per_face)
+
+        # move the valid candidates first, keeping their order, and keep K+1 of them
+        candidates_order = np.argsort(~candidates_valid, axis=1, kind="stable")[:, : vertices_per_face + 1]
+        faces_weights = np.take_along_axis(candidates_weights, candidates_order[..., np.newaxis], axis=1)
+
+        # pad the unused slots with the last vertex - a concave face may have more vertices, they are dropped
+        faces_vertex_count = np.minimum(candidates_valid.sum(axis=1), vertices_per_face + 1)
+        faces_last_weights = faces_weights[np.arange(faces_count), faces_vertex_count - 1]
+        slots_unused = np.arange(vertices_per_face + 1) >= faces_vertex_count[:, np.newaxis]
+        faces_weights = np.where(slots_unused[..., np.newaxis], faces_last_weights[:, np.newaxis, :], faces_weights)
+
+        return faces_weights, faces_vertex_count
+
+    @staticmethod
+    def clip_triangles_near_plane(faces_vertices_clip: np.ndarray, faces_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Clip the triangles `faces_vertices_clip[faces_indices]` against the near plane.
+        - a triangle with 2 vertices behind the near plane stays a triangle
+        - a triangle with 1 vertex behind the near plane becomes 2 triangles
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: to use with `.interpolate_faces_attribute()`
+            - faces_indices, shape = [F']: index of the source triangle of each output triangle, in increasing order
+            - faces_weights, shape = [F', 3, 3]
+        """
+        assert faces_vertices_clip.shape[1:] == (3, 4), f"faces_vertices_clip should be of shape [F, 3, 4], got {faces_vertices_clip.shape}"
+
+        faces_crossing = RendererUtils.compute_faces_crossing_near_plane(faces_vertices_clip[faces_indices])
+        crossing_indices = faces_indices[faces_crossing]
+        clipped_weights, clipped_vertex_count = RendererUtils.clip_faces_near_plane(faces_vertices_clip[crossing_indices])
+
+        # triangulate the clipped faces as a fan - the quads give a second triangle
+        faces_quad = clipped_vertex_count == 4
+        triangles_indices = np.concatenate([faces_indices[~faces_crossing], crossing_indices, crossing_indices[faces_quad]])
+        triangles_weights = np.concatenate(
+            [
+                np.broadcast_to(np.eye(3, dtype=np.float32), (int((~faces_crossing).sum()), 3, 3)),
+                clipped_weights[:, [0, 1, 2]],
+                clipped_weights[faces_quad][:, [0, 2, 3]],
+            ]
+        )
+
+        # keep the source order of the faces - it is the drawing order when the faces are not sorted
+        triangles_order = np.argsort(triangles_indices, kind="stable")
+        return triangles_indices[triangles_order], triangles_weights[triangles_order]
+
+    @staticmethod
+    def clip_polygons_near_plane(faces_vertices_clip: np.ndarray, faces_indices: np.ndarray) -> np.ndarray:
+        """
+        Clip the convex polygons `faces_vertices_clip[faces_indices]` against the near plane.
+
+        Returns:
+            np.ndarray: faces_weights, shape = [F, K+1, K], to use with `.interpolate_faces_attribute()` and `faces_indices`
+        """
+        vertices_per_face = faces_vertices_clip.shape[1]
+        faces_crossing = RendererUtils.compute_faces_crossing_near_plane(faces_vertices_clip[faces_indices])
+
+        # the polygons in front of the near plane repeat their last vertex
+        faces_weights = np.empty((len(faces_indices), vertices_per_face + 1, vertices_per_face), dtype=np.float32)
+        faces_weights[:, :vertices_per_face] = np.eye(vertices_per_face)
+        faces_weights[:, vertices_per_face] = faces_weights[:, vertices_per_face - 1]
+        faces_weights[faces_crossing] = RendererUtils.clip_faces_near_plane(faces_vertices_clip[faces_indices[faces_crossing]])[0]
+        return faces_weights
+
+    @staticmethod
+    def interpolate_faces_attribute(faces_attribute: np.ndarray, faces_indices: np.ndarray, faces_weights: np.ndarray | None) -> np.ndarray:
+        """
+        Return the per-vertex attribute of the clipped faces.
+
+        Args:
+            faces_attribute (np.ndarray): shape = [F, K, C] e.g. faces_vertices_world or faces_uvs
+            faces_indices (np.ndarray): shape = [F'], index of the source face of each clipped face
+            faces_weights (np.ndarray | None): shape = [F', K', K], or None if no face got clipped
+        Returns:
+            np.ndarray: shape = [F', K', C]
+        """
+        if faces_weights is None:
+            return faces_attribute[faces_indices]
+        return (faces_weights @ faces_attribute[faces_indices]).astype(faces_attribute.dtype)
@@ -0,0 +1,109 @@
+import unittest
+import numpy as np
+from pyrr import quaternion
+
+from mpl_graph.core.object_3d import Object3D
+from mpl_graph.geometry import Geometry, BoundsUtils
+from mpl_graph.objects import Points
+
+
+class TestBounds(unittest.TestCase):
+    def test_geometry_bounds_are_cached_and_invalidated(self):
+        geometry = Geometry(np.array([[-1.0, 0.0, 0.0], [1.0, 2.0, 0.0], [0.0, 0.0, 4.0]], dtype=np.float32))
+        bounding_box = geometry.get_bounding_box()
+        assert bounding_box is not None
+        np.testing.assert_allclose(bounding_box, [[-1.0, 0.0, 0.0], [1.0, 2.0, 4.0]])
+        self.assertIs(geometry.get_bounding_box(), bounding_box)
+
+        # every vertex is inside the sphere
+        bounding_sphere = geometry.get_bounding_sphere()
+        assert bounding_sphere is not None
+        distances = np.linalg.norm(geometry.vertices - bounding_sphere[:3], axis=1)
+        self.assertTrue(np.all(distances <= bounding_sphere[3] + 1e-6))
+
+        # assigning new vertices invalidates the cache
+        geometry.vertices = np.zeros((2, 3), dtype=np.float32)
+        np.testing.assert_allclose(geometry.get_bounding_box(), np.zeros((2, 3)))
+
+        # empty geometry has no bounds
+        self.assertIsNone(Geometry().get_bounding_box())
+
+    def test_transform_bounding_box_contains_transformed_corners(self):
+        bounding_box = np.array([[-1.0, -2.0, -3.0], [1.0, 2.0, 3.0]], dtype=np.float32)
+        object3d = Object3D()
+        object3d.position = np.array([5.0, 0.0, -1.0])
+        object3d.rotation = quaternion.create_from_eulers([0.3, 0.5, -0.2], dtype=np.float32)
+        object3d.scale = np.array([2.0, 1.0, 0.5])
+        object3d.update_world_matrix()
+        matrix = object3d.get_world_matrix()
+
+        corners = np.array([[x, y, z] for x in bounding_box[:, 0] for y in bounding_box[:, 1] for z in bounding_box[:, 2]])
+        corners_transformed = corners @ matrix[:3, :3] + matrix[3, :3]
+        transformed = BoundsUtils.transform_bounding_box(bounding_box, matrix)
+        np.testing.assert_allclose(transformed[0], corners_transformed.min(axis=0), rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(transformed[1], corners_transformed.max(axis=0), rtol=1e-5, atol=1e-5)
+
+    def test_subtree_bounding_box(self):
+        root = Object3D()
+        group = Object3D()
+        group.position[0] = 10.0
+        points_a = Points(Geometry(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]], dtype=np.float32)))
+        points_b = Points(Geometry(np.array([[-1.0, -1.0, -1.0], [0.0, 0.0, 0.0]], dtype=np.float32)))
+        points_b.position[1] = -5.0
+        root.add(points_a)
+        root.add(group)
+        group.add(points_b)
+
+        root.update_world_matrix()
+        root_bounding_box = root.update_subtree_bounding_boxes()
+
+        np.testing.assert_allclose(group.get_subtree_bounding_box(), [[9.0, -6.0, -1.0], [10.0, -5.0, 0.0]])
+        np.testing.assert_allclose(root_bounding_box, [[0.0, -6.0, -1.0], [10.0, 1.0, 1.0]])
+
+        # the world bounding box follows the object once moved
+        points_a.position[2] = 3.0
+        root.update_world_matrix()
+        np.testing.assert_allclose(points_a.get_world_bounding_box(), [[0.0, 0.0, 3.0], [1.0, 1.0, 4.0]])
+
+    def test_subtree_bounding_box_is_incremental(self):
+        root = Object3D()
+        group = Object3D()
+        points_a = Points(Geometry(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]], dtype=np.float32)))
+        points_b = Points(Geometry(np.array([[-1.0, -1.0, -1.0], [0.0, 0.0, 0.0]], dtype=np.float32)))
+        root.add(points_a)
+        root.add(group)
+        group.add(points_b)
+        root.update_world_matrix()
+        root.update_subtree_bounding_boxes()
+
+        # nothing changed, so nothing is merged again
+        group_bounding_box = group.get_subtree_bounding_box()
+        root_bounding_box = root.get_subtree_bounding_box()
+        root.update_world_matrix()
+        root.update_subtree_bounding_boxes()
+        self.assertIs(group.get_subtree_bounding_box(), group_bounding_box)
+        self.assertIs(root.get_subtree_bounding_box(), root_bounding_box)
+
+        # a moved object updates its ancestors only
+        points_a.position[0] = 5.0
+        root.update_world_matrix()
+        root.update_subtree_bounding_boxes()
+        self.assertIs(group.get_subtree_bounding_box(), group_bounding_box)
+        np.testing.assert_allclose(root.get_subtree_bounding_box(), [[-1.0, -1.0, -1.0], [6.0, 1.0, 1.0]])
+
+        # a geometry edit too
+        points_b.geometry.vertices[0] = (-3.0, -1.0, -1.0)
+        points_b.geometry.mark_dirty()
+        root.update_subtree_bounding_boxes()
+        np.testing.assert_allclose(group.get_subtree_bounding_box(), [[-3.0, -1.0, -1.0], [0.0, 0.0, 0.0]])
+        np.testing.assert_allclose(root.get_subtree_bounding_box(), [[-3.0, -1.0, -1.0], [6.0, 1.0, 1.0]])
+
+        # and a removed child
+        group.remove(points_b)
+        root.update_subtree_bounding_boxes()
+        self.assertIsNone(group.get_subtree_bounding_box())
+        np.testing.assert_allclose(root.get_subtree_bounding_box(), [[5.0, 0.0, 0.0], [6.0, 1.0, 1.0]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from pyrr import matrix44
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.core import Object3D
+from mpl_graph.math import TransformUtils
+from mpl_graph.objects import Scene
+
+
+class TestCameraMatrices(unittest.TestCase):
+    def test_matrices_are_cached(self):
+        scene = Scene()
+        camera = CameraPerspective(fovy=60.0)
+        camera.position[:] = [1.0, 2.0, 5.0]
+        scene.add(camera)
+        scene.update_world_matrix()
+
+        view_projection_matrix = camera.get_view_projection_matrix()
+        self.assertIs(camera.get_view_projection_matrix(), view_projection_matrix)
+        self.assertFalse(view_projection_matrix.flags.writeable)
+        expected = matrix44.inverse(camera.get_world_matrix()) @ matrix44.create_perspective_projection(60.0, 1.0, 0.001, 100.0, dtype=np.float32)
+        np.testing.assert_allclose(view_projection_matrix, expected, rtol=1e-5)
+
+        # changing the fovy invalidates the projection
+        camera.fovy = 30.0
+        self.assertIsNot(camera.get_view_projection_matrix(), view_projection_matrix)
+        expected_projection = matrix44.create_perspective_projection(30.0, 1.0, 0.001, 100.0, dtype=np.float32)
+        np.testing.assert_allclose(camera.get_projection_matrix(), expected_projection)
+
+        # moving the camera invalidates the view
+        view_matrix = camera.get_view_matrix()
+        camera.position[0] = -3.0
+        scene.update_world_matrix()
+        self.assertIsNot(camera.get_view_matrix(), view_matrix)
+        np.testing.assert_allclose(camera.get_view_matrix(), matrix44.inverse(camera.get_world_matrix()), rtol=1e-5, atol=1e-6)
+
+    def test_mvp_matrix(self):
+        scene = Scene()
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        object3d = Object3D()
+        object3d.position[:] = [0.5, -0.5, 0.0]
+        scene.add(camera)
+        scene.add(object3d)
+        scene.update_world_matrix()
+
+        expected = object3d.get_world_matrix() @ camera.get_view_matrix() @ camera.get_projection_matrix()
+        np.testing.assert_allclose(TransformUtils.compute_mvp_matrix(camera, object3d), expected, rtol=1e-5, atol=1e-6)
+
+        camera.right = 2.0
+        expected = object3d.get_world_matrix() @ camera.get_view_matrix() @ camera.get_projection_matrix()
+        np.testing.assert_allclose(TransformUtils.compute_mvp_matrix(camera, object3d), expected, rtol=1e-5, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.core import Constants
+from mpl_graph.geometry import Geometry, GeometryUtils, MeshGeometry
+from mpl_graph.materials import MeshBasicMaterial, PolygonsMaterial
+from mpl_graph.math.transform_utils import TransformUtils
+from mpl_graph.objects import Mesh, Polygons, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_polygons import RendererPolygons
+from mpl_graph.renderers.renderer_utils import RendererUtils
+
+
+def near_distances(faces_vertices_clip: np.ndarray) -> np.ndarray:
+    return faces_vertices_clip[..., 2] + faces_vertices_clip[..., 3]
+
+
+class TestClipping(unittest.TestCase):
+    def test_outside_clip_volume(self):
+        faces_vertices_clip = np.array(
+            [
+                [[0.0, 0.0, 0.0, 1.0], [0.5, 0.0, 0.0, 1.0], [0.0, 0.5, 0.0, 1.0]],  # inside
+                [[2.0, 0.0, 0.0, 1.0], [3.0, 0.0, 0.0, 1.0], [2.0, 0.5, 0.0, 1.0]],  # right of the clip volume
+                [[2.0, 0.0, 0.0, 1.0], [-3.0, 0.0, 0.0, 1.0], [2.0, 0.5, 0.0, 1.0]],  # crossing it
+                [[0.0, 0.0, -2.0, 1.0], [0.5, 0.0, -3.0, 1.0], [0.0, 0.5, -2.0, 1.0]],  # behind the near plane
+                [[0.0, 0.0, 2.0, 1.0], [0.5, 0.0, 3.0, 1.0], [0.0, 0.5, 2.0, 1.0]],  # beyond the far plane, not rejected
+            ]
+        )
+        faces_outside = RendererUtils.compute_faces_outside_clip_volume(faces_vertices_clip)
+        np.testing.assert_array_equal(faces_outside, [False, True, False, True, False])
+
+    def test_clip_triangles_near_plane(self):
+        faces_vertices_clip = np.array(
+            [
+                [[0.0, 0.0, 0.0, 1.0], [0.5, 0.0, 0.0, 1.0], [0.0, 0.5, 0.0, 1.0]],  # in front of the near plane
+                [[0.0, 0.0, -3.0, 1.0], [0.5, 0.0, 0.0, 1.0], [0.0, 0.5, 0.0, 1.0]],  # 1 vertex behind -> 2 triangles
+                [[0.0, 0.0, -3.0, 1.0], [0.5, 0.0, -3.0, 1.0], [0.0, 0.5, 0.0, 1.0]],  # 2 vertices behind -> 1 triangle
+            ],
+            dtype=np.float32,
+        )
+        faces_indices, faces_weights = RendererUtils.clip_triangles_near_plane(faces_vertices_clip, np.arange(3))
+        np.testing.assert_array_equal(faces_indices, [0, 1, 1, 2])
+
+        # every clipped vertex is a convex combination of its source triangle
+        np.testing.assert_allclose(faces_weights.sum(axis=2), 1.0, rtol=1e-6)
+        self.assertTrue(np.all(faces_weights >= 0.0))
+
+        clipped_vertices_clip = RendererUtils.interpolate_faces_attribute(faces_vertices_clip, faces_indices, faces_weights)
+        self.assertTrue(np.all(near_distances(clipped_vertices_clip) >= -1e-6))
+        np.testing.assert_allclose(clipped_vertices_clip[0], faces_vertices_clip[0])
+
+    def test_clip_polygons_near_plane(self):
+        # a quad with 2 vertices behind the near plane
+        faces_vertices_clip = np.array([[[0.0, 0.0, -1.0, 0.5], [1.0, 0.0, -1.0, 0.5], [1.0, 1.0, 1.0, 2.0], [0.0, 1.0, 1.0, 2.0]]], dtype=np.float32)
+        faces_weights = RendererUtils.clip_polygons_near_plane(faces_vertices_clip, np.arange(1))
+        self.assertEqual(faces_weights.shape, (1, 5, 4))
+
+        clipped_vertices_clip = RendererUtils.interpolate_faces_attribute(faces_vertices_clip, np.arange(1), faces_weights)
+        self.assertTrue(np.all(near_distances(clipped_vertices_clip) >= -1e-6))
+        self.assertTrue(np.all(clipped_vertices_clip[..., 3] > 0.0))
+
+    def test_render_camera_inside_mesh(self):
+        scene = Scene()
+        camera = CameraPerspective()
+        scene.add(camera)
+
+        # a large ground quad going under and behind the camera
+        vertices = np.array([[-10.0, -1.0, 10.0], [10.0, -1.0, 10.0], [10.0, -1.0, -10.0], [-10.0, -1.0, -10.0]], dtype=np.float32)
+        indices = np.array([[0, 2, 1], [0, 3, 2]])
+        uvs = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], dtype=np.float32)
+        mesh = Mesh(MeshGeometry(vertices, indices, uvs), MeshBasicMaterial())
+        scene.add(mesh)
+
+        renderer = Renderer(64, 64)
+        renderer.render(scene, camera)
+        paths = renderer._artists[mesh.uuid].get_paths()
+        self.assertEqual(len(paths), 3)
+
+        # the vertices behind the camera are clipped, not projected upside down
+        faces_vertices_2d = np.concatenate([path.vertices for path in paths])
+        self.assertTrue(np.all(np.isfinite(faces_vertices_2d)))
+        self.assertTrue(np.all(faces_vertices_2d[:, 1] <= 0.0))
+
+
+    def test_polygons_colors_follow_culling_and_sorting(self):
+        scene = Scene()
+        camera = CameraPerspective()
+        camera.position[2] = 5.0
+        scene.add(camera)
+
+        # 6 triangles side by side at various depths, every other one back facing, and one outside of the clip volume
+        triangles = []
+        for index in range(6):
+            x, z = -1.0 + 0.4 * index, [0.5, -1.0, 1.0, -0.5, 0.0, -1.5][index]
+            triangle = [[x, 0.0, z], [x + 0.2, 0.0, z], [x + 0.1, 0.2, z]]
+            triangles.append(triangle if index % 2 == 0 else triangle[::-1])
+        triangles.append([[50.0, 0.0, 0.0], [50.2, 0.0, 0.0], [50.1, 0.2, 0.0]])
+        colors = np.array([[index / 10, 0.0, 0.0, 1.0] for index in range(len(triangles))])
+        material = PolygonsMaterial(colors=colors, face_sorting=True, face_culling=Constants.FaceCulling.BackSide)
+        polygons = Polygons(len(triangles), 3, Geometry(np.array(triangles, dtype=np.float32).reshape(-1, 3)), material)
+        scene.add(polygons)
+        scene.update_world_matrix()
+
+        renderer = Renderer(64, 64)
+        self.addCleanup(renderer.close)
+        faces_vertices_ndc, faces_color, _, _ = RendererPolygons.compute(renderer, polygons, camera)
+        self.assertEqual(len(faces_color), len(faces_vertices_ndc))
+        self.assertEqual(len(faces_vertices_ndc), 3)
+
+        # each drawn face keeps the color of its polygon - found by its x in NDC
+        vertices_clip = GeometryUtils.apply_mvp_matrix_homogeneous(polygons.geometry.vertices, TransformUtils.compute_mvp_matrix(camera, polygons))
+        polygons_x_ndc = (vertices_clip[:, 0] / vertices_clip[:, 3]).reshape(len(triangles), 3).mean(axis=1)
+        for face_vertices_ndc, face_color in zip(faces_vertices_ndc, faces_color):
+            polygon_index = int(np.argmin(np.abs(polygons_x_ndc - face_vertices_ndc[:, 0].mean())))
+            np.testing.assert_allclose(face_color, colors[polygon_index])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
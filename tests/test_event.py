@@ -0,0 +1,85 @@
+import gc
+import unittest
+
+from mpl_graph.core import Event, Object3D
+
+
+class Listener:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def on_event(self, value: int) -> None:
+        self.calls.append(value)
+
+
+class TestEvent(unittest.TestCase):
+    def test_dispatch_and_unsubscribe(self):
+        event = Event()
+        self.assertFalse(event)
+
+        calls: list[int] = []
+        callback = calls.append
+        event.subscribe(callback)
+        self.assertEqual(len(event), 1)
+        event.dispatch(1)
+        event.unsubscribe(callback)
+        event.dispatch(2)
+        self.assertEqual(calls, [1])
+        with self.assertRaises(ValueError):
+            event.unsubscribe(callback)
+
+    def test_weak_subscriber(self):
+        event = Event()
+        listener = Listener()
+        event.subscribe(listener.on_event, weak=True)
+        event.dispatch(1)
+        self.assertEqual(listener.calls, [1])
+
+        # the event does not keep the listener alive, and no longer counts it even before the next dispatch
+        del listener
+        gc.collect()
+        self.assertEqual(len(event), 0)
+        self.assertFalse(event.has_subscribers())
+        event.dispatch(2)
+
+        # a weak subscriber can be unsubscribed too
+        listener = Listener()
+        event.subscribe(listener.on_event, weak=True)
+        event.unsubscribe(listener.on_event)
+        self.assertEqual(len(event), 0)
+
+    def test_timing(self):
+        event = Event()
+        event.timing_enabled = True
+        listener = Listener()
+        event.subscribe(listener.on_event)
+        event.dispatch(1)
+        event.dispatch(2)
+
+        timing = event.handler_timings[f"{__name__}.Listener.on_event"]
+        self.assertEqual(timing[1], 2)
+        self.assertGreaterEqual(timing[0], 0.0)
+        self.assertIn(f"{__name__}.Listener.on_event", Event.global_handler_timings)
+        Event.reset_global_handler_timings()
+
+        # disabled by default
+        self.assertEqual(Event().handler_timings, {})
+
+    def test_object3d_events_are_falsy_when_empty(self):
+        object3d = Object3D()
+        self.assertFalse(object3d.has_post_transform_subscribers())
+        object3d.post_transform.subscribe(lambda vertices: None)
+        self.assertTrue(object3d.has_post_transform_subscribers())
+
+        # a garbage collected weak subscriber does not count
+        listener = Listener()
+        object3d.pre_rendering.subscribe(listener.on_event, weak=True)
+        self.assertTrue(object3d.has_pre_rendering_subscribers())
+        del listener
+        gc.collect()
+        self.assertFalse(object3d.has_pre_rendering_subscribers())
+        self.assertFalse(object3d.has_post_rendering_subscribers())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
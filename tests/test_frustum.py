@@ -0,0 +1,104 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.geometry import Geometry
+from mpl_graph.math import FrustumUtils
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+
+
+def build_box(center: tuple[float, float, float], half_size: float = 0.1) -> np.ndarray:
+    return np.array([np.array(center) - half_size, np.array(center) + half_size], dtype=np.float32)
+
+
+class TestFrustum(unittest.TestCase):
+    def test_perspective_planes(self):
+        camera = CameraPerspective()
+        camera.position[2] = 5.0
+        camera.update_world_matrix()
+        frustum_planes = FrustumUtils.compute_camera_frustum_planes(camera)
+        self.assertEqual(frustum_planes.shape, (6, 4))
+
+        self.assertFalse(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.0, 0.0, 0.0))))
+        self.assertTrue(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.0, 0.0, 6.0))))  # behind the camera
+        self.assertTrue(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((50.0, 0.0, 0.0))))  # far on the right
+        self.assertTrue(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.0, 0.0, -200.0))))  # beyond the far plane
+
+        # a box crossing a plane is inside
+        self.assertFalse(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.0, 0.0, 5.0), half_size=1.0)))
+
+        # spheres and vectorized boxes agree with the single box test
+        self.assertFalse(FrustumUtils.is_bounding_sphere_outside(frustum_planes, np.array([0.0, 0.0, 0.0, 0.1])))
+        self.assertTrue(FrustumUtils.is_bounding_sphere_outside(frustum_planes, np.array([0.0, 0.0, 6.0, 0.1])))
+        bounding_boxes = np.stack([build_box((0.0, 0.0, 0.0)), build_box((0.0, 0.0, 6.0)), build_box((50.0, 0.0, 0.0))])
+        np.testing.assert_array_equal(FrustumUtils.are_bounding_boxes_outside(frustum_planes, bounding_boxes), [False, True, True])
+
+    def test_orthographic_planes(self):
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        camera.update_world_matrix()
+        frustum_planes = FrustumUtils.compute_camera_frustum_planes(camera)
+
+        self.assertFalse(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.5, -0.5, 0.0))))
+        self.assertTrue(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((1.5, 0.0, 0.0))))
+        self.assertTrue(FrustumUtils.is_bounding_box_outside(frustum_planes, build_box((0.0, -1.5, 0.0))))
+
+    def test_renderer_culls_objects(self):
+        scene = Scene()
+        camera = CameraPerspective()
+        camera.position[2] = 5.0
+        scene.add(camera)
+
+        vertices = np.array([[-0.1, -0.1, 0.0], [0.1, 0.1, 0.0]], dtype=np.float32)
+        points_visible = Points(Geometry(vertices))
+        points_hidden = Points(Geometry(vertices))
+        points_hidden.position[0] = 50.0
+        scene.add(points_visible)
+        scene.add(points_hidden)
+
+        renderer = Renderer(64, 64)
+        renderer.render(scene, camera)
+        self.assertEqual(renderer.culled_object_count, 1)
+        self.assertIn(points_visible.uuid, renderer._artists)
+        self.assertNotIn(points_hidden.uuid, renderer._artists)
+
+        # once moved out of the frustum, the artist of the object is hidden
+        points_visible.position[0] = -50.0
+        changed_artists = renderer.render(scene, camera)
+        self.assertEqual(renderer.culled_object_count, 2)
+        self.assertFalse(renderer._artists[points_visible.uuid].get_visible())
+        self.assertIn(renderer._artists[points_visible.uuid], changed_artists)
+
+        # culling can be disabled
+        renderer = Renderer(64, 64, frustum_culling=False)
+        renderer.render(scene, camera)
+        self.assertEqual(renderer.culled_object_count, 0)
+        self.assertIn(points_hidden.uuid, renderer._artists)
+
+    def test_in_place_vertices_edits_need_mark_dirty(self):
+        scene = Scene()
+        camera = CameraPerspective()
+        camera.position[2] = 5.0
+        scene.add(camera)
+        points = Points(Geometry(np.array([[49.9, -0.1, 0.0], [50.1, 0.1, 0.0]], dtype=np.float32)))
+        scene.add(points)
+
+        renderer = Renderer(64, 64)
+        self.addCleanup(renderer.close)
+        renderer.render(scene, camera)
+        self.assertNotIn(points.uuid, renderer._artists)
+
+        # the cached bounding box is stale until mark_dirty()
+        points.geometry.vertices[:, 0] -= 50.0
+        renderer.render(scene, camera)
+        self.assertNotIn(points.uuid, renderer._artists)
+
+        points.geometry.mark_dirty()
+        renderer.render(scene, camera)
+        self.assertTrue(renderer._artists[points.uuid].get_visible())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.core import Constants
+from mpl_graph.geometry import Geometry
+from mpl_graph.materials import PointsMaterial, PolygonsMaterial
+from mpl_graph.objects import Points, Polygons, Scene
+from mpl_graph.renderers import Renderer
+
+
+def build_quads(quads: list[tuple[float, float, float, float, float]], colors: list) -> Polygons:
+    """Build axis aligned quads (x_min, x_max, y_min, y_max, z) facing the camera."""
+    vertices = [[[x_min, y_min, z], [x_max, y_min, z], [x_max, y_max, z], [x_min, y_max, z]] for x_min, x_max, y_min, y_max, z in quads]
+    geometry = Geometry(np.array(vertices, dtype=np.float32).reshape(-1, 3))
+    material = PolygonsMaterial(colors=np.array(colors), face_culling=Constants.FaceCulling.BothSides, edge_widths=np.array([0.0]))
+    return Polygons(len(quads), 4, geometry, material)
+
+
+class TestMergedDepthSorting(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraPerspective(fovy=60.0)
+        self.camera.position[2] = 5.0
+        self.scene.add(self.camera)
+
+        # interpenetrating objects at the same position: the blue quad is between the red and the green ones
+        self.polygons_a = build_quads([(-0.3, 0.3, -0.3, 0.3, 1.0), (-0.8, 0.0, -0.3, 0.3, -1.0)], [Constants.Color.RED, Constants.Color.GREEN])
+        self.polygons_b = build_quads([(-0.7, 0.7, -0.7, 0.7, 0.0)], [Constants.Color.BLUE])
+        self.scene.add(self.polygons_a)
+        self.scene.add(self.polygons_b)
+
+    def get_pixel(self, renderer: Renderer, x: float, y: float) -> np.ndarray:
+        """Color of the pixel at scene position (x, y, 0)"""
+        clip = np.array([x, y, 0.0, 1.0]) @ self.camera.get_view_projection_matrix()
+        ndc = clip[:2] / clip[3]
+        renderer.get_figure().canvas.draw()
+        image = np.asarray(renderer.get_figure().canvas.buffer_rgba())  # type: ignore
+        row = int((1 - ndc[1]) / 2 * renderer.height)
+        column = int((ndc[0] + 1) / 2 * renderer.width)
+        return image[row, column, :3] / 255.0
+
+    def test_faces_sorted_across_objects(self):
+        renderer = Renderer(64, 64, merged_depth_sorting=True)
+        changed_artists = renderer.render(self.scene, self.camera)
+
+        # a single artist for both objects
+        self.assertEqual(len(changed_artists), 1)
+        self.assertEqual(len(changed_artists[0].get_paths()), 3)  # type: ignore
+
+        np.testing.assert_allclose(self.get_pixel(renderer, 0.0, 0.0), Constants.Color.RED[:3], atol=0.05)
+        np.testing.assert_allclose(self.get_pixel(renderer, -0.55, 0.0), Constants.Color.BLUE[:3], atol=0.05)
+        renderer.close()
+
+    def test_removed_object_faces(self):
+        renderer = Renderer(64, 64, merged_depth_sorting=True)
+        renderer.render(self.scene, self.camera)
+        self.scene.remove(self.polygons_b)
+        changed_artists = renderer.render(self.scene, self.camera, only_changed=True)
+
+        self.assertEqual(len(changed_artists), 1)
+        self.assertEqual(len(changed_artists[0].get_paths()), 2)  # type: ignore
+        np.testing.assert_allclose(self.get_pixel(renderer, -0.55, 0.0), Constants.Color.GREEN[:3], atol=0.05)
+        renderer.close()
+
+    def test_same_order_as_per_object_sorting(self):
+        scene = Scene()
+        scene.add(self.camera)
+        polygons = build_quads(
+            [(-0.3, 0.3, -0.3, 0.3, 0.5), (-0.5, 0.5, -0.5, 0.5, -1.0), (-0.1, 0.1, -0.1, 0.1, 1.0)],
+            [Constants.Color.RED, Constants.Color.GREEN, Constants.Color.BLUE],
+        )
+        polygons.material.depth_sorting = True
+        scene.add(polygons)
+
+        faces_colors = []
+        for merged_depth_sorting in (False, True):
+            renderer = Renderer(64, 64, merged_depth_sorting=merged_depth_sorting)
+            (artist,) = renderer.render(scene, self.camera)
+            faces_colors.append(artist.get_facecolor())  # type: ignore
+            renderer.close()
+
+        # from the farthest to the nearest in both modes
+        np.testing.assert_allclose(faces_colors[0], [Constants.Color.GREEN, Constants.Color.RED, Constants.Color.BLUE])
+        np.testing.assert_allclose(faces_colors[1], faces_colors[0])
+
+    def test_points_sorted_far_first(self):
+        colors = np.array([Constants.Color.RED, Constants.Color.GREEN, Constants.Color.BLUE])
+        points = Points(Geometry(np.array([[0.0, 0.0, 0.5], [0.1, 0.0, -1.0], [0.2, 0.0, 1.0]], dtype=np.float32)), PointsMaterial(colors=colors))
+        scene = Scene()
+        scene.add(self.camera)
+        scene.add(points)
+
+        renderer = Renderer(64, 64)
+        (artist,) = renderer.render(scene, self.camera)
+        renderer.close()
+
+        # the colors are sorted with their points
+        np.testing.assert_allclose(artist.get_facecolor(), colors[[1, 0, 2]])  # type: ignore
+        self.assertEqual(list(np.argsort(artist.get_offsets()[:, 0])), [1, 0, 2])  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+
+from mpl_graph.core import Object3D
+from mpl_graph.core.random import Random
+from mpl_graph.objects import Scene
+
+
+class TestObject3DBulk(unittest.TestCase):
+    def test_random_uuids_match_random_uuid(self):
+        Random.set_random_seed(3)
+        uuids = [Random.random_uuid() for _ in range(5)]
+        Random.set_random_seed(3)
+        self.assertEqual(Random.random_uuids(5), uuids)
+        self.assertEqual(len(set(uuids)), 5)
+
+    def test_create_many(self):
+        scene = Scene()
+        objects = Object3D.create_many(10)
+        scene.add_children(objects)
+
+        self.assertEqual(len({object3d.uuid for object3d in objects}), 10)
+        self.assertEqual(scene.traverse()[1:], objects)
+        self.assertEqual(scene.count_objects_by_type(Object3D), 10)
+
+        # the transforms are independent, even if they share arrays
+        objects[3].position[0] = 2.0
+        objects[4].add(Object3D())
+        scene.update_world_matrix()
+        np.testing.assert_allclose(objects[3].get_world_position(), [2.0, 0.0, 0.0])
+        np.testing.assert_allclose(objects[2].get_world_position(), [0.0, 0.0, 0.0])
+
+    def test_remove_keeps_children_order(self):
+        parent = Object3D()
+        children = Object3D.create_many(5)
+        parent.add_children(children)
+        parent.remove(children[1])
+        parent.remove(children[3])
+        self.assertEqual(parent.traverse()[1:], [children[0], children[2], children[4]])
+        self.assertIsNone(children[1].parent)
+
+        # a removed child can be added back, at the end
+        parent.add(children[1])
+        self.assertEqual(parent.traverse()[1:], [children[0], children[2], children[4], children[1]])
+
+    def test_events_are_allocated_lazily(self):
+        object3d = Object3D()
+        self.assertIsNone(object3d._pre_rendering)
+
+        calls = []
+        object3d.pre_rendering.subscribe(lambda **kwargs: calls.append(kwargs))
+        self.assertIs(object3d.pre_rendering, object3d._pre_rendering)
+        object3d.pre_rendering.dispatch(renderer=None, camera=None)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
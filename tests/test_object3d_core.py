@@ -2,7 +2,9 @@ import unittest
 import numpy as np
 from pyrr import matrix44, quaternion, vector3
 
+from mpl_graph.core import TransformPool
 from mpl_graph.core.object_3d import Object3D
+from mpl_graph.objects import Scene
 
 
 class TestObject3DCore(unittest.TestCase):
@@ -19,6 +21,62 @@ class TestObject3DCore(unittest.TestCase):
         np.testing.assert_allclose(o.get_local_matrix(), matrix44.create_identity(dtype=np.float32))
         np.testing.assert_allclose(o.get_world_matrix(), matrix44.create_identity(dtype=np.float32))
 
+    def test_setters_copy(self):
+        o = Object3D()
+        position = np.array([1.0, 2.0, 3.0])
+        o.position = position
+        # the assigned array is not kept - editing it later does not move the object
+        position[0] = 10.0
+        np.testing.assert_allclose(o.position, [1.0, 2.0, 3.0])
+
+        rotation = quaternion.create_from_y_rotation(0.5)
+        o.rotation = rotation
+        rotation[:] = 0.0
+        np.testing.assert_allclose(o.rotation, quaternion.create_from_y_rotation(0.5), atol=1e-6)
+
+        scale = np.array([2.0, 2.0, 2.0])
+        o.scale = scale
+        scale[:] = 0.0
+        np.testing.assert_allclose(o.scale, [2.0, 2.0, 2.0])
+
+        # in-place edits go through, as the properties are views on the packed transform
+        o.position[1] = 5.0
+        o.update_world_matrix()
+        self.assertEqual(o.get_local_matrix()[3, 1], 5.0)
+
+    def test_held_references(self):
+        scene = Scene()
+        o = Object3D()
+        scene.add(o)
+
+        # a reference from the getter is a float32 view: editing it moves the object
+        position, rotation, scale = o.position, o.rotation, o.scale
+        self.assertEqual((position.dtype, rotation.dtype, scale.dtype), (np.float32, np.float32, np.float32))
+        position[0] = 2.0
+        scale[:] = 3.0
+        o.update_world_matrix()
+        np.testing.assert_allclose(o.get_world_matrix()[3, :3], [2.0, 0.0, 0.0])
+        np.testing.assert_allclose(np.diag(o.get_world_matrix())[:3], [3.0, 3.0, 3.0])
+
+        # until a TransformPool moves the packed transform: the old reference is detached, the new one is live
+        TransformPool(scene)
+        position[0] = 7.0
+        np.testing.assert_allclose(o.position, [2.0, 0.0, 0.0])
+        o.position[0] = 7.0
+        scene.update_world_matrix()
+        np.testing.assert_allclose(o.get_world_matrix()[3, :3], [7.0, 0.0, 0.0])
+
+    def test_float32_precision(self):
+        o = Object3D()
+        for array in (o.position, o.rotation, o.scale, o.get_local_matrix()):
+            self.assertEqual(array.dtype, np.float32)
+
+        # large coordinates lose their unit digits - 2**24 + 1 is not representable in float32
+        o.position = np.array([2.0**24 + 1.0, 1e8 + 3.0, 1000.25])
+        self.assertEqual(o.position[0], 2.0**24)
+        self.assertEqual(o.position[1], np.float32(1e8))
+        self.assertEqual(o.position[2], 1000.25)
+
     def test_local_matrix_srt_order(self):
         o = Object3D()
         o.position = vector3.create(1.0, 2.0, 3.0)
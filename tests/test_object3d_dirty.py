@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from pyrr import matrix44
+
+from mpl_graph.core.object_3d import Object3D
+
+
+class TestObject3DDirty(unittest.TestCase):
+    def test_only_changed_nodes_are_updated(self):
+        root = Object3D()
+        a = Object3D()
+        b = Object3D()
+        c = Object3D()
+        root.add(a)
+        root.add(b)
+        a.add(c)
+
+        # first update computes everything
+        self.assertEqual(root.update_world_matrix(), 4)
+        # nothing changed, nothing is updated
+        self.assertEqual(root.update_world_matrix(), 0)
+
+        # in-place edit on a leaf only updates the leaf
+        b.position[0] = 2.0
+        self.assertEqual(root.update_world_matrix(), 1)
+        np.testing.assert_allclose(b.get_world_position(), [2.0, 0.0, 0.0])
+
+        # changing a parent updates its whole subtree
+        a.rotate_y(np.pi / 2)
+        self.assertEqual(root.update_world_matrix(), 2)
+
+        # assigning the same value does not make the node dirty
+        b.position = np.array([2.0, 0.0, 0.0])
+        self.assertEqual(root.update_world_matrix(), 0)
+
+    def test_reparenting_marks_world_dirty(self):
+        root = Object3D()
+        a = Object3D()
+        a.position[0] = 5.0
+        b = Object3D()
+        root.add(a)
+        root.add(b)
+        root.update_world_matrix()
+
+        root.remove(b)
+        a.add(b)
+        self.assertEqual(root.update_world_matrix(), 1)
+        np.testing.assert_allclose(b.get_world_matrix(), a.get_world_matrix(), rtol=1e-6, atol=1e-6)
+
+    def test_standalone_update_then_parent_update(self):
+        parent = Object3D()
+        parent.position[1] = 3.0
+        child = Object3D()
+        parent.add(child)
+        parent.update_world_matrix()
+
+        # updating the child on its own handles it as a root...
+        child.update_world_matrix()
+        np.testing.assert_allclose(child.get_world_matrix(), matrix44.create_identity(dtype=np.float32))
+
+        # ...and the next update from the parent recomputes it
+        self.assertEqual(parent.update_world_matrix(), 1)
+        np.testing.assert_allclose(child.get_world_position(), [0.0, 3.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+import sys
+import unittest
+import numpy as np
+
+from mpl_graph.core.object_3d import Object3D
+from mpl_graph.objects import Points
+
+
+def build_named_tree() -> Object3D:
+    # root -> a -> c
+    #      -> b (Points) -> d
+    root = Object3D()
+    root.name = "root"
+    a = Object3D()
+    a.name = "a"
+    b = Points()
+    b.name = "b"
+    c = Object3D()
+    c.name = "c"
+    d = Points()
+    d.name = "d"
+    root.add(a)
+    root.add(b)
+    a.add(c)
+    b.add(d)
+    return root
+
+
+class TestObject3DTraverse(unittest.TestCase):
+    def test_orders(self):
+        root = build_named_tree()
+        self.assertEqual([o.name for o in root.iter_traverse()], ["root", "a", "c", "b", "d"])
+        self.assertEqual([o.name for o in root.iter_traverse(order="post")], ["c", "a", "d", "b", "root"])
+        self.assertEqual([o.name for o in root.traverse()], ["root", "a", "c", "b", "d"])
+
+    def test_type_filter_and_pruning(self):
+        root = build_named_tree()
+        self.assertEqual([o.name for o in root.iter_traverse(object_types=Points)], ["b", "d"])
+
+        # pruning "a" skips its whole subtree
+        names = [o.name for o in root.iter_traverse(predicate=lambda o: o.name != "a")]
+        self.assertEqual(names, ["root", "b", "d"])
+        names = [o.name for o in root.iter_traverse(order="post", predicate=lambda o: o.name != "b")]
+        self.assertEqual(names, ["c", "a", "root"])
+
+    def test_deep_chain(self):
+        depth = sys.getrecursionlimit() + 500
+        root = Object3D()
+        node = root
+        for _ in range(depth):
+            child = Object3D()
+            child.position[0] = 1.0
+            node.add(child)
+            node = child
+
+        self.assertEqual(len(root.traverse()), depth + 1)
+        self.assertEqual(root.update_world_matrix(), depth + 1)
+        np.testing.assert_allclose(node.get_world_position(), [float(depth), 0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,133 @@
+import unittest
+import numpy as np
+
+from mpl_graph.core import Object3D, ObjectGroup, TransformPool
+from mpl_graph.objects import Scene
+
+
+class TestObjectGroup(unittest.TestCase):
+    def check_matches_one_by_one(self, use_transform_pool: bool):
+        random_generator = np.random.default_rng(0)
+        positions = random_generator.normal(size=(20, 3))
+        angles = random_generator.normal(size=20)
+        targets = random_generator.normal(size=(20, 3))
+        targets[0] = positions[0]  # already at its target
+
+        scene = Scene()
+        objects_reference = Object3D.create_many(20)
+        objects_grouped = Object3D.create_many(20)
+        scene.add_children(objects_reference)
+        scene.add_children(objects_grouped)
+        if use_transform_pool:
+            TransformPool(scene)
+
+        # one by one
+        for index, object3d in enumerate(objects_reference):
+            object3d.position = positions[index]
+            object3d.rotate_x(angles[index]).rotate_y(2.0 * angles[index])
+            object3d.look_at(targets[index])
+            object3d.rotate_z(0.3)
+            object3d.scale *= 2.0
+            object3d.position += 1.0
+
+        # vectorized
+        group = ObjectGroup(objects_grouped)
+        group.set_positions(positions)
+        group.rotate_x(angles).rotate_y(2.0 * angles)
+        group.look_at(targets)
+        group.rotate_z(0.3)
+        group.scale_by(2.0)
+        group.translate(np.ones(3))
+
+        scene.update_world_matrix()
+        for object_reference, object_grouped in zip(objects_reference, objects_grouped):
+            np.testing.assert_allclose(object_grouped.get_world_matrix(), object_reference.get_world_matrix(), atol=1e-5)
+        np.testing.assert_allclose(group.get_positions(), positions + 1.0, atol=1e-6)
+
+    def test_matches_one_by_one(self):
+        self.check_matches_one_by_one(use_transform_pool=False)
+
+    def test_matches_one_by_one_in_transform_pool(self):
+        self.check_matches_one_by_one(use_transform_pool=True)
+
+    def test_writes_are_seen_by_objects(self):
+        objects = [Object3D(), Object3D()]
+        group = ObjectGroup(objects)
+        group.translate(np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0]]))
+
+        # the objects keep their transform, and edits on either side are shared
+        np.testing.assert_allclose(objects[1].position, [0.0, 2.0, 0.0])
+        objects[0].position[2] = 3.0
+        np.testing.assert_allclose(group.get_positions()[0], [1.0, 0.0, 3.0])
+
+        # an object whose transform got moved elsewhere, e.g. in a TransformPool, is picked up again
+        objects[1].position = np.array([5.0, 5.0, 5.0])
+        TransformPool(objects[1]).detach()
+        group.translate(np.ones(3))
+        np.testing.assert_allclose(objects[1].position, [6.0, 6.0, 6.0])
+
+    def test_rows_are_cached_until_rebound(self):
+        scene = Scene()
+        objects = Object3D.create_many(10)
+        scene.add_children(objects)
+        transform_pool = TransformPool(scene)
+        group = ObjectGroup(objects)
+
+        _, rows = group._get_trs_rows()
+        self.assertIs(group._get_trs_rows()[1], rows)
+
+        # attaching more objects may reallocate the pool arrays, and recomputes the rows
+        more_objects = Object3D.create_many(2000)
+        scene.add_children(more_objects)
+        trs, rows_after = group._get_trs_rows()
+        self.assertIsNot(rows_after, rows)
+        self.assertIs(trs, transform_pool._trs)
+        group.set_positions(np.arange(30.0).reshape(10, 3))
+        np.testing.assert_allclose(objects[9].position, [27.0, 28.0, 29.0])
+
+    def test_quaternions_from_rotation_matrices(self):
+        random_generator = np.random.default_rng(1)
+        quaternions = ObjectGroup.normalize_quaternions(random_generator.normal(size=(100, 4)))
+        rotation_matrices = TransformPool.compose_local_matrices(
+            np.concatenate([np.zeros((100, 3)), quaternions, np.ones((100, 3))], axis=1)
+        )[:, :3, :3]
+        quaternions_back = ObjectGroup.quaternions_from_rotation_matrices(rotation_matrices.astype(np.float64))
+        # q and -q are the same rotation
+        np.testing.assert_allclose(np.abs(np.sum(quaternions * quaternions_back, axis=1)), 1.0, atol=1e-5)
+
+    def test_world_decomposition(self):
+        random_generator = np.random.default_rng(2)
+        scene = Scene()
+        parent = Object3D()
+        parent.scale[:] = 2.0
+        parent.rotate_z(0.5)
+        scene.add(parent)
+        objects = Object3D.create_many(30)
+        parent.add_children(objects)
+
+        group = ObjectGroup(objects)
+        group.set_positions(random_generator.normal(size=(30, 3)))
+        group.set_rotations(random_generator.normal(size=(30, 4)))
+        group.set_scales(random_generator.uniform(0.5, 2.0, (30, 3)))
+        scene.update_world_matrix()
+
+        positions, rotations, scales = group.get_world_decompositions()
+        for index, object3d in enumerate(objects):
+            position, rotation, scale = object3d.get_world_decomposition()
+            np.testing.assert_allclose(position, positions[index], atol=1e-5)
+            np.testing.assert_allclose(np.abs(rotation @ rotations[index]), 1.0, atol=1e-5)
+            np.testing.assert_allclose(scale, scales[index], atol=1e-5)
+
+        # cached until the world matrix changes
+        object3d = objects[0]
+        rotation = object3d.get_world_rotation_quaternion()
+        self.assertIs(object3d.get_world_rotation_quaternion(), rotation)
+        self.assertFalse(rotation.flags.writeable)
+        parent.scale[:] = 3.0
+        scene.update_world_matrix()
+        self.assertIsNot(object3d.get_world_rotation_quaternion(), rotation)
+        np.testing.assert_allclose(object3d.get_world_scale(), 1.5 * scales[0], atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
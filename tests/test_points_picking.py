@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.geometry import Geometry
+from mpl_graph.math import GridIndex2D
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_points import RendererPoints
+
+
+class TestPointsPicking(unittest.TestCase):
+    def test_grid_index_matches_brute_force(self):
+        random_generator = np.random.default_rng(0)
+        points_2d = random_generator.uniform(-1, 1, (5000, 2))
+        points_2d[0] = np.inf  # ignored
+        grid_index = GridIndex2D(points_2d)
+
+        for position in random_generator.uniform(-1.2, 1.2, (50, 2)):
+            distances = np.linalg.norm(points_2d[1:] - position, axis=1)
+            vertex_index, distance = grid_index.query_nearest(position[0], position[1], 0.05)
+            if distances.min() <= 0.05:
+                self.assertEqual(vertex_index, distances.argmin() + 1)
+                self.assertAlmostEqual(distance, distances.min())
+            else:
+                self.assertEqual(vertex_index, -1)
+
+        # far away from all the points
+        self.assertEqual(grid_index.query_nearest(10.0, 10.0, 0.5), (-1, np.inf))
+
+    def test_pick_points(self):
+        scene = Scene()
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        scene.add(camera)
+
+        points_a = Points(Geometry(np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.0]], dtype=np.float32)))
+        points_b = Points(Geometry(np.array([[-0.5, 0.5, 0.0]], dtype=np.float32)))
+        scene.add(points_a)
+        scene.add(points_b)
+
+        renderer = Renderer(64, 64, points_picking=True)
+        renderer.render(scene, camera)
+
+        pick = RendererPoints.pick_points(renderer, 0.48, 0.5, 0.1)
+        assert pick is not None
+        self.assertIs(pick[0], points_a)
+        self.assertEqual(pick[1], 1)
+        self.assertAlmostEqual(pick[2], 0.02, places=5)
+
+        pick = RendererPoints.pick_points(renderer, -0.5, 0.45, 0.1)
+        assert pick is not None
+        self.assertIs(pick[0], points_b)
+        self.assertIsNone(RendererPoints.pick_points(renderer, 0.0, -0.5, 0.1))
+
+        # the culled points are not picked
+        points_b.position[0] = 50.0
+        renderer.render(scene, camera)
+        self.assertIsNone(RendererPoints.pick_points(renderer, -0.5, 0.45, 0.1))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
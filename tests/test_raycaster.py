@@ -0,0 +1,106 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.geometry import MeshGeometry, MeshBVH
+from mpl_graph.materials import MeshBasicMaterial
+from mpl_graph.math import Raycaster
+from mpl_graph.objects import Mesh, Scene
+
+
+def build_quad() -> MeshGeometry:
+    # a 2x2 quad in the xy plane, centered on the origin
+    vertices = np.array([[-1.0, -1.0, 0.0], [1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, 1.0, 0.0]], dtype=np.float32)
+    indices = np.array([[0, 1, 2], [0, 2, 3]])
+    return MeshGeometry(vertices, indices)
+
+
+class TestRaycaster(unittest.TestCase):
+    def test_bvh_matches_brute_force(self):
+        random_generator = np.random.default_rng(0)
+        vertices = random_generator.uniform(-1, 1, (600, 3)).astype(np.float32)
+        indices = random_generator.permutation(600).reshape(200, 3)
+        bvh = MeshBVH(vertices, indices, leaf_size=4)
+
+        # rays from outside of the faces cloud, the last ones going away from it
+        origins = random_generator.normal(0, 1, (100, 3))
+        origins = 3.0 * origins / np.linalg.norm(origins, axis=1, keepdims=True)
+        directions = -origins + random_generator.normal(0, 0.3, (100, 3))
+        directions[80:] *= -1.0
+        faces_index, distances, barycentrics = bvh.intersect_rays(origins, directions)
+
+        faces_vertices = vertices[indices]
+        for ray_index in range(len(origins)):
+            brute_distances, _, _ = MeshBVH.intersect_triangles(
+                np.broadcast_to(origins[ray_index], (200, 3)),
+                np.broadcast_to(directions[ray_index], (200, 3)),
+                faces_vertices[:, 0],
+                faces_vertices[:, 1],
+                faces_vertices[:, 2],
+            )
+            self.assertAlmostEqual(distances[ray_index], brute_distances.min(), places=5)
+            if faces_index[ray_index] >= 0:
+                # the barycentrics give back the hit point
+                hit_point = barycentrics[ray_index] @ faces_vertices[faces_index[ray_index]]
+                np.testing.assert_allclose(hit_point, origins[ray_index] + distances[ray_index] * directions[ray_index], atol=1e-4)
+
+        self.assertTrue(np.any(faces_index >= 0))
+        self.assertTrue(np.any(faces_index < 0))
+
+    def test_bvh_is_cached_on_geometry(self):
+        geometry = build_quad()
+        bvh = geometry.get_bvh()
+        self.assertIs(geometry.get_bvh(), bvh)
+
+        geometry.vertices = geometry.vertices * 2.0
+        self.assertIsNot(geometry.get_bvh(), bvh)
+
+    def test_raycaster_uses_world_matrices(self):
+        scene = Scene()
+        mesh_near = Mesh(build_quad(), MeshBasicMaterial())
+        mesh_near.position[2] = -5.0
+        mesh_far = Mesh(build_quad(), MeshBasicMaterial())
+        mesh_far.position[2] = -10.0
+        mesh_far.scale[:] = 4.0
+        mesh_aside = Mesh(build_quad(), MeshBasicMaterial())
+        mesh_aside.position[0] = 10.0
+        scene.add(mesh_near)
+        scene.add(mesh_far)
+        scene.add(mesh_aside)
+        scene.update_world_matrix()
+
+        raycaster = Raycaster(np.array([0.5, 0.5, 0.0]), np.array([0.0, 0.0, -2.0]))
+        hits = raycaster.intersect_object(scene)
+        self.assertEqual([hit.object3d for hit in hits], [mesh_near, mesh_far])
+        self.assertAlmostEqual(hits[0].distance, 5.0, places=5)
+        self.assertAlmostEqual(hits[1].distance, 10.0, places=5)
+        np.testing.assert_allclose(hits[0].point, [0.5, 0.5, -5.0], atol=1e-5)
+        self.assertEqual(hits[0].face_index, 1)
+        np.testing.assert_allclose(hits[0].barycentric.sum(), 1.0)
+
+        # far limits the hits
+        raycaster.far = 7.0
+        self.assertEqual([hit.object3d for hit in raycaster.intersect_object(scene)], [mesh_near])
+
+        # not recursive, the scene itself is not a mesh
+        self.assertEqual(raycaster.intersect_object(scene, recursive=False), [])
+
+    def test_set_from_camera(self):
+        camera = CameraPerspective()
+        camera.position[2] = 5.0
+        camera.update_world_matrix()
+
+        raycaster = Raycaster()
+        raycaster.set_from_camera(0.0, 0.0, camera)
+        np.testing.assert_allclose(raycaster.direction, [0.0, 0.0, -1.0], atol=1e-5)
+        np.testing.assert_allclose(raycaster.origin[:2], [0.0, 0.0], atol=1e-5)
+
+        mesh = Mesh(build_quad(), MeshBasicMaterial())
+        mesh.update_world_matrix()
+        hits = raycaster.intersect_object(mesh)
+        self.assertEqual(len(hits), 1)
+        np.testing.assert_allclose(hits[0].point, [0.0, 0.0, 0.0], atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,128 @@
+import gc
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.core import Object3D
+from mpl_graph.geometry import Geometry
+from mpl_graph.lights import PointLight
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_points import RendererPoints
+
+
+def build_points() -> Points:
+    return Points(Geometry(np.array([[0.0, 0.0, 0.0], [0.1, 0.1, 0.0]], dtype=np.float32)))
+
+
+class TestRenderChanged(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraOrthographic()
+        self.camera.position[2] = 5.0
+        self.scene.add(self.camera)
+        self.group = Object3D()
+        self.scene.add(self.group)
+        self.points_a = build_points()
+        self.points_b = build_points()
+        self.group.add(self.points_a)
+        self.scene.add(self.points_b)
+
+        self.rendered: list[Points] = []
+        render_original = RendererPoints.render
+
+        def render_spy(renderer, points, camera):
+            self.rendered.append(points)
+            return render_original(renderer, points, camera)
+
+        RendererPoints.render = staticmethod(render_spy)  # type: ignore
+        self.addCleanup(setattr, RendererPoints, "render", staticmethod(render_original))
+
+        self.renderer = Renderer(64, 64)
+        self.renderer.render(self.scene, self.camera)
+
+    def render_changed(self) -> list[Points]:
+        self.rendered.clear()
+        self.renderer.render(self.scene, self.camera, only_changed=True)
+        return list(self.rendered)
+
+    def test_nothing_changed(self):
+        self.assertEqual(self.render_changed(), [])
+
+    def test_changes_are_detected(self):
+        # transform of the object
+        self.points_b.position[0] = 0.2
+        self.assertEqual(self.render_changed(), [self.points_b])
+
+        # transform of an ancestor
+        self.group.rotate_z(0.1)
+        self.assertEqual(self.render_changed(), [self.points_a])
+
+        # geometry and material, with mark_dirty() for in-place edits
+        self.points_a.geometry.vertices[0, 0] = 0.05
+        self.points_a.geometry.mark_dirty()
+        self.assertEqual(self.render_changed(), [self.points_a])
+        self.points_b.material.sizes = np.array([4.0])
+        self.assertEqual(self.render_changed(), [self.points_b])
+
+    def test_in_place_edits_need_changed_objects(self):
+        # no version changes, so it is not detected
+        self.points_a.material.colors[0] = (0.0, 1.0, 0.0, 1.0)
+        self.assertEqual(self.render_changed(), [])
+
+        self.rendered.clear()
+        self.renderer.render(self.scene, self.camera, only_changed=True, changed_objects=[self.points_a])
+        self.assertEqual(self.rendered, [self.points_a])
+
+    def test_camera_and_lights_render_everything(self):
+        self.camera.position[0] = 0.1
+        self.assertEqual(self.render_changed(), [self.points_a, self.points_b])
+
+        light = PointLight()
+        self.scene.add(light)
+        self.assertEqual(self.render_changed(), [self.points_a, self.points_b])
+        light.intensity = 2.0
+        self.assertEqual(self.render_changed(), [self.points_a, self.points_b])
+        self.assertEqual(self.render_changed(), [])
+
+    def test_removed_objects_are_disposed(self):
+        artist = self.renderer._artists[self.points_b.uuid]
+        self.assertTrue(artist.get_visible())
+        self.scene.remove(self.points_b)
+        self.assertEqual(self.render_changed(), [])
+        self.assertNotIn(self.points_b.uuid, self.renderer._artists)
+        self.assertNotIn(artist, self.renderer.get_axis().collections)
+        self.assertEqual(self.renderer.disposed_artist_count, 1)
+        self.assertEqual(self.renderer.get_artist_counts(), {"PathCollection": 1})
+
+        # added back, it is rendered again with a new artist
+        self.scene.add(self.points_b)
+        self.assertEqual(self.render_changed(), [self.points_b])
+        self.assertTrue(self.renderer._artists[self.points_b.uuid].get_visible())
+        self.assertEqual(self.renderer.get_artist_counts(), {"PathCollection": 2})
+
+    def test_culled_objects_are_not_disposed(self):
+        self.points_b.position[0] = 50.0
+        self.renderer.render(self.scene, self.camera)
+        self.assertEqual(self.renderer.culled_object_count, 1)
+        self.assertEqual(self.renderer.disposed_artist_count, 0)
+        self.assertFalse(self.renderer._artists[self.points_b.uuid].get_visible())
+
+    def test_pre_rendering_subscribers_always_render(self):
+        self.points_a.pre_rendering.subscribe(lambda renderer, camera: None)
+        self.assertEqual(self.render_changed(), [self.points_a])
+        self.assertEqual(self.render_changed(), [self.points_a])
+
+    def test_dead_weak_subscribers_do_not_render(self):
+        def on_pre_rendering(renderer, camera):
+            pass
+
+        self.points_a.pre_rendering.subscribe(on_pre_rendering, weak=True)
+        self.assertEqual(self.render_changed(), [self.points_a])
+        del on_pre_rendering
+        gc.collect()
+        self.assertEqual(self.render_changed(), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.geometry import Geometry, MeshGeometry
+from mpl_graph.materials import MeshBasicMaterial
+from mpl_graph.objects import Mesh, Points, Scene
+from mpl_graph.renderers import Renderer
+
+
+def build_quad_geometry() -> MeshGeometry:
+    """Unit quad in the xy plane, 2 triangles front facing a camera on +z."""
+    vertices = np.array([[-0.5, -0.5, 0.0], [0.5, -0.5, 0.0], [0.5, 0.5, 0.0], [-0.5, 0.5, 0.0]], dtype=np.float32)
+    indices = np.array([[0, 2, 1], [0, 3, 2]], dtype=np.int32)
+    return MeshGeometry(vertices, indices, uvs=np.zeros((len(vertices), 2), dtype=np.float32))
+
+
+class TestRenderStats(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraPerspective()
+        self.camera.position[2] = 4.0
+        self.scene.add(self.camera)
+
+        self.mesh = Mesh(build_quad_geometry(), MeshBasicMaterial())
+        self.points = Points(Geometry(np.zeros((3, 3), dtype=np.float32)))
+        # behind the camera, so culled
+        self.points_culled = Points(Geometry(np.zeros((3, 3), dtype=np.float32)))
+        self.points_culled.position[2] = 10.0
+        self.scene.add_children([self.mesh, self.points, self.points_culled])
+
+    def test_disabled_by_default(self):
+        renderer = Renderer(32, 32)
+        self.addCleanup(renderer.close)
+        renderer.render(self.scene, self.camera)
+        self.assertIsNone(renderer.last_render_stats)
+
+    def test_counts_and_times(self):
+        renderer = Renderer(32, 32, stats_enabled=True)
+        self.addCleanup(renderer.close)
+        changed_artists = renderer.render(self.scene, self.camera)
+
+        stats = renderer.last_render_stats
+        assert stats is not None
+        self.assertEqual(stats.frame_index, 0)
+        self.assertEqual(stats.object_culled_count, 1)
+        self.assertEqual(stats.object_rendered_count, stats.object_visited_count)
+        self.assertEqual(stats.changed_artist_count, len(changed_artists))
+        self.assertEqual((stats.face_input_count, stats.face_drawn_count, stats.face_culled_count), (2, 2, 0))
+        for stage in ("world_matrix", "culling", "transform", "sorting", "artist_update"):
+            self.assertIn(stage, stats.stage_times)
+        self.assertEqual(set(stats.renderer_class_times), {"RendererMesh", "RendererPoints"})
+        self.assertEqual(set(stats.object_times), {self.mesh.uuid, self.points.uuid})
+        self.assertGreater(stats.render_time, 0.0)
+
+        # the stages spent on each object are broken down by object and by renderer class
+        mesh_stage_times = stats.object_stage_times[self.mesh.uuid]
+        self.assertEqual(set(mesh_stage_times), {"culling", "transform", "sorting", "artist_update"})
+        self.assertEqual(mesh_stage_times["transform"], stats.stage_times["transform"])
+        self.assertEqual(set(stats.object_stage_times[self.points_culled.uuid]), {"culling"})
+        self.assertEqual(stats.renderer_class_stage_times["RendererMesh"], mesh_stage_times)
+        self.assertIn("culling", stats.renderer_class_stage_times["RendererPoints"])
+
+        # back faces are culled
+        self.mesh.rotate_y(np.pi)
+        renderer.render(self.scene, self.camera)
+        stats = renderer.last_render_stats
+        assert stats is not None
+        self.assertEqual(stats.frame_index, 1)
+        self.assertEqual((stats.face_input_count, stats.face_drawn_count, stats.face_culled_count), (2, 0, 2))
+
+        # the unchanged objects are not rendered
+        renderer.render(self.scene, self.camera, only_changed=True)
+        stats = renderer.last_render_stats
+        assert stats is not None
+        self.assertEqual(stats.object_rendered_count, 0)
+        self.assertEqual(stats.object_times, {})
+
+    def test_threads(self):
+        renderer = Renderer(32, 32, stats_enabled=True, thread_count=2, thread_min_vertex_count=1)
+        self.addCleanup(renderer.close)
+        renderer.render(self.scene, self.camera)
+        stats = renderer.last_render_stats
+        assert stats is not None
+        self.assertEqual((stats.face_input_count, stats.face_drawn_count), (2, 2))
+        self.assertIn(self.mesh.uuid, stats.object_times)
+        # the stages computed in the threads are attributed to their object too
+        self.assertIn("transform", stats.object_stage_times[self.mesh.uuid])
+
+    def test_log(self):
+        with tempfile.TemporaryDirectory() as folder_path:
+            log_path = os.path.join(folder_path, "stats.jsonl")
+            renderer = Renderer(32, 32, stats_enabled=True, stats_log_path=log_path)
+            renderer.render_to_array(self.scene, self.camera)
+            renderer.render_to_array(self.scene, self.camera)
+            renderer.close()
+
+            with open(log_path, encoding="utf-8") as log_file:
+                frames_stats = [json.loads(line) for line in log_file]
+        self.assertEqual([frame_stats["frame_index"] for frame_stats in frames_stats], [0, 1])
+        # the draw of each frame is logged with it
+        self.assertGreater(frames_stats[0]["stage_times"]["draw"], 0.0)
+        self.assertIn("transform", frames_stats[0]["renderer_class_stage_times"]["RendererMesh"])
+        self.assertEqual(frames_stats[1]["face_drawn_count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+import matplotlib.backends.backend_svg
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.core import Constants
+from mpl_graph.geometry import Geometry
+from mpl_graph.materials import PointsMaterial
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+
+
+class TestRenderToArray(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraOrthographic()
+        self.camera.position[2] = 5.0
+        self.scene.add(self.camera)
+        material = PointsMaterial(colors=np.array([Constants.Color.RED]), sizes=np.array([200.0]))
+        self.scene.add(Points(Geometry(np.array([[0.0, 0.0, 0.0]], dtype=np.float32)), material))
+
+        self.renderer = Renderer(64, 48)
+        self.addCleanup(self.renderer.close)
+
+    def test_render_to_array(self):
+        image = self.renderer.render_to_array(self.scene, self.camera)
+        self.assertEqual(image.shape, (48, 64, 4))
+        self.assertEqual(image.dtype, np.uint8)
+        np.testing.assert_array_equal(image[24, 32, :3], [255, 0, 0])
+        self.assertFalse(np.array_equal(image[0, 0, :3], [255, 0, 0]))
+
+        # without copy, it is a view on the canvas buffer
+        image_view = self.renderer.render_to_array(self.scene, self.camera, copy=False)
+        np.testing.assert_array_equal(image_view, image)
+        self.assertFalse(image_view.flags.owndata)
+
+    def test_render_to_array_without_agg_canvas(self):
+        canvas = matplotlib.backends.backend_svg.FigureCanvasSVG(self.renderer.get_figure())
+        image = self.renderer.render_to_array(self.scene, self.camera)
+        np.testing.assert_array_equal(image[24, 32, :3], [255, 0, 0])
+        self.assertIs(self.renderer.get_figure().canvas, canvas)
+
+    def test_render_to_arrays(self):
+        # the point moves to the right of the image as the camera moves to the left
+        positions = np.array([[0.0, 0.0, 5.0], [-0.5, 0.0, 5.0]], dtype=np.float32)
+        rotations = np.array([[0.0, 0.0, 0.0, 1.0]] * 2, dtype=np.float32)
+        images = list(self.renderer.render_to_arrays(self.scene, self.camera, positions, rotations))
+
+        self.assertEqual(len(images), 2)
+        np.testing.assert_array_equal(images[0][24, 32, :3], [255, 0, 0])
+        np.testing.assert_array_equal(images[1][24, 32 + 8, :3], [255, 0, 0])
+        np.testing.assert_array_equal(self.camera.position, [0.0, 0.0, 5.0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.geometry import Geometry
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_blitter import RendererBlitter
+
+
+class TestRendererBlitter(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraOrthographic()
+        self.camera.position[2] = 5.0
+        self.scene.add(self.camera)
+        self.points_a = Points(Geometry(np.array([[-0.5, 0.0, 0.0], [-0.4, 0.1, 0.0]], dtype=np.float32)))
+        self.points_b = Points(Geometry(np.array([[0.5, 0.0, 0.0], [0.4, 0.1, 0.0]], dtype=np.float32)))
+        self.scene.add(self.points_a)
+        self.scene.add(self.points_b)
+
+        self.renderer = Renderer(64, 64)
+        self.addCleanup(self.renderer.close)
+        self.renderer.render(self.scene, self.camera)
+        self.blitter = RendererBlitter(self.renderer)
+
+    def get_image(self) -> np.ndarray:
+        return np.asarray(self.renderer.get_figure().canvas.buffer_rgba()).copy()  # type: ignore
+
+    def render_and_update(self) -> bool:
+        changed_artists = self.renderer.render(self.scene, self.camera, only_changed=True)
+        return self.blitter.update(changed_artists)
+
+    def test_blit_changed_artists(self):
+        # the first update saves the background
+        self.points_a.position[1] = 0.2
+        self.assertFalse(self.render_and_update())
+        self.assertEqual(self.blitter.full_redraw_count, 1)
+        self.assertTrue(self.renderer._artists[self.points_a.uuid].get_animated())
+        self.assertFalse(self.renderer._artists[self.points_b.uuid].get_animated())
+
+        # then the same artists are blitted
+        self.points_a.position[1] = -0.2
+        self.assertTrue(self.render_and_update())
+        self.assertEqual(self.blitter.blit_count, 1)
+        image_blitted = self.get_image()
+
+        # same image as a full draw
+        self.blitter.close()
+        self.renderer.get_figure().canvas.draw()
+        np.testing.assert_array_equal(image_blitted, self.get_image())
+
+    def test_fallback_to_full_redraw(self):
+        self.points_a.position[1] = 0.2
+        self.render_and_update()
+
+        # resizing the canvas saves the background again
+        self.renderer.get_figure().set_size_inches(0.8, 0.8)
+        self.points_a.position[1] = -0.2
+        self.assertFalse(self.render_and_update())
+        self.assertEqual(self.blitter.full_redraw_count, 2)
+
+        # an animated artist below an unchanged one it overlaps can not be blitted
+        self.points_a.position[0] = 1.0
+        self.renderer.render(self.scene, self.camera, only_changed=True)
+        self.renderer._artists[self.points_a.uuid].set_zorder(-10.0)
+        self.renderer._artists[self.points_b.uuid].set_zorder(0.0)
+        self.assertFalse(self.blitter.update([self.renderer._artists[self.points_a.uuid]]))
+        self.assertEqual(self.blitter.full_redraw_count, 3)
+        self.assertFalse(self.renderer._artists[self.points_a.uuid].get_animated())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
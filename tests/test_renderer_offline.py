@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.geometry import Geometry
+from mpl_graph.objects import Points, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_offline import RendererOffline
+
+
+def build_rotating_points():
+    """Module level, so the spawned processes can import it."""
+    renderer = Renderer(32, 32)
+    scene = Scene()
+    camera = CameraOrthographic()
+    camera.position[2] = 5.0
+    scene.add(camera)
+    vertices = np.random.default_rng(0).uniform(-1, 1, (50, 3)).astype(np.float32)
+    points = Points(Geometry(vertices))
+    scene.add(points)
+
+    # stateful update, as the animation loop callbacks
+    def update(delta_time: float) -> None:
+        points.rotate_y(delta_time)
+
+    return renderer, scene, camera, update
+
+
+class TestRendererOffline(unittest.TestCase):
+    def test_frames_do_not_depend_on_process_count(self):
+        frames = RendererOffline.render_frames(build_rotating_points, 6, fps=4.0, process_count=1)
+        assert isinstance(frames, np.ndarray)
+        self.assertEqual(frames.shape, (6, 32, 32, 4))
+        self.assertFalse(np.array_equal(frames[0], frames[1]))
+
+        frames_parallel = RendererOffline.render_frames(build_rotating_points, 6, fps=4.0, process_count=2)
+        np.testing.assert_array_equal(frames_parallel, frames)
+
+    def test_frame_files(self):
+        with tempfile.TemporaryDirectory() as output_path:
+            frame_paths = RendererOffline.render_frames(build_rotating_points, 3, output_path=output_path, frame_format="npy", process_count=1)
+            self.assertEqual([os.path.basename(frame_path) for frame_path in frame_paths], ["frame_00000.npy", "frame_00001.npy", "frame_00002.npy"])
+            self.assertEqual(np.load(frame_paths[2]).shape, (32, 32, 4))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
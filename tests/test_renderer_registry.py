@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.core import Object3D
+from mpl_graph.geometry import Geometry, MeshGeometry
+from mpl_graph.materials import MeshBasicMaterial, MeshMaterial
+from mpl_graph.objects import Mesh, Points, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_mesh import RendererMesh
+from mpl_graph.renderers.renderer_mesh_basic_material import RendererMeshBasicMaterial
+from mpl_graph.renderers.renderer_points import RendererPoints
+
+
+class Marker(Object3D):
+    pass
+
+
+class RendererMarker:
+    rendered: list[Object3D] = []
+
+    @staticmethod
+    def render(renderer, marker, camera):
+        RendererMarker.rendered.append(marker)
+        return []
+
+
+class FlatMaterial(MeshMaterial):
+    pass
+
+
+class RendererFlatMaterial:
+    calls: list[tuple[Mesh, tuple]] = []
+
+    @staticmethod
+    def render(mesh, faces_vertices_2d):
+        RendererFlatMaterial.calls.append((mesh, faces_vertices_2d.shape))
+        return []
+
+
+class TestRendererRegistry(unittest.TestCase):
+    def test_default_renderers(self):
+        class MyPoints(Points):
+            pass
+
+        self.assertIs(Renderer.get_object_renderer(Points), RendererPoints)
+        self.assertIs(Renderer.get_object_renderer(MyPoints), RendererPoints)
+        self.assertIsNone(Renderer.get_object_renderer(Object3D))
+        self.assertIs(RendererMesh.get_material_renderer(MeshBasicMaterial)[0], RendererMeshBasicMaterial)
+        with self.assertRaises(ValueError):
+            RendererMesh.get_material_renderer(MeshMaterial)
+
+    def test_custom_renderers(self):
+        Renderer.register_object_renderer(Marker, RendererMarker)
+        RendererMesh.register_material_renderer(FlatMaterial, RendererFlatMaterial)
+
+        scene = Scene()
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        scene.add(camera)
+        marker = Marker()
+        scene.add(marker)
+        vertices = np.array([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0], [0.0, 0.5, 0.0]], dtype=np.float32)
+        mesh = Mesh(MeshGeometry(vertices, np.array([[0, 1, 2]]), uvs=np.zeros((3, 2))), FlatMaterial())
+        scene.add(mesh)
+
+        Renderer(64, 64).render(scene, camera)
+        self.assertEqual(RendererMarker.rendered, [marker])
+        self.assertEqual(RendererFlatMaterial.calls, [(mesh, (1, 3, 2))])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
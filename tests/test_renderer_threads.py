@@ -0,0 +1,75 @@
+import threading
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_perspective import CameraPerspective
+from mpl_graph.geometry import Geometry, MeshGeometry
+from mpl_graph.lights import DirectionalLight
+from mpl_graph.materials import MeshBasicMaterial, MeshPhongMaterial
+from mpl_graph.objects import Mesh, Polygons, Scene
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_mesh import RendererMesh
+
+
+def build_grid_geometry(size: int, seed: int) -> MeshGeometry:
+    """Bumpy grid of size x size quads in the xy plane, 2 triangles each."""
+    xs, ys = np.meshgrid(np.linspace(-1, 1, size + 1), np.linspace(-1, 1, size + 1))
+    zs = np.random.default_rng(seed).uniform(-0.1, 0.1, xs.shape)
+    vertices = np.stack([xs, ys, zs], axis=-1).reshape(-1, 3).astype(np.float32)
+    corners = (np.arange(size)[:, None] * (size + 1) + np.arange(size)[None, :]).ravel()
+    indices = np.concatenate([np.stack([corners, corners + 1, corners + size + 2], axis=1), np.stack([corners, corners + size + 2, corners + size + 1], axis=1)])
+    return MeshGeometry(vertices, indices, uvs=np.zeros((len(vertices), 2), dtype=np.float32))
+
+
+class TestRendererThreads(unittest.TestCase):
+    def setUp(self):
+        self.scene = Scene()
+        self.camera = CameraPerspective()
+        self.camera.position[2] = 4.0
+        self.scene.add(self.camera)
+        light = DirectionalLight()
+        light.position[:] = [1.0, 1.0, 2.0]
+        self.scene.add(light)
+
+        mesh_phong = Mesh(build_grid_geometry(20, 0), MeshPhongMaterial())
+        mesh_phong.position[0] = -0.5
+        mesh_basic = Mesh(build_grid_geometry(20, 1), MeshBasicMaterial())
+        mesh_basic.position[0] = 0.5
+        grid_geometry = build_grid_geometry(10, 2)
+        polygons = Polygons(len(grid_geometry.indices), 3, Geometry(grid_geometry.vertices[grid_geometry.indices].reshape(-1, 3)))
+        polygons.position[1] = 0.5
+        self.scene.add_children([mesh_phong, mesh_basic, polygons])
+
+    def test_threads_render_the_same_image(self):
+        renderer = Renderer(64, 64)
+        self.addCleanup(renderer.close)
+        image = renderer.render_to_array(self.scene, self.camera)
+
+        renderer_threads = Renderer(64, 64, thread_count=2, thread_min_vertex_count=100)
+        self.addCleanup(renderer_threads.close)
+
+        # spy the thread the meshes are computed on
+        threads_names: list[str] = []
+        compute_original = RendererMesh.compute
+
+        def compute_spy(renderer, mesh, camera):
+            threads_names.append(threading.current_thread().name)
+            return compute_original(renderer, mesh, camera)
+
+        RendererMesh.compute = staticmethod(compute_spy)  # type: ignore
+        self.addCleanup(setattr, RendererMesh, "compute", staticmethod(compute_original))
+
+        image_threads = renderer_threads.render_to_array(self.scene, self.camera)
+        np.testing.assert_array_equal(image_threads, image)
+        self.assertEqual(len(threads_names), 2)
+        self.assertTrue(all(name.startswith("mpl_graph_renderer") for name in threads_names))
+
+    def test_small_objects_stay_on_the_calling_thread(self):
+        renderer = Renderer(64, 64, thread_count=2, thread_min_vertex_count=10_000)
+        self.addCleanup(renderer.close)
+        renderer.render(self.scene, self.camera)
+        self.assertIsNone(renderer._thread_pool)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
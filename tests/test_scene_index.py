@@ -0,0 +1,46 @@
+import unittest
+
+from mpl_graph.core.object_3d import Object3D
+from mpl_graph.objects import Scene, Points
+from mpl_graph.lights import Light, PointLight, AmbientLight
+from mpl_graph.cameras import Camera, CameraPerspective
+
+
+class TestSceneIndex(unittest.TestCase):
+    def test_index_follows_add_and_remove(self):
+        scene = Scene()
+        camera = CameraPerspective()
+        scene.add(camera)
+
+        # build a subtree outside of the scene, then add it
+        group = Object3D()
+        point_light = PointLight()
+        ambient_light = AmbientLight()
+        group.add(point_light)
+        group.add(ambient_light)
+        scene.add(group)
+
+        # objects added deeper in the scene are indexed too
+        points = Points()
+        group.add(points)
+
+        self.assertEqual(scene.get_objects_by_type(Light), [point_light, ambient_light])
+        self.assertEqual(scene.get_objects_by_type(PointLight), [point_light])
+        self.assertEqual(scene.get_objects_by_type(Camera), [camera])
+        self.assertEqual(scene.get_objects_by_type(Points), [points])
+        self.assertEqual(scene.count_objects_by_type(Object3D), 5)
+
+        # removing a subtree removes all its objects
+        scene.remove(group)
+        self.assertEqual(scene.get_objects_by_type(Light), [])
+        self.assertEqual(scene.get_objects_by_type(Points), [])
+        self.assertEqual(scene.count_objects_by_type(Object3D), 1)
+
+        # objects changed while outside of the scene are seen when re-added
+        group.remove(ambient_light)
+        scene.add(group)
+        self.assertEqual(scene.get_objects_by_type(Light), [point_light])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
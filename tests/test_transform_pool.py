@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from pyrr import quaternion, vector3
+
+from mpl_graph.core.object_3d import Object3D
+from mpl_graph.core.transform_pool import TransformPool
+
+
+def build_chain_and_leaves() -> list[Object3D]:
+    root = Object3D()
+    a = Object3D()
+    b = Object3D()
+    c = Object3D()
+    root.add(a)
+    a.add(b)
+    root.add(c)
+
+    root.position = vector3.create(1.0, 2.0, 3.0)
+    a.rotation = quaternion.create_from_y_rotation(np.deg2rad(30), dtype=np.float32)
+    a.scale = vector3.create(2.0, 1.0, 0.5)
+    b.position = vector3.create(0.0, -1.0, 4.0)
+    b.rotation = quaternion.create_from_eulers([0.2, -0.7, 1.1], dtype=np.float32)
+    c.scale = vector3.create(3.0, 3.0, 3.0)
+    return [root, a, b, c]
+
+
+class TestTransformPool(unittest.TestCase):
+    def test_matches_per_object_update(self):
+        expected_nodes = build_chain_and_leaves()
+        expected_nodes[0].update_world_matrix()
+
+        nodes = build_chain_and_leaves()
+        TransformPool(nodes[0])
+        self.assertEqual(nodes[0].update_world_matrix(), 4)
+
+        for node, expected_node in zip(nodes, expected_nodes):
+            np.testing.assert_allclose(node.get_local_matrix(), expected_node.get_local_matrix(), rtol=1e-5, atol=1e-5)
+            np.testing.assert_allclose(node.get_world_matrix(), expected_node.get_world_matrix(), rtol=1e-5, atol=1e-5)
+
+    def test_views_and_incremental_update(self):
+        root, a, b, c = build_chain_and_leaves()
+        transform_pool = TransformPool(root)
+        root.update_world_matrix()
+        self.assertEqual(root.update_world_matrix(), 0)
+
+        # writing through the object writes in the pool, and only the subtree is updated
+        a.position[0] = 5.0
+        self.assertEqual(transform_pool.positions[transform_pool.index_of(a), 0], 5.0)
+        self.assertEqual(root.update_world_matrix(), 2)
+
+        # writing in the pool is seen by the object
+        transform_pool.positions[transform_pool.index_of(c)] = (7.0, 0.0, 0.0)
+        self.assertEqual(root.update_world_matrix(), 1)
+        np.testing.assert_allclose(c.get_world_position(), [8.0, 2.0, 3.0], rtol=1e-6, atol=1e-6)
+
+    def test_add_remove_and_grow(self):
+        root = Object3D()
+        transform_pool = TransformPool(root, capacity=1)
+        children = [Object3D() for _ in range(10)]
+        for index, child in enumerate(children):
+            child.position[0] = float(index)
+            root.add(child)
+        self.assertEqual(len(transform_pool), 11)
+
+        root.position[1] = 1.0
+        root.update_world_matrix()
+        for index, child in enumerate(children):
+            np.testing.assert_allclose(child.get_world_position(), [float(index), 1.0, 0.0])
+
+        # a removed object keeps its transform, in its own arrays
+        removed = children[3]
+        root.remove(removed)
+        self.assertEqual(len(transform_pool), 10)
+        self.assertIsNone(removed._transform_pool)
+        removed.position[2] = 2.0
+        removed.update_world_matrix()
+        np.testing.assert_allclose(removed.get_world_position(), [3.0, 0.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
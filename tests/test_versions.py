@@ -0,0 +1,117 @@
+import unittest
+import numpy as np
+
+from mpl_graph.cameras.camera_orthographic import CameraOrthographic
+from mpl_graph.core import Texture
+from mpl_graph.geometry import Geometry, MeshGeometry
+from mpl_graph.materials import MeshBasicMaterial, SpriteMaterial
+from mpl_graph.objects import Mesh, Scene, Sprite
+from mpl_graph.renderers import Renderer
+from mpl_graph.renderers.renderer_mesh import RendererMesh
+
+
+class TestVersions(unittest.TestCase):
+    def test_geometry_version(self):
+        geometry = Geometry(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]], dtype=np.float32))
+        version = geometry.version
+        bounding_box = geometry.get_bounding_box()
+
+        # in place edits are seen only after mark_dirty()
+        geometry.vertices[1] = 2.0
+        self.assertIs(geometry.get_bounding_box(), bounding_box)
+        geometry.mark_dirty()
+        self.assertGreater(geometry.version, version)
+        np.testing.assert_allclose(geometry.get_bounding_box(), [[0.0, 0.0, 0.0], [2.0, 2.0, 2.0]])
+
+    def test_mesh_geometry_version(self):
+        vertices = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+        geometry = MeshGeometry(vertices, np.array([[0, 1, 2]]))
+        bvh = geometry.get_bvh()
+
+        for attribute_name, value in (("indices", np.array([[0, 2, 1]])), ("uvs", np.zeros((3, 2))), ("normals", np.zeros((3, 3)))):
+            version = geometry.version
+            setattr(geometry, attribute_name, value)
+            self.assertGreater(geometry.version, version, attribute_name)
+        self.assertIsNot(geometry.get_bvh(), bvh)
+
+    def test_material_and_texture_versions(self):
+        material = MeshBasicMaterial()
+        version = material.version
+        material.face_sorting = False
+        self.assertEqual(material.version, version + 1)
+        material.colors[0] = 1.0
+        material.mark_dirty()
+        self.assertEqual(material.version, version + 2)
+
+        texture = Texture(np.zeros((2, 2, 4), dtype=np.float32))
+        version = texture.version
+        texture.strip_alpha()
+        self.assertEqual(texture.version, version + 1)
+        texture.mark_dirty()
+        self.assertEqual(texture.version, version + 2)
+
+    def test_sprite_texture_uploaded_when_changed(self):
+        scene = Scene()
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        scene.add(camera)
+        texture = Texture(np.zeros((2, 2, 3), dtype=np.float32))
+        sprite = Sprite(SpriteMaterial(texture))
+        scene.add(sprite)
+
+        renderer = Renderer(64, 64)
+        renderer.render(scene, camera)
+        axes_image = renderer._artists[sprite.uuid]
+        data = axes_image.get_array()
+
+        renderer.render(scene, camera)
+        self.assertIs(axes_image.get_array(), data)
+
+        texture.data = np.ones((2, 2, 3), dtype=np.float32)
+        renderer.render(scene, camera)
+        np.testing.assert_allclose(axes_image.get_array(), 1.0)
+
+    def test_mesh_faces_computed_when_changed(self):
+        scene = Scene()
+        camera = CameraOrthographic()
+        camera.position[2] = 5.0
+        scene.add(camera)
+        vertices = np.array([[-0.5, -0.5, 0.0], [0.5, -0.5, 0.0], [0.0, 0.5, 0.0]], dtype=np.float32)
+        mesh = Mesh(MeshGeometry(vertices, np.array([[0, 1, 2]]), uvs=np.zeros((3, 2), dtype=np.float32)), MeshBasicMaterial())
+        scene.add(mesh)
+
+        computed_meshes: list[Mesh] = []
+        compute_original = RendererMesh.compute
+
+        def compute_spy(renderer, mesh, camera):
+            computed_meshes.append(mesh)
+            return compute_original(renderer, mesh, camera)
+
+        RendererMesh.compute = staticmethod(compute_spy)  # type: ignore
+        self.addCleanup(setattr, RendererMesh, "compute", staticmethod(compute_original))
+
+        renderer = Renderer(64, 64)
+        self.addCleanup(renderer.close)
+        renderer.render(scene, camera)
+        self.assertEqual(len(computed_meshes), 1)
+
+        # a full render of an unchanged mesh reuses its faces, and still updates its artist
+        changed_artists = renderer.render(scene, camera)
+        self.assertEqual(len(computed_meshes), 1)
+        self.assertEqual(changed_artists, [renderer._artists[mesh.uuid]])
+
+        # any version change computes them again
+        mesh.geometry.vertices[0, 0] = -0.8
+        mesh.geometry.mark_dirty()
+        renderer.render(scene, camera)
+        mesh.material.mark_dirty()
+        renderer.render(scene, camera)
+        mesh.position[0] = 0.1
+        renderer.render(scene, camera)
+        camera.position[0] = 0.1
+        renderer.render(scene, camera)
+        self.assertEqual(len(computed_meshes), 5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
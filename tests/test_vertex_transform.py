@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+from pyrr import matrix44
+
+from mpl_graph.geometry.geometry_utils import GeometryUtils
+
+
+class TestVertexTransform(unittest.TestCase):
+    def test_world_and_mvp_match_separate_transforms(self):
+        random_generator = np.random.default_rng(0)
+        vertices = random_generator.uniform(-1, 1, (100, 3)).astype(np.float32)
+        world_matrix = matrix44.multiply(matrix44.create_from_eulers([0.3, 0.2, 0.1], dtype=np.float32), matrix44.create_from_translation([1.0, 2.0, 3.0], dtype=np.float32))
+        mvp_matrix = world_matrix @ matrix44.create_perspective_projection(50.0, 1.0, 0.1, 100.0, dtype=np.float32)
+
+        out = np.empty((100, 7), dtype=np.float32)
+        vertices_world, vertices_clip = GeometryUtils.apply_world_and_mvp_matrices(vertices, world_matrix, mvp_matrix, out=out)
+
+        np.testing.assert_allclose(vertices_world, GeometryUtils.apply_transform(vertices, world_matrix), rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(vertices_clip, GeometryUtils.apply_mvp_matrix_homogeneous(vertices, mvp_matrix), rtol=1e-5, atol=1e-5)
+
+        # the results are views on the given buffer
+        self.assertIs(vertices_world.base, out)
+        self.assertIs(vertices_clip.base, out)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
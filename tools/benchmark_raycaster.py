@@ -0,0 +1,101 @@
+"""
+Benchmark the MeshBVH ray intersection against a brute-force numpy Möller-Trumbore over all the faces.
+
+It builds a height-field mesh, then casts the same random rays with both methods and checks they agree.
+"""
+
+# stdlib imports
+import time
+
+# pip imports
+import argparse
+import numpy as np
+
+# local imports
+from mpl_graph.geometry import MeshGeometry, MeshBVH
+
+
+# =============================================================================
+# Build the benchmark data
+# =============================================================================
+def build_height_field(face_count: int) -> MeshGeometry:
+    """Build a bumpy grid mesh in the xz plane, with about `face_count` faces."""
+    cell_count = max(1, int(np.sqrt(face_count / 2)))
+    grid_x, grid_z = np.meshgrid(np.linspace(-1, 1, cell_count + 1), np.linspace(-1, 1, cell_count + 1))
+    grid_y = 0.1 * np.sin(6 * grid_x) * np.cos(6 * grid_z)
+    vertices = np.stack([grid_x, grid_y, grid_z], axis=-1).reshape(-1, 3).astype(np.float32)
+
+    cells_index = (np.arange(cell_count)[:, np.newaxis] * (cell_count + 1) + np.arange(cell_count)).ravel()
+    indices = np.concatenate(
+        [
+            np.stack([cells_index, cells_index + cell_count + 1, cells_index + 1], axis=1),
+            np.stack([cells_index + 1, cells_index + cell_count + 1, cells_index + cell_count + 2], axis=1),
+        ]
+    )
+    return MeshGeometry(vertices, indices)
+
+
+def intersect_rays_brute_force(geometry: MeshGeometry, origins: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Intersect each ray with every face of the geometry. Return the hit face index (-1 if none) and distance of each ray."""
+    faces_vertices = geometry.vertices[geometry.indices]
+    face_count = len(faces_vertices)
+    faces_index = np.full(len(origins), -1, dtype=np.int64)
+    distances = np.full(len(origins), np.inf)
+    for ray_index in range(len(origins)):
+        ray_distances, _, _ = MeshBVH.intersect_triangles(
+            np.broadcast_to(origins[ray_index], (face_count, 3)),
+            np.broadcast_to(directions[ray_index], (face_count, 3)),
+            faces_vertices[:, 0],
+            faces_vertices[:, 1],
+            faces_vertices[:, 2],
+        )
+        closest_index = int(np.argmin(ray_distances))
+        if np.isfinite(ray_distances[closest_index]):
+            faces_index[ray_index] = closest_index
+            distances[ray_index] = ray_distances[closest_index]
+    return faces_index, distances
+
+
+# =============================================================================
+# Main script logic
+# =============================================================================
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the MeshBVH against brute-force ray/triangle intersection.")
+    parser.add_argument("--faces", type=int, default=500_000, help="Number of faces of the mesh.")
+    parser.add_argument("--rays", type=int, default=100, help="Number of rays to cast.")
+    args = parser.parse_args()
+
+    geometry = build_height_field(args.faces)
+    print(f"Mesh with {len(geometry.indices)} faces, casting {args.rays} rays")
+
+    # random rays from above the mesh, going down
+    random_generator = np.random.default_rng(0)
+    origins = np.column_stack([random_generator.uniform(-1, 1, args.rays), np.full(args.rays, 2.0), random_generator.uniform(-1, 1, args.rays)])
+    directions = np.column_stack([random_generator.normal(0, 0.2, args.rays), np.full(args.rays, -1.0), random_generator.normal(0, 0.2, args.rays)])
+
+    time_start = time.perf_counter()
+    bvh = geometry.get_bvh()
+    time_build = time.perf_counter() - time_start
+    print(f"BVH build: {time_build * 1000:.1f}ms")
+
+    time_start = time.perf_counter()
+    bvh_faces_index, bvh_distances, _ = bvh.intersect_rays(origins, directions)
+    time_bvh = time.perf_counter() - time_start
+    print(f"BVH query: {time_bvh * 1000:.1f}ms - {time_bvh / args.rays * 1e6:.1f}us per ray")
+
+    time_start = time.perf_counter()
+    brute_faces_index, brute_distances = intersect_rays_brute_force(geometry, origins, directions)
+    time_brute = time.perf_counter() - time_start
+    print(f"Brute force query: {time_brute * 1000:.1f}ms - {time_brute / args.rays * 1e6:.1f}us per ray")
+
+    print(f"Speedup: x{time_brute / time_bvh:.1f}")
+    assert np.array_equal(bvh_faces_index >= 0, brute_faces_index >= 0), "BVH and brute force disagree on which rays hit"
+    assert np.allclose(bvh_distances, brute_distances, rtol=1e-5), "BVH and brute force disagree on hit distances"
+
+
+# =============================================================================
+# Entry point
+# =============================================================================
+
+if __name__ == "__main__":
+    main()
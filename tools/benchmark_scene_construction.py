@@ -0,0 +1,63 @@
+"""
+Benchmark building and tearing down a large flat scene.
+
+It compares creating and adding the nodes one by one, with the bulk `Object3D.create_many()` + `.add_children()`.
+"""
+
+# stdlib imports
+import time
+
+# pip imports
+import argparse
+
+# local imports
+from mpl_graph.core import Object3D
+from mpl_graph.objects import Scene
+
+
+# =============================================================================
+# Main script logic
+# =============================================================================
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the construction of a scene with many nodes.")
+    parser.add_argument("--nodes", type=int, default=200_000, help="Number of nodes to add to the scene.")
+    args = parser.parse_args()
+
+    print(f"Scene with {args.nodes} nodes")
+
+    # one by one
+    scene = Scene()
+    time_start = time.perf_counter()
+    for _ in range(args.nodes):
+        scene.add(Object3D())
+    time_one_by_one = time.perf_counter() - time_start
+    print(f"Create and add one by one: {time_one_by_one * 1000:.1f}ms - {time_one_by_one / args.nodes * 1e6:.2f}us per node")
+
+    # bulk
+    scene = Scene()
+    time_start = time.perf_counter()
+    scene.add_children(Object3D.create_many(args.nodes))
+    time_bulk = time.perf_counter() - time_start
+    print(f"Create and add in bulk: {time_bulk * 1000:.1f}ms - {time_bulk / args.nodes * 1e6:.2f}us per node")
+
+    # first world matrix update
+    time_start = time.perf_counter()
+    scene.update_world_matrix()
+    time_update = time.perf_counter() - time_start
+    print(f"First update_world_matrix: {time_update * 1000:.1f}ms")
+
+    # remove all the children, one by one
+    children = scene.traverse()[1:]
+    time_start = time.perf_counter()
+    for child in children:
+        scene.remove(child)
+    time_remove = time.perf_counter() - time_start
+    print(f"Remove one by one: {time_remove * 1000:.1f}ms - {time_remove / args.nodes * 1e6:.2f}us per node")
+
+
+# =============================================================================
+# Entry point
+# =============================================================================
+
+if __name__ == "__main__":
+    main()